@@ -1,11 +1,13 @@
 import sys
 import os
-import random
 
 # Add the parent directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cell import Cell
+from algorithms.progress import DEFAULT_EVERY, check_every
+from algorithms.streams import RandomStream
+from algorithms.generation_state import GenerationState
 
 class AldousBroderMaze:
     """
@@ -33,7 +35,7 @@ class AldousBroderMaze:
     """
     
     @staticmethod
-    def on(grid, max_iterations=None, seed=None):
+    def on(grid, max_iterations=None, seed=None, state=None, progress=None, every=DEFAULT_EVERY):
         """
         Apply the Aldous-Broder algorithm to a grid to create a maze.
 
@@ -49,65 +51,123 @@ class AldousBroderMaze:
             grid: The Grid object to apply the algorithm to
             max_iterations: Optional maximum number of steps to perform
                             (useful for visualization or limiting computation)
-            seed: Optional random seed for reproducible maze generation
+            seed: Optional random seed for reproducible maze generation; the walk
+                  reads its own stream for the seed and never touches global state
+            state: Optional GenerationState to continue an earlier, budgeted run
+            progress: Optional callable progress(visited, total, iterations),
+                      called every `every` steps of the walk (see algorithms.progress)
+            every: Number of walk steps between progress reports
 
         Returns:
             The modified grid and the number of iterations performed
         """
-        # Set the random seed if provided
-        if seed is not None:
-            random.seed(seed)
-        # Initialize variables to track progress
-        cell_count = grid.rows * grid.cols
-        visited_count = 0
-        iterations = 0
-        visited = set()
-        
-        # Start at a random cell
-        current_row = grid.random_int(0, grid.rows - 1)
-        current_col = grid.random_int(0, grid.cols - 1)
-        current_cell = grid.at(current_row, current_col)
-        
-        # Mark the first cell as visited
-        visited.add((current_row, current_col))
-        visited_count += 1
-        
-        # Continue until all cells are visited or max iterations reached
-        while visited_count < cell_count and (max_iterations is None or iterations < max_iterations):
-            # Find all valid neighboring cells (regardless of whether they've been visited)
-            neighbors = []
-            
-            # Check each direction
-            for direction in [Cell.NORTH, Cell.EAST, Cell.SOUTH, Cell.WEST]:
-                offset_row, offset_col = grid.DIRECTION_OFFSETS[direction]
-                neighbor_row = current_row + offset_row
-                neighbor_col = current_col + offset_col
-                
-                if grid.is_valid(neighbor_row, neighbor_col):
-                    neighbors.append((neighbor_row, neighbor_col, direction))
-            
-            # Choose a random neighboring cell
-            if neighbors:
+        before = state.iterations if state is not None else 0
+        state = AldousBroderMaze.run(grid, max_iterations=max_iterations, seed=seed, state=state,
+                                     progress=progress, every=every)
+        return grid, state.iterations - before
+
+    @staticmethod
+    def run(grid=None, max_iterations=None, seed=None, state=None, progress=None, every=DEFAULT_EVERY):
+        """
+        Run (or continue) the random walk and return a resumable checkpoint.
+
+        A run stopped by max_iterations can be continued by passing the returned
+        state back in, in this process or another one. Continuing in slices gives
+        exactly the same maze as one uninterrupted run with the same seed.
+
+        Args:
+            grid: The Grid object to carve; may be None when resuming, in which
+                  case the grid is rebuilt from the state
+            max_iterations: Optional maximum number of steps for this call
+            seed: Optional random seed (ignored when resuming)
+            state: Optional GenerationState returned by an earlier call
+            progress: Optional progress callable, as for on()
+            every: Number of walk steps between progress reports
+
+        Returns:
+            A GenerationState; state.complete tells whether the maze is finished
+
+        Raises:
+            ValueError: If progress is set and every is less than 1
+        """
+        check_every(progress, every)
+        if state is None:
+            stream = RandomStream(seed)
+            cell_count = grid.rows * grid.cols
+            visited = bytearray(cell_count)
+            iterations = 0
+
+            # Start at a random cell and mark it as visited
+            current = stream.randrange(grid.rows) * grid.cols + stream.randrange(grid.cols)
+            visited[current] = 1
+            visited_count = 1
+        else:
+            if state.algorithm != 'aldous-broder':
+                raise ValueError(f"Cannot resume a {state.algorithm} state with Aldous-Broder")
+            if grid is None:
+                grid = state.restore_grid()
+            elif (grid.rows, grid.cols) != (state.rows, state.cols):
+                raise ValueError(f"State is for a {state.rows}x{state.cols} grid, not {grid.rows}x{grid.cols}")
+
+            stream = RandomStream(key=state.stream_key, position=state.stream_position)
+            cell_count = grid.rows * grid.cols
+            visited = state.visited_flags()
+            visited_count = state.visited_count
+            iterations = state.iterations
+            current = state.current[0] * grid.cols + state.current[1]
+
+        # Flat lookup tables: the cells and the (neighbor, direction) options of each cell
+        cells = [cell for row in grid.cells for cell in row]
+        options = grid.flat_neighbors()
+        opposites = Cell.OPPOSITES
+        random = stream.random
+        limit = iterations + max_iterations if max_iterations is not None else None
+
+        # Continue until all cells are visited or max iterations reached. With a
+        # progress callable the walk runs in slices of `every` steps; the slice
+        # bound replaces the iteration limit, so the inner loop is unchanged.
+        stuck = False
+        while visited_count < cell_count and (limit is None or iterations < limit) and not stuck:
+            stop = limit
+            if progress is not None:
+                stop = iterations + every if limit is None else min(limit, iterations + every)
+
+            while visited_count < cell_count and (stop is None or iterations < stop):
+                choices = options[current]
+                if not choices:
+                    # No neighbors (should never happen in a fully connected grid)
+                    stuck = True
+                    break
+
+                # Choose a random neighboring cell
                 iterations += 1
-                next_row, next_col, direction = neighbors[grid.random_int(0, len(neighbors) - 1)]
-                
-                # If the chosen neighbor has not been visited
-                if (next_row, next_col) not in visited:
-                    # Connect current cell to the neighbor
-                    grid.link_cells(current_row, current_col, direction)
-                    
-                    # Mark the neighbor as visited
-                    visited.add((next_row, next_col))
+                neighbor, direction = choices[int(random() * len(choices))]
+
+                # If the chosen neighbor has not been visited, connect it and mark it
+                if not visited[neighbor]:
+                    cells[current].link(direction)
+                    cells[neighbor].link(opposites[direction])
+                    visited[neighbor] = 1
                     visited_count += 1
-                
+
                 # Move to the chosen neighbor
-                current_row, current_col = next_row, next_col
-                current_cell = grid.at(current_row, current_col)
-            else:
-                # No neighbors (should never happen in a fully connected grid)
-                break
-        
-        return grid, iterations
+                current = neighbor
+
+            if progress is not None:
+                progress(visited_count, cell_count, iterations)
+
+        return GenerationState(
+            algorithm='aldous-broder',
+            rows=grid.rows,
+            cols=grid.cols,
+            stream_key=stream.key,
+            stream_position=stream.position,
+            current=divmod(current, grid.cols),
+            visited=GenerationState.pack_visited(visited),
+            visited_count=visited_count,
+            iterations=iterations,
+            links=grid.to_links().tobytes()
+        )
     
     @staticmethod
     def explain():
@@ -0,0 +1,89 @@
+"""
+Batch maze generation.
+
+This module generates many mazes of the same size in a single call and returns
+them as one stacked array of link flags. Algorithms registered as vectorized
+(Binary Tree, Sidewinder) are carved for the whole batch at once with array
+operations; the others are spread across a process pool so that the per-maze
+setup cost is paid once per worker rather than once per maze.
+"""
+
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid import Grid
+from algorithms.registry import GeneratorRegistry
+
+
+def _generate_links(task):
+    """Generate a single maze and return its links (runs inside a worker process)."""
+    algorithm, rows, cols, seed = task
+    return GeneratorRegistry.generate(algorithm, Grid(rows, cols), seed=seed).to_links()
+
+
+def generate_batch(algorithm, rows, cols, seeds, workers=None, cache=None):
+    """
+    Generate one maze per seed and return them stacked in a single array.
+
+    Args:
+        algorithm: Name of a registered algorithm (see GeneratorRegistry)
+        rows: Number of rows in every maze
+        cols: Number of columns in every maze
+        seeds: Sequence of integer seeds, one per maze
+        workers: Number of worker processes for algorithms that cannot be
+                 vectorized (defaults to the CPU count; 1 runs in-process)
+        cache: Optional MazeCache; mazes of non-vectorized algorithms found in it
+               are reused, and newly generated ones are stored in it
+
+    Returns:
+        A uint8 array of shape (len(seeds), rows, cols) holding Cell link flags.
+        Entry i is identical to running the algorithm's on(grid, seed=seeds[i]);
+        use Grid.from_links(batch[i]) to turn it back into a Grid.
+
+    Raises:
+        ValueError: If the algorithm name is not recognized
+    """
+    spec = GeneratorRegistry.get(algorithm)
+    seeds = list(seeds)
+
+    if spec.vectorized:
+        if not seeds:
+            return np.zeros((0, rows, cols), dtype=np.uint8)
+        return spec.load().batch(seeds, rows, cols)
+
+    batch = np.zeros((len(seeds), rows, cols), dtype=np.uint8)
+    pending = list(range(len(seeds)))
+
+    if cache is not None:
+        pending = []
+        for i, seed in enumerate(seeds):
+            links = cache.get_links(spec.name, rows, cols, seed)
+            if links is None:
+                pending.append(i)
+            else:
+                batch[i] = links
+
+    tasks = [(spec.name, rows, cols, seeds[i]) for i in pending]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(tasks) <= 1:
+        results = [_generate_links(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_generate_links, tasks, chunksize=chunksize))
+
+    for i, links in zip(pending, results):
+        batch[i] = links
+        if cache is not None:
+            cache.put_links(spec.name, links, seeds[i])
+
+    return batch
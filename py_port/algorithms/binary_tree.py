@@ -1,10 +1,18 @@
 import sys
 import os
 
+import numpy as np
+
 # Add the parent directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cell import Cell
+from grid import Grid
+from algorithms.progress import DEFAULT_EVERY, check_every, commit_links
+from algorithms.streams import WORLD_SIZE, check_window, coordinate_counters, stream_key, stream_keys, uniform
+
+# Stream of the coordinate-hashed (random access) variant
+_COORDINATE_STREAM = 1
 
 class BinaryTreeMaze:
     """
@@ -30,7 +38,7 @@ class BinaryTreeMaze:
     """
     
     @staticmethod
-    def on(grid):
+    def on(grid, seed=None, progress=None, every=DEFAULT_EVERY):
         """
         Apply the Binary Tree algorithm to a grid to create a maze.
 
@@ -43,7 +51,19 @@ class BinaryTreeMaze:
 
         Args:
             grid: The Grid object to apply the algorithm to
+            seed: Optional seed; when given, choices come from the deterministic
+                  stream for that seed and the maze is carved in one vectorized pass
+            progress: Optional callable progress(visited, total, iterations),
+                      called about every `every` cells (see algorithms.progress)
+            every: Number of cells between progress reports
         """
+        if seed is not None:
+            north = BinaryTreeMaze.draws(seed, grid.rows, grid.cols)
+            return commit_links(grid, BinaryTreeMaze.link_array(north), progress, every)
+
+        total = grid.rows * grid.cols
+        check_every(progress, every)
+        report_at = every
         for r in range(grid.rows):
             for c in range(grid.cols):
                 neighbors = []
@@ -61,8 +81,137 @@ class BinaryTreeMaze:
                     direction = neighbors[grid.random_int(0, len(neighbors) - 1)]
                     grid.link_cells(r, c, direction)
 
+            if progress is not None and ((r + 1) * grid.cols >= report_at or r == grid.rows - 1):
+                report_at = (r + 1) * grid.cols + every
+                progress((r + 1) * grid.cols, total, (r + 1) * grid.cols)
+
         return grid
 
+    @staticmethod
+    def draws(seed, rows, cols, row_start=0, row_stop=None):
+        """
+        Get the random north/east choices of a seeded maze.
+
+        Cell (r, c) always uses counter r * cols + c of the seed's stream, so any
+        band of rows can be computed independently (in another thread or process)
+        and the bands stacked to get exactly the serial result.
+
+        Args:
+            seed: The maze seed, or a sequence of seeds to draw a whole batch
+            rows: Number of rows in the maze
+            cols: Number of columns in the maze
+            row_start: First row to compute
+            row_stop: Row to stop before (defaults to rows)
+
+        Returns:
+            A boolean array of shape (..., row_stop - row_start, cols), with one
+            leading axis per seed dimension; True means north
+        """
+        row_stop = rows if row_stop is None else row_stop
+        counters = np.arange(row_start * cols, row_stop * cols, dtype=np.uint64)
+        north = uniform(stream_keys(seed), counters) < 0.5
+        return north.reshape(np.shape(seed) + (row_stop - row_start, cols))
+
+    @staticmethod
+    def batch(seeds, rows, cols):
+        """Carve one seeded maze per seed and return the stacked link flags."""
+        return BinaryTreeMaze.link_array(BinaryTreeMaze.draws(seeds, rows, cols))
+
+    @staticmethod
+    def link_array(north):
+        """
+        Build Binary Tree link flags for one or more mazes at once.
+
+        Every cell's choice is independent, so the whole maze can be carved with
+        array operations. The edge rules are applied here, so callers only supply
+        the raw random choices.
+
+        Args:
+            north: Boolean array of shape (..., rows, cols); True where a cell
+                   should carve north when both directions are possible
+
+        Returns:
+            A uint8 array of the same shape holding Cell link flags
+        """
+        north = np.array(north, dtype=bool)
+        north[..., 0, :] = False   # The northern edge can only carve east
+        north[..., 1:, -1] = True  # The eastern edge can only carve north
+        east = ~north
+        east[..., -1] = False      # Nothing lies east of the eastern edge
+
+        links = np.zeros(north.shape, dtype=np.uint8)
+        links[north] |= Cell.NORTH
+        links[..., :-1, :][north[..., 1:, :]] |= Cell.SOUTH
+        links[east] |= Cell.EAST
+        links[..., :, 1:][east[..., :, :-1]] |= Cell.WEST
+        return links
+
+    @staticmethod
+    def coordinate_draws(seed, rows, cols):
+        """
+        Get the raw north/east choices of cells of a coordinate-hashed maze.
+
+        Each choice is a pure function of (seed, row, col), independent of the
+        size of the maze and of every other cell.
+
+        Args:
+            seed: The maze seed
+            rows: Row coordinates, broadcast against cols
+            cols: Column coordinates
+
+        Returns:
+            A boolean array; True means north
+        """
+        key = stream_key(seed, _COORDINATE_STREAM)
+        return uniform(key, coordinate_counters(rows, cols)) < 0.5
+
+    @staticmethod
+    def region(seed, row_start, col_start, rows, cols,
+               world_rows=WORLD_SIZE, world_cols=WORLD_SIZE, clip=False):
+        """
+        Compute any window of a coordinate-hashed Binary Tree maze.
+
+        The world is a world_rows x world_cols Binary Tree maze whose choices
+        come from coordinate_draws, so a window costs O(rows * cols) time and
+        memory wherever it is, with no generation pass and nothing stored.
+        Overlapping windows always agree.
+
+        Args:
+            seed: The world seed
+            row_start: World row of the window's top edge
+            col_start: World column of the window's left edge
+            rows: Window height
+            cols: Window width
+            world_rows: Height of the world (at most WORLD_SIZE)
+            world_cols: Width of the world (at most WORLD_SIZE)
+            clip: Drop links that leave the window, so the result can be used
+                  as a standalone grid
+
+        Returns:
+            A (rows, cols) uint8 array of Cell link flags
+
+        Raises:
+            ValueError: If the window does not fit in the world
+        """
+        check_window(row_start, col_start, rows, cols, world_rows, world_cols)
+
+        # One extra row below (for south links) and column to the west (for west links)
+        r = np.arange(row_start, row_start + rows + 1, dtype=np.int64)[:, None]
+        c = np.arange(col_start - 1, col_start + cols, dtype=np.int64)[None, :]
+        inside = (r < world_rows) & (c >= 0)
+        draws = BinaryTreeMaze.coordinate_draws(seed, np.minimum(r, world_rows - 1), np.maximum(c, 0))
+
+        # The same edge rules as link_array
+        north = inside & (r > 0) & (draws | (c == world_cols - 1))
+        east = inside & ~north & (c < world_cols - 1)
+
+        links = np.zeros((rows, cols), dtype=np.uint8)
+        links[north[:-1, 1:]] |= Cell.NORTH
+        links[north[1:, 1:]] |= Cell.SOUTH
+        links[east[:-1, 1:]] |= Cell.EAST
+        links[east[:-1, :-1]] |= Cell.WEST
+        return Grid.clip_links(links) if clip else links
+
     @staticmethod
     def explain():
         """
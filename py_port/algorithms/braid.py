@@ -0,0 +1,121 @@
+"""
+Braiding: turning perfect mazes into mazes with loops.
+
+A braid maze has few or no dead ends. Starting from any maze, each dead end
+(a cell with exactly one link) is chosen with probability p and linked to one
+of its other neighbors, preferring a neighbor that is itself a dead end so that
+one new passage removes two dead ends at once. The result has multiple routes
+between cells, which is useful for gameplay and for exercising solvers on
+graphs that are not trees.
+
+The whole pass works on link arrays: dead ends are found with a popcount
+lookup, every choice is drawn from the seed's counter-based stream at once, and
+the new links are written with one array operation per direction.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from grid import Grid
+from algorithms.streams import RandomStream, hash64, uniform
+
+# Braiding reads its own substream so that braiding a maze carved with the same
+# seed does not reuse the generator's draws
+_STREAM_ID = 1
+
+def dead_ends(links):
+    """
+    Find the dead ends of a maze.
+
+    Args:
+        links: A (rows, cols) array of Cell link flags
+
+    Returns:
+        A boolean (rows, cols) array that is True where a cell has exactly one link
+    """
+    links = np.asarray(links) & 0xF
+    # A popcount of one means exactly one bit set: non-zero and a power of two
+    return (links != 0) & ((links & (links - 1)) == 0)
+
+
+def braid_links(links, p=1.0, seed=None):
+    """
+    Braid a maze given as a link array.
+
+    Args:
+        links: A (rows, cols) array of Cell link flags (not modified)
+        p: Probability that each dead end is removed (1.0 removes all of them)
+        seed: Optional random seed for reproducible braiding
+
+    Returns:
+        A new (rows, cols) uint8 array of Cell link flags
+    """
+    links = np.asarray(links, dtype=np.uint8)
+    rows, cols = links.shape
+    flat = links.reshape(-1)
+    cell_count = flat.size
+    key = RandomStream(seed, stream_id=_STREAM_ID).key
+
+    dead_mask = dead_ends(flat)
+    dead = np.flatnonzero(dead_mask)
+    # Draw `index` of the stream decides whether a dead end is braided, and the
+    # four 16-bit lanes of draw `cell_count + index` rank its neighbors
+    if p < 1.0:
+        dead = dead[uniform(key, dead) < p]
+
+    result = flat.copy()
+    if not len(dead):
+        return result.reshape(rows, cols)
+
+    col = dead % cols
+    dead_links = flat[dead]
+    lanes = hash64(key, cell_count + dead.astype(np.uint64))
+    directions = Grid.NEIGHBOR_DIRECTIONS
+    offsets = (-cols, cols, 1, -1)
+    in_grid = (dead >= cols, dead < cell_count - cols, col < cols - 1, col > 0)
+
+    # Dead-end flags padded by a row on both sides so neighbors can be looked up
+    # without bounds checks; wrapped east/west lookups are masked out below
+    padded = np.zeros(cell_count + 2 * cols, dtype=np.int32)
+    padded[cols:cols + cell_count] = dead_mask
+    shifted = dead + cols
+
+    # Scores pack (neighbor is a dead end, random lane, direction index) so a
+    # running maximum both ranks the neighbors and records the winner; closed
+    # sides score -1 and never win
+    best = np.full(len(dead), -1, dtype=np.int32)
+    for k, (direction, offset) in enumerate(zip(directions, offsets)):
+        open_side = in_grid[k] & ((dead_links & direction) == 0)
+        lane = ((lanes >> np.uint64(16 * k)) & np.uint64(0xFFFF)).astype(np.int32)
+        score = (((padded[shifted + offset] << 16) | lane) << 2) | k
+        best = np.maximum(best, (score + 1) * open_side - 1)
+
+    choice = np.where(best >= 0, best & 3, 4)
+    for k, (direction, offset) in enumerate(zip(directions, offsets)):
+        cells = dead[choice == k]
+        result[cells] |= direction
+        result[cells + offset] |= Cell.OPPOSITES[direction]
+
+    return result.reshape(rows, cols)
+
+
+def braid(grid, p=1.0, seed=None):
+    """
+    Remove dead ends from a maze by adding loops.
+
+    Args:
+        grid: The Grid object to braid
+        p: Probability that each dead end is removed (1.0 removes all of them)
+        seed: Optional random seed for reproducible braiding
+
+    Returns:
+        The modified grid
+    """
+    grid.apply_links(braid_links(grid.to_links(), p, seed))
+    return grid
@@ -0,0 +1,288 @@
+"""
+Two-tier cache of generated mazes.
+
+Seeded generation is deterministic, so a maze is fully identified by
+(algorithm, algorithm version, rows, cols, seed, options). MazeCache keeps
+recently used mazes in memory as ready Grid objects (or link arrays, when they
+were stored by batch jobs), bounded by an estimate of their size in bytes, and
+can also keep them on disk as packed link arrays (two cells per byte) in a
+directory bounded by total file size.
+
+The algorithm version (GeneratorSpec.version) is part of the key, so bumping it
+when a generator's output changes invalidates stale entries in both tiers.
+Unseeded requests are never cached.
+"""
+
+import sys
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid import Grid
+from algorithms.registry import GeneratorRegistry
+
+# Approximate memory held by one Cell object (instance plus attribute dict)
+CELL_BYTES = 112
+
+# Disk entries start with the maze dimensions
+_HEADER = np.dtype('<u4')
+
+
+def pack_links(links):
+    """Pack a (rows, cols) link array into bytes, two 4-bit cells per byte."""
+    flat = np.asarray(links, dtype=np.uint8).reshape(-1)
+    if flat.size % 2:
+        flat = np.append(flat, np.uint8(0))
+    header = np.array(np.shape(links), dtype=_HEADER).tobytes()
+    return header + ((flat[0::2] << 4) | (flat[1::2] & 0xF)).astype(np.uint8).tobytes()
+
+
+def unpack_links(data):
+    """Inverse of pack_links."""
+    rows, cols = np.frombuffer(data, dtype=_HEADER, count=2)
+    packed = np.frombuffer(data, dtype=np.uint8, offset=2 * _HEADER.itemsize)
+    flat = np.empty(packed.size * 2, dtype=np.uint8)
+    flat[0::2] = packed >> 4
+    flat[1::2] = packed & 0xF
+    return flat[:rows * cols].reshape(int(rows), int(cols))
+
+
+class MazeCache:
+    """
+    Cache of generated mazes with an in-memory LRU tier and an optional disk tier.
+
+    Grids returned by the cache are shared between hits; treat them as read-only
+    and copy one (Grid.from_links(grid.to_links())) before modifying it.
+
+    Example:
+        cache = MazeCache(disk_dir='~/.cache/mazes')
+        grid = cache.generate('prims', 30, 30, seed=42)
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, disk_dir=None, max_disk_bytes=256 * 1024 * 1024):
+        """
+        Create a cache.
+
+        Args:
+            max_bytes: Bound on the estimated memory held by cached grids
+            disk_dir: Optional directory for the on-disk tier (created if needed)
+            max_disk_bytes: Bound on the total size of the disk tier's files
+        """
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = os.path.expanduser(disk_dir) if disk_dir else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @staticmethod
+    def key(algorithm, rows, cols, seed, **options):
+        """
+        Build the cache key of a maze.
+
+        Returns:
+            A hashable tuple, or None if the request cannot be cached (no seed)
+        """
+        if seed is None:
+            return None
+        spec = GeneratorRegistry.get(algorithm)
+        return (spec.name, spec.version, rows, cols, int(seed), tuple(sorted(options.items())))
+
+    @staticmethod
+    def entry_bytes(entry):
+        """Estimate the memory held by a cached Grid or link array."""
+        if isinstance(entry, np.ndarray):
+            return entry.nbytes
+        return entry.rows * entry.cols * CELL_BYTES
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size_bytes(self):
+        """Estimated memory held by the in-memory tier."""
+        return self._bytes
+
+    def get(self, algorithm, rows, cols, seed, **options):
+        """
+        Look a maze up in both tiers.
+
+        Returns:
+            The cached Grid, or None on a miss
+        """
+        key = self.key(algorithm, rows, cols, seed, **options)
+        if key is None:
+            return None
+
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        if isinstance(entry, Grid):
+            return entry
+
+        # Entries stored as arrays are turned into grids once, on first use
+        grid = Grid.from_links(entry)
+        self._remember(key, grid)
+        return grid
+
+    def get_links(self, algorithm, rows, cols, seed, **options):
+        """
+        Look a maze up in both tiers and return its link array.
+
+        This skips building a Grid, so it is the cheaper call for batch jobs.
+
+        Returns:
+            A (rows, cols) uint8 array of Cell link flags, or None on a miss
+        """
+        key = self.key(algorithm, rows, cols, seed, **options)
+        if key is None:
+            return None
+
+        entry = self._lookup(key)
+        if isinstance(entry, Grid):
+            return entry.to_links()
+        return entry
+
+    def put(self, algorithm, grid, seed, **options):
+        """Store a generated Grid in both tiers (ignored if seed is None)."""
+        key = self.key(algorithm, grid.rows, grid.cols, seed, **options)
+        if key is None:
+            return
+        self._remember(key, grid)
+        self._write_disk(key, grid.to_links())
+
+    def put_links(self, algorithm, links, seed, **options):
+        """Store a generated maze given as a link array (ignored if seed is None)."""
+        rows, cols = np.shape(links)
+        key = self.key(algorithm, rows, cols, seed, **options)
+        if key is None:
+            return
+        self._remember(key, np.array(links, dtype=np.uint8))
+        self._write_disk(key, links)
+
+    def generate(self, algorithm, rows, cols, seed=None, progress=None, every=None, **options):
+        """
+        Get a maze from the cache, generating and storing it on a miss.
+
+        Args:
+            algorithm: Generator name or alias
+            rows: Number of rows
+            cols: Number of columns
+            seed: The maze seed; unseeded mazes are generated fresh every time
+            progress: Optional progress callable, used only when generating
+            every: Units of work between progress reports
+            **options: Generator-specific options (part of the key)
+
+        Returns:
+            A Grid
+        """
+        grid = self.get(algorithm, rows, cols, seed, **options)
+        if grid is not None:
+            return grid
+
+        grid = GeneratorRegistry.generate(algorithm, Grid(rows, cols), seed=seed,
+                                          progress=progress, every=every, **options)
+        self.put(algorithm, grid, seed, **options)
+        return grid
+
+    def _lookup(self, key):
+        """Find an entry in memory, then on disk (promoting it to memory)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        links = self._read_disk(key)
+        if links is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._remember(key, links)
+        return links
+
+    def clear(self, disk=False):
+        """Empty the in-memory tier, and the disk tier too if disk is True."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if disk and self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.maze'):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def _remember(self, key, entry):
+        """Insert into (or replace in) the in-memory tier and evict least recently used entries."""
+        size = self.entry_bytes(entry)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self.entry_bytes(previous)
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self.entry_bytes(evicted)
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.maze")
+
+    def _read_disk(self, key):
+        """Read a maze from the disk tier, or return None."""
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            return None
+        return unpack_links(data)
+
+    def _write_disk(self, key, links):
+        """Write a maze to the disk tier and keep the directory within its bound."""
+        if not self.disk_dir:
+            return
+        data = pack_links(links)
+        if len(data) > self.max_disk_bytes:
+            return
+
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, path)
+
+        entries = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.name.endswith('.maze'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, old_path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            if old_path == path:
+                continue
+            try:
+                os.remove(old_path)
+                total -= size
+            except OSError:
+                pass
@@ -0,0 +1,79 @@
+"""
+Serializable checkpoints for long-running maze generation.
+
+A GenerationState captures everything needed to continue a generator that
+stopped early: the position of its random stream, the cell it was working on,
+a packed bitmap of visited cells and the links carved so far. States pickle
+cleanly, so a long generation can be time-sliced (for example across web
+requests) and resumed later, or in another process.
+"""
+
+import sys
+import os
+import pickle
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid import Grid
+
+
+@dataclass
+class GenerationState:
+    """Checkpoint of a partially generated maze."""
+    algorithm: str
+    rows: int
+    cols: int
+    stream_key: int
+    stream_position: int
+    current: Tuple[int, int]
+    visited: bytes
+    visited_count: int
+    iterations: int
+    links: bytes
+
+    @property
+    def complete(self) -> bool:
+        """True once every cell has been visited."""
+        return self.visited_count >= self.rows * self.cols
+
+    @staticmethod
+    def pack_visited(visited) -> bytes:
+        """Pack a flat sequence of 0/1 visited flags into a bitmap."""
+        return np.packbits(np.frombuffer(bytes(visited), dtype=np.uint8)).tobytes()
+
+    def visited_flags(self) -> bytearray:
+        """Unpack the visited bitmap into one 0/1 byte per cell (flat order)."""
+        bits = np.unpackbits(np.frombuffer(self.visited, dtype=np.uint8))
+        return bytearray(bits[:self.rows * self.cols].tobytes())
+
+    def visited_mask(self) -> np.ndarray:
+        """Get the visited cells as a (rows, cols) boolean array."""
+        flags = np.frombuffer(bytes(self.visited_flags()), dtype=np.uint8)
+        return flags.reshape(self.rows, self.cols).astype(bool)
+
+    def link_array(self) -> np.ndarray:
+        """Get the links carved so far as a (rows, cols) uint8 array."""
+        return np.frombuffer(self.links, dtype=np.uint8).reshape(self.rows, self.cols).copy()
+
+    def restore_grid(self) -> Grid:
+        """Rebuild the partially carved grid this state was taken from."""
+        return Grid.from_links(self.link_array())
+
+    def save(self, filename):
+        """Save the state to a file."""
+        with open(filename, 'wb') as f:
+            pickle.dump(self, f)
+
+    @classmethod
+    def load(cls, filename):
+        """Load a state previously written with save()."""
+        with open(filename, 'rb') as f:
+            state = pickle.load(f)
+        if not isinstance(state, cls):
+            raise ValueError(f"{filename} does not contain a {cls.__name__}")
+        return state
@@ -0,0 +1,256 @@
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from algorithms.progress import DEFAULT_EVERY, check_every
+from algorithms.streams import RandomStream
+
+# Maximum number of active cells per block of the active list
+BLOCK_SIZE = 4096
+
+
+def _newest(count, random):
+    """Always continue from the most recently added cell (recursive backtracker)."""
+    return count - 1
+
+
+def _oldest(count, random):
+    """Always continue from the least recently added cell."""
+    return 0
+
+
+def _random(count, random):
+    """Continue from any active cell (simplified Prim's)."""
+    return int(random() * count)
+
+
+class GrowingTreeMaze:
+    """
+    Growing Tree maze generation algorithm implementation.
+
+    Growing Tree keeps a list of active cells and repeatedly extends the maze
+    from one of them. Which cell it picks is a pluggable policy, and the policy
+    alone decides the texture of the maze:
+
+    - newest: behaves like the recursive backtracker (long, winding corridors)
+    - random: behaves like simplified Prim's (radial, many short dead ends)
+    - oldest: long straight corridors radiating from the start
+    - mixed: picks newest with probability `mix`, otherwise random
+
+    A policy is a function policy(count, random) that returns a position in
+    [0, count) within the active list, where 0 is the oldest cell and count - 1
+    the newest; `random` returns floats in [0, 1).
+
+    Characteristics of Growing Tree mazes:
+    - Creates perfect mazes (exactly one path between any two cells)
+    - One engine reproduces the textures of several other algorithms
+    - Blends between textures with the mixed policy
+
+    Time complexity: O(n) for the newest and oldest policies, O(n log n) for
+                     policies that pick cells from the middle of the list
+                     (random, mixed)
+    Space complexity: O(n) for the active list and visited flags
+    """
+
+    POLICIES = {
+        'newest': _newest,
+        'random': _random,
+        'oldest': _oldest,
+    }
+
+    @staticmethod
+    def policy(name='newest', mix=0.5):
+        """
+        Build a selection policy by name.
+
+        Args:
+            name: 'newest', 'random', 'oldest' or 'mixed'
+            mix: For 'mixed', the probability of choosing the newest cell
+
+        Returns:
+            A policy function
+
+        Raises:
+            ValueError: If the policy name is not recognized
+        """
+        if name == 'mixed':
+            def _mixed(count, random):
+                if random() < mix:
+                    return count - 1
+                return int(random() * count)
+            return _mixed
+
+        if name not in GrowingTreeMaze.POLICIES:
+            available = ', '.join(list(GrowingTreeMaze.POLICIES) + ['mixed'])
+            raise ValueError(f"Unknown policy: {name}. Available policies: {available}")
+        return GrowingTreeMaze.POLICIES[name]
+
+    @staticmethod
+    def on(grid, seed=None, policy='newest', mix=0.5, progress=None, every=DEFAULT_EVERY):
+        """
+        Apply the Growing Tree algorithm to a grid to create a maze.
+
+        The algorithm works like this:
+        1. Mark a random cell as visited and add it to the active list
+        2. Use the policy to select a cell from the active list
+        3. If it has unvisited neighbors, link it to a random one of them and
+           append that neighbor to the active list
+        4. Otherwise remove the cell from the active list
+        5. Repeat until the active list is empty
+
+        Args:
+            grid: The Grid object to apply the algorithm to
+            seed: Optional random seed for reproducible maze generation
+            policy: Policy name ('newest', 'random', 'oldest', 'mixed') or a
+                    policy function
+            mix: For the 'mixed' policy, the probability of choosing the newest cell
+            progress: Optional callable progress(visited, total, iterations),
+                      called every `every` carved cells (see algorithms.progress)
+            every: Number of carved cells between progress reports
+
+        Returns:
+            The modified grid
+        """
+        cell_count = grid.rows * grid.cols
+        if cell_count == 0:
+            return grid
+
+        select = policy if callable(policy) else GrowingTreeMaze.policy(policy, mix)
+        stream = RandomStream(seed)
+        random = stream.random
+        neighbors = grid.flat_neighbors()
+        opposites = Cell.OPPOSITES
+        visited = bytearray(cell_count)
+        links = [0] * cell_count
+
+        start = stream.randrange(cell_count)
+        visited[start] = 1
+
+        # Active cells, oldest first, are split into sealed blocks of at most
+        # BLOCK_SIZE cells followed by the tail block that new cells are appended
+        # to. A Fenwick tree over the sizes of the sealed blocks finds the block
+        # holding any rank in O(log n), and removing a cell only shifts the rest
+        # of its block. first is the first non-empty sealed block.
+        tail = [start]
+        blocks = []
+        capacity = cell_count // BLOCK_SIZE + 1
+        tree = [0] * (capacity + 1)
+        sealed = 0
+        first = 0
+        count = 1
+
+        # Progress is checked only when a cell is carved; iterations are carves
+        # plus retirements, i.e. 2 * visited - 1 - active cells
+        visited_count = 1
+        check_every(progress, every)
+        report_at = every if progress is not None else cell_count + 1
+
+        while count:
+            rank = select(count, random)
+            if rank >= sealed:
+                block, offset = tail, rank - sealed
+            elif rank < len(blocks[first]):
+                index, block, offset = first, blocks[first], rank
+            else:
+                # Descend the Fenwick tree to the block holding active cell number rank + 1
+                index, offset, bit = 0, rank, 1 << (len(blocks).bit_length() - 1)
+                while bit:
+                    probe = index + bit
+                    if probe <= len(blocks) and tree[probe] <= offset:
+                        index = probe
+                        offset -= tree[probe]
+                    bit >>= 1
+                block = blocks[index]
+            current = block[offset]
+            available = [option for option in neighbors[current] if not visited[option[0]]]
+
+            if available:
+                neighbor, direction = available[int(random() * len(available))]
+                links[current] |= direction
+                links[neighbor] |= opposites[direction]
+                visited[neighbor] = 1
+                if len(tail) >= BLOCK_SIZE:
+                    # Seal the full tail block (possibly a reopened one) before appending
+                    if not sealed:
+                        first = len(blocks)
+                    position = len(blocks) + 1
+                    while position <= capacity:
+                        tree[position] += len(tail)
+                        position += position & -position
+                    blocks.append(tail)
+                    sealed += len(tail)
+                    tail = []
+                tail.append(neighbor)
+                count += 1
+                visited_count += 1
+                if visited_count >= report_at:
+                    report_at += every
+                    progress(visited_count, cell_count, 2 * visited_count - 1 - count)
+                continue
+
+            # Retire the cell without disturbing the age order of the others
+            del block[offset]
+            count -= 1
+            if block is tail:
+                if not tail and sealed:
+                    # Reopen the newest non-empty sealed block as the tail
+                    while not blocks[-1]:
+                        blocks.pop()
+                    tail = blocks.pop()
+                    position = len(blocks) + 1
+                    while position <= capacity:
+                        tree[position] -= len(tail)
+                        position += position & -position
+                    sealed -= len(tail)
+                continue
+            sealed -= 1
+            position = index + 1
+            while position <= capacity:
+                tree[position] -= 1
+                position += position & -position
+            while sealed and not blocks[first]:
+                first += 1
+
+        grid.add_links(np.array(links, dtype=np.uint8).reshape(grid.rows, grid.cols))
+        if progress is not None:
+            progress(cell_count, cell_count, 2 * cell_count - 1)
+        return grid
+
+    @staticmethod
+    def explain():
+        """
+        Returns a detailed explanation of the Growing Tree algorithm for educational purposes.
+        """
+        explanation = """
+        THE GROWING TREE ALGORITHM EXPLAINED
+
+        Growing Tree is a family of algorithms that differ only in how they pick
+        the next cell to grow from.
+
+        1. INITIALIZATION:
+           - Start with a grid of cells with no connections
+           - Choose a random cell, mark it visited and add it to the active list
+
+        2. GROWING THE MAZE:
+           - Select a cell from the active list using the policy
+           - If it has unvisited neighbors, carve into a random one and add the
+             neighbor to the active list
+           - If it has none, remove it from the active list
+           - Repeat until the active list is empty
+
+        3. SELECTION POLICIES:
+           - newest: long winding passages, like the recursive backtracker
+           - random: radial texture with short dead ends, like Prim's
+           - oldest: long corridors radiating from the start
+           - mixed: newest some of the time, random otherwise
+
+        4. FEATURES AND PATTERNS:
+           - Creates perfect mazes (exactly one path between any two points)
+           - A single implementation covers several classic maze styles
+        """
+        return explanation
@@ -0,0 +1,184 @@
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from algorithms.progress import DEFAULT_EVERY, check_every
+from algorithms.streams import RandomStream
+
+
+class HuntAndKillMaze:
+    """
+    Hunt-and-Kill maze generation algorithm implementation.
+
+    Hunt-and-Kill alternates between two phases. In the "kill" phase it performs
+    a random walk that only steps into unvisited cells, carving as it goes. When
+    the walk gets stuck it "hunts": it scans the grid for the first unvisited
+    cell that touches the visited part of the maze, links the two, and starts a
+    new walk from there.
+
+    The kill walk runs in Python over a bytearray of visited flags. The hunt
+    reads the same memory as a NumPy array: candidate cells of a row are its
+    unvisited cells ANDed with the row's visited array shifted in each direction,
+    and a pointer to the first row that still has unvisited cells means rows
+    that are already finished are never scanned again. Unfinished rows with no
+    candidate are still scanned on every hunt that passes them.
+
+    Characteristics of Hunt-and-Kill mazes:
+    - Long, winding passages ("rivers") and relatively few dead ends
+    - Creates perfect mazes (exactly one path between any two cells)
+    - Similar texture to the recursive backtracker without needing a stack
+
+    Time complexity: O(n) for the walks plus O(cols) per row scanned by a hunt,
+                     from the first unfinished row down to the row where it
+                     finds a candidate (O(rows * cols) per hunt in the worst case)
+    Space complexity: O(n) for the visited flags and links
+    """
+
+    @staticmethod
+    def on(grid, seed=None, progress=None, every=DEFAULT_EVERY):
+        """
+        Apply the Hunt-and-Kill algorithm to a grid to create a maze.
+
+        The algorithm works like this:
+        1. Start at a random cell and mark it visited
+        2. Kill: walk to random unvisited neighbors, linking each step, until
+           the current cell has no unvisited neighbors
+        3. Hunt: find the first unvisited cell (in row-major order) that has a
+           visited neighbor, link it to a random visited neighbor, and continue
+           the walk from it
+        4. Stop when the hunt finds no unvisited cells
+
+        Args:
+            grid: The Grid object to apply the algorithm to
+            seed: Optional random seed for reproducible maze generation
+            progress: Optional callable progress(visited, total, iterations),
+                      checked after each walk (see algorithms.progress)
+            every: Number of carved cells between progress reports
+
+        Returns:
+            The modified grid
+        """
+        rows, cols = grid.rows, grid.cols
+        cell_count = rows * cols
+        if cell_count == 0:
+            return grid
+
+        stream = RandomStream(seed)
+        random = stream.random
+        neighbors = grid.flat_neighbors()
+        opposites = Cell.OPPOSITES
+        visited = bytearray(cell_count)
+        visited_rows = np.frombuffer(visited, dtype=np.uint8).reshape(rows, cols)
+        links = [0] * cell_count
+
+        current = stream.randrange(cell_count)
+        visited[current] = 1
+        visited_count = 1
+        first_row = 0
+        check_every(progress, every)
+        report_at = every if progress is not None else cell_count + 1
+
+        while True:
+            # Kill: random walk into unvisited cells
+            while True:
+                available = [option for option in neighbors[current] if not visited[option[0]]]
+                if not available:
+                    break
+                neighbor, direction = available[int(random() * len(available))]
+                links[current] |= direction
+                links[neighbor] |= opposites[direction]
+                visited[neighbor] = 1
+                visited_count += 1
+                current = neighbor
+
+            if visited_count >= report_at:
+                report_at = visited_count + every
+                progress(visited_count, cell_count, visited_count)
+
+            # Skip rows that have no unvisited cells left
+            while first_row < rows and visited.find(0, first_row * cols, (first_row + 1) * cols) < 0:
+                first_row += 1
+            if first_row == rows:
+                break
+
+            # Hunt: join the next unvisited cell to the maze and walk on from it
+            row, col = HuntAndKillMaze.hunt(visited_rows, first_row)
+            current = row * cols + col
+            options = [option for option in neighbors[current] if visited[option[0]]]
+            neighbor, direction = options[int(random() * len(options))]
+            links[current] |= direction
+            links[neighbor] |= opposites[direction]
+            visited[current] = 1
+            visited_count += 1
+
+        grid.add_links(np.array(links, dtype=np.uint8).reshape(rows, cols))
+        if progress is not None:
+            progress(cell_count, cell_count, cell_count)
+        return grid
+
+    @staticmethod
+    def hunt(visited, row_start=0):
+        """
+        Find the first unvisited cell, in row-major order, that has a visited neighbor.
+
+        Args:
+            visited: A (rows, cols) array that is non-zero for visited cells
+            row_start: First row to scan; rows above it must be fully visited
+
+        Returns:
+            The (row, col) of the cell, or None if there is no such cell
+        """
+        rows, cols = visited.shape
+        for r in range(row_start, rows):
+            unvisited = visited[r] == 0
+            if not unvisited.any():
+                continue
+
+            touching = np.zeros(cols, dtype=bool)
+            if r > 0:
+                touching |= visited[r - 1] != 0
+            if r < rows - 1:
+                touching |= visited[r + 1] != 0
+            touching[1:] |= visited[r, :-1] != 0
+            touching[:-1] |= visited[r, 1:] != 0
+
+            candidates = unvisited & touching
+            if candidates.any():
+                return r, int(candidates.argmax())
+        return None
+
+    @staticmethod
+    def explain():
+        """
+        Returns a detailed explanation of the Hunt-and-Kill algorithm for educational purposes.
+        """
+        explanation = """
+        THE HUNT-AND-KILL ALGORITHM EXPLAINED
+
+        Hunt-and-Kill combines random walks with a systematic search.
+
+        1. INITIALIZATION:
+           - Start with a grid of cells with no connections
+           - Choose a random starting cell and mark it visited
+
+        2. KILL PHASE:
+           - Move to a random unvisited neighbor, carving a passage
+           - Repeat until the current cell has no unvisited neighbors
+
+        3. HUNT PHASE:
+           - Scan the grid row by row for an unvisited cell that touches
+             a visited one
+           - Carve a passage between them and start a new kill phase there
+           - When no unvisited cells remain, the maze is complete
+
+        4. FEATURES AND PATTERNS:
+           - Creates perfect mazes (exactly one path between any two points)
+           - Long winding corridors ("rivers") with few dead ends
+           - Produces mazes that are harder to solve than Prim's or Binary Tree
+        """
+        return explanation
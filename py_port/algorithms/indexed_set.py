@@ -0,0 +1,47 @@
+"""
+Array-backed set of flat cell indices.
+
+Generators that keep a frontier or active list of cells need three operations
+to be fast: add a cell, pick a random member and remove a member. Keeping the
+members in a list plus a position table makes all three O(1); removal swaps the
+member with the last element before shrinking the list.
+"""
+
+
+class IndexedSet:
+    """A set of integers in [0, capacity) with O(1) add, remove and random access."""
+
+    def __init__(self, capacity):
+        """Create an empty set able to hold the integers 0 .. capacity - 1."""
+        self.items = []
+        self.positions = [-1] * capacity
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return self.positions[item] >= 0
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def add(self, item):
+        """Add an item (no effect if it is already present)."""
+        if self.positions[item] < 0:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def remove(self, item):
+        """Remove an item by swapping it with the last member."""
+        index = self.positions[item]
+        if index < 0:
+            raise KeyError(item)
+        last = self.items.pop()
+        if last != item:
+            self.items[index] = last
+            self.positions[last] = index
+        self.positions[item] = -1
+
+    def pick(self, fraction):
+        """Return the member at position int(fraction * len) for a fraction in [0, 1)."""
+        return self.items[int(fraction * len(self.items))]
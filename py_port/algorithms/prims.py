@@ -0,0 +1,274 @@
+import sys
+import os
+import heapq
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from algorithms.indexed_set import IndexedSet
+from algorithms.progress import DEFAULT_EVERY, check_every
+from algorithms.streams import RandomStream
+
+# Bits reserved for the cell index in a true Prim's heap key
+_INDEX_BITS = 32
+
+
+class SimplifiedPrimsMaze:
+    """
+    Simplified Prim's maze generation algorithm implementation.
+
+    Prim's algorithm grows the maze outward from a single cell. The simplified
+    version keeps a set of "active" cells (visited cells that may still have
+    unvisited neighbors) and repeatedly extends the maze from a random member.
+
+    Characteristics of simplified Prim's mazes:
+    - Radial texture: passages spread out evenly from the starting cell
+    - Many short dead ends and few long corridors
+    - Creates perfect mazes (exactly one path between any two cells)
+    - Easy to solve compared to random-walk algorithms
+
+    The active set is array-backed, so picking and removing a random member
+    are both O(1).
+
+    Time complexity: O(n) where n is the number of cells in the grid
+    Space complexity: O(n) for the active set and visited flags
+    """
+
+    @staticmethod
+    def on(grid, seed=None, progress=None, every=DEFAULT_EVERY):
+        """
+        Apply the simplified Prim's algorithm to a grid to create a maze.
+
+        The algorithm works like this:
+        1. Mark a random cell as visited and add it to the active set
+        2. Pick a random cell from the active set
+        3. If it has unvisited neighbors, link it to a random one of them and
+           add that neighbor to the active set
+        4. Otherwise remove the cell from the active set
+        5. Repeat until the active set is empty
+
+        Args:
+            grid: The Grid object to apply the algorithm to
+            seed: Optional random seed for reproducible maze generation
+            progress: Optional callable progress(visited, total, iterations),
+                      called every `every` carved cells (see algorithms.progress)
+            every: Number of carved cells between progress reports
+
+        Returns:
+            The modified grid
+        """
+        cell_count = grid.rows * grid.cols
+        if cell_count == 0:
+            return grid
+
+        stream = RandomStream(seed)
+        random = stream.random
+        neighbors = grid.flat_neighbors()
+        opposites = Cell.OPPOSITES
+        visited = bytearray(cell_count)
+        links = [0] * cell_count
+
+        start = stream.randrange(cell_count)
+        visited[start] = 1
+        active = IndexedSet(cell_count)
+        active.add(start)
+        members = active.items
+
+        # Progress is checked only when a cell is carved; iterations are carves
+        # plus retirements, i.e. 2 * visited - 1 - active cells
+        visited_count = 1
+        check_every(progress, every)
+        report_at = every if progress is not None else cell_count + 1
+
+        while members:
+            current = members[int(random() * len(members))]
+            available = [option for option in neighbors[current] if not visited[option[0]]]
+
+            if available:
+                neighbor, direction = available[int(random() * len(available))]
+                links[current] |= direction
+                links[neighbor] |= opposites[direction]
+                visited[neighbor] = 1
+                active.add(neighbor)
+                visited_count += 1
+                if visited_count >= report_at:
+                    report_at += every
+                    progress(visited_count, cell_count, 2 * visited_count - 1 - len(members))
+            else:
+                active.remove(current)
+
+        grid.add_links(np.array(links, dtype=np.uint8).reshape(grid.rows, grid.cols))
+        if progress is not None:
+            progress(cell_count, cell_count, 2 * cell_count - 1)
+        return grid
+
+    @staticmethod
+    def explain():
+        """
+        Returns a detailed explanation of the simplified Prim's algorithm for educational purposes.
+        """
+        explanation = """
+        THE SIMPLIFIED PRIM'S ALGORITHM EXPLAINED
+
+        Prim's algorithm builds a spanning tree by growing it one cell at a time.
+
+        1. INITIALIZATION:
+           - Start with a grid of cells with no connections
+           - Choose a random cell, mark it visited and add it to the active set
+
+        2. GROWING THE MAZE:
+           - Pick a random cell from the active set
+           - If it has unvisited neighbors, carve into a random one and add
+             that neighbor to the active set
+           - If it has none, remove it from the active set
+           - Repeat until the active set is empty
+
+        3. FEATURES AND PATTERNS:
+           - Creates perfect mazes (exactly one path between any two points)
+           - Strong radial texture centered on the starting cell
+           - Lots of short dead ends, few long corridors
+
+        4. PERFORMANCE CHARACTERISTICS:
+           - Every cell is added to and removed from the active set once
+           - Random selection and removal are O(1) with an array-backed set
+           - Linear time overall, much faster than random-walk algorithms
+        """
+        return explanation
+
+
+class TruePrimsMaze:
+    """
+    True Prim's maze generation algorithm implementation.
+
+    True Prim's assigns every cell a random weight and always extends the maze
+    from the active cell with the lowest weight, into its lowest-weight
+    unvisited neighbor. This is Prim's minimum spanning tree algorithm run on a
+    grid with random costs.
+
+    Characteristics of true Prim's mazes:
+    - Radial texture with more varied, "blobby" growth than the simplified version
+    - Many short dead ends and few long corridors
+    - Creates perfect mazes (exactly one path between any two cells)
+
+    The active cells live in a binary heap of plain integers: each key packs
+    the cell weight above the cell index, so comparisons are single int compares.
+
+    Time complexity: O(n log n) where n is the number of cells in the grid
+    Space complexity: O(n) for the heap, weights and visited flags
+    """
+
+    @staticmethod
+    def on(grid, seed=None, progress=None, every=DEFAULT_EVERY):
+        """
+        Apply the true Prim's algorithm to a grid to create a maze.
+
+        The algorithm works like this:
+        1. Give every cell a random weight
+        2. Mark a random cell as visited and push it onto the heap
+        3. Look at the active cell with the lowest weight
+        4. If it has unvisited neighbors, link it to the lightest one and push
+           that neighbor onto the heap
+        5. Otherwise pop the cell off the heap
+        6. Repeat until the heap is empty
+
+        Args:
+            grid: The Grid object to apply the algorithm to
+            seed: Optional random seed for reproducible maze generation
+            progress: Optional callable progress(visited, total, iterations),
+                      called every `every` carved cells (see algorithms.progress)
+            every: Number of carved cells between progress reports
+
+        Returns:
+            The modified grid
+        """
+        cell_count = grid.rows * grid.cols
+        if cell_count == 0:
+            return grid
+
+        stream = RandomStream(seed)
+        start = stream.randrange(cell_count)
+
+        # Heap keys: (weight << _INDEX_BITS) | index
+        weights = (stream.block(cell_count) * (1 << 20)).astype(np.int64)
+        keys = ((weights << _INDEX_BITS) | np.arange(cell_count, dtype=np.int64)).tolist()
+
+        neighbors = grid.flat_neighbors()
+        opposites = Cell.OPPOSITES
+        visited = bytearray(cell_count)
+        links = [0] * cell_count
+        index_mask = (1 << _INDEX_BITS) - 1
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        visited[start] = 1
+        heap = [keys[start]]
+
+        # Progress is checked only when a cell is carved (see SimplifiedPrimsMaze)
+        visited_count = 1
+        check_every(progress, every)
+        report_at = every if progress is not None else cell_count + 1
+
+        while heap:
+            current = heap[0] & index_mask
+            best = None
+            best_key = None
+            for neighbor, direction in neighbors[current]:
+                if not visited[neighbor] and (best is None or keys[neighbor] < best_key):
+                    best = (neighbor, direction)
+                    best_key = keys[neighbor]
+
+            if best is None:
+                heappop(heap)
+                continue
+
+            neighbor, direction = best
+            links[current] |= direction
+            links[neighbor] |= opposites[direction]
+            visited[neighbor] = 1
+            heappush(heap, best_key)
+            visited_count += 1
+            if visited_count >= report_at:
+                report_at += every
+                progress(visited_count, cell_count, 2 * visited_count - 1 - len(heap))
+
+        grid.add_links(np.array(links, dtype=np.uint8).reshape(grid.rows, grid.cols))
+        if progress is not None:
+            progress(cell_count, cell_count, 2 * cell_count - 1)
+        return grid
+
+    @staticmethod
+    def explain():
+        """
+        Returns a detailed explanation of the true Prim's algorithm for educational purposes.
+        """
+        explanation = """
+        THE TRUE PRIM'S ALGORITHM EXPLAINED
+
+        True Prim's is the classic minimum spanning tree algorithm applied to a
+        grid whose cells have random weights.
+
+        1. INITIALIZATION:
+           - Give every cell a random weight
+           - Choose a random starting cell and add it to the active set
+
+        2. GROWING THE MAZE:
+           - Take the active cell with the lowest weight
+           - Carve into its lowest-weight unvisited neighbor and make that
+             neighbor active
+           - If it has no unvisited neighbors, retire it
+           - Repeat until no active cells remain
+
+        3. FEATURES AND PATTERNS:
+           - Creates perfect mazes (exactly one path between any two points)
+           - Radial texture that grows in irregular "blobs"
+           - Short dead ends and few long corridors
+
+        4. PERFORMANCE CHARACTERISTICS:
+           - The active set is a priority queue (binary heap)
+           - Heap keys are plain integers (weight and cell index packed together)
+           - O(n log n) overall
+        """
+        return explanation
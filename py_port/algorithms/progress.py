@@ -0,0 +1,63 @@
+"""
+Progress reporting for maze generators.
+
+Every generator accepts progress=None and every=DEFAULT_EVERY. When progress is
+a callable it is called as progress(visited, total, iterations) at most once per
+`every` units of work (iterations of a walk, cells carved or cells committed to
+the grid), and once more when the maze is finished:
+
+- visited: cells that are part of the maze so far
+- total: cells in the grid
+- iterations: work done so far, in the generator's own unit
+
+Generators check for progress outside their hot loops (or fold the check into a
+bound they already test), so leaving it unset costs nothing measurable.
+"""
+
+# Default number of work units between progress reports
+DEFAULT_EVERY = 10000
+
+
+def check_every(progress, every):
+    """
+    Validate the report interval of a progress callable.
+
+    Raises:
+        ValueError: If progress is set and every is less than 1
+    """
+    if progress is not None and every < 1:
+        raise ValueError(f"every must be at least 1, not {every}")
+
+
+def commit_links(grid, links, progress=None, every=DEFAULT_EVERY, replace=False):
+    """
+    Add a link array to the grid, reporting progress as bands of rows are written.
+
+    Writing links into Cell objects is the slow part of the vectorized
+    generators, so this is where their progress is reported.
+
+    Args:
+        grid: The Grid object to update
+        links: A (rows, cols) array of Cell link flags
+        progress: Optional progress callable (see module docstring)
+        every: Approximate number of cells between reports
+        replace: Overwrite the grid's links instead of adding to them
+
+    Returns:
+        The grid
+    """
+    check_every(progress, every)
+    write = grid.apply_links if replace else grid.add_links
+    if progress is None:
+        write(links)
+        return grid
+
+    total = grid.rows * grid.cols
+    band = max(1, every // max(1, grid.cols))
+    for start in range(0, grid.rows, band):
+        stop = min(start + band, grid.rows)
+        write(links[start:stop], row_start=start)
+        progress(stop * grid.cols, total, stop * grid.cols)
+    if grid.rows == 0:
+        progress(0, 0, 0)
+    return grid
@@ -0,0 +1,168 @@
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from grid import Grid
+from algorithms.progress import DEFAULT_EVERY, commit_links
+from algorithms.streams import RandomStream, hash64, uniform
+
+
+class RecursiveDivisionMaze:
+    """
+    Recursive Division maze generation algorithm implementation.
+
+    Recursive Division is a "wall adder": it starts from a grid with no interior
+    walls and repeatedly splits a chamber in two with a straight wall that has a
+    single passage through it, then divides both halves the same way.
+
+    Pending chambers are kept in a work queue and processed one generation at a
+    time. Chambers of a generation never overlap, so all of their walls are added
+    together with array operations, and every chamber draws its random numbers
+    from its own key (derived from its parent's), so the result does not depend
+    on the order in which chambers are processed.
+
+    Characteristics of Recursive Division mazes:
+    - Long straight walls and a rectangular, room-like structure
+    - Creates perfect mazes (exactly one path between any two cells)
+    - With room_size > 1, small chambers are left open as rooms
+
+    Time complexity: O(n log n) for typical divisions
+    Space complexity: O(n) for the link array
+    """
+
+    @staticmethod
+    def on(grid, seed=None, room_size=1, progress=None, every=DEFAULT_EVERY):
+        """
+        Apply the Recursive Division algorithm to a grid to create a maze.
+
+        The algorithm works like this:
+        1. Link every cell to all of its neighbors
+        2. Take a chamber (initially the whole grid) and pick an orientation,
+           preferring to cut across the longer side
+        3. Add a wall across the chamber, leaving one random passage open
+        4. Queue the two chambers on either side of the wall
+        5. Stop dividing chambers that are one cell thick (or no larger than
+           room_size in both directions)
+
+        The grid's existing links are replaced.
+
+        Args:
+            grid: The Grid object to apply the algorithm to
+            seed: Optional random seed for reproducible maze generation
+            room_size: Chambers at most this many cells high and wide are left
+                       undivided; values above 1 give mazes with open rooms
+            progress: Optional callable progress(visited, total, iterations); the
+                      division itself is vectorized, so progress is reported
+                      while rows are written to the grid (see algorithms.progress)
+            every: Number of cells between progress reports
+
+        Returns:
+            The modified grid
+        """
+        key = RandomStream(seed).key
+        links = RecursiveDivisionMaze.link_array(key, grid.rows, grid.cols, room_size)
+        return commit_links(grid, links, progress, every, replace=True)
+
+    @staticmethod
+    def link_array(key, rows, cols, room_size=1):
+        """
+        Divide a fully linked (rows, cols) grid and return its link array.
+
+        Args:
+            key: Stream key of the root chamber
+            rows: Number of rows
+            cols: Number of columns
+            room_size: See on()
+
+        Returns:
+            A (rows, cols) uint8 array of Cell link flags
+        """
+        links = Grid.full_links(rows, cols).reshape(-1)
+        not_north, not_south = np.uint8(~Cell.NORTH & 0xFF), np.uint8(~Cell.SOUTH & 0xFF)
+        not_east, not_west = np.uint8(~Cell.EAST & 0xFF), np.uint8(~Cell.WEST & 0xFF)
+
+        # The work queue: one array per chamber attribute
+        top = np.zeros(1, dtype=np.int64)
+        left = np.zeros(1, dtype=np.int64)
+        height = np.array([rows], dtype=np.int64)
+        width = np.array([cols], dtype=np.int64)
+        keys = np.array([key], dtype=np.uint64)
+
+        while len(top):
+            keep = (height > 1) & (width > 1) & ((height > room_size) | (width > room_size))
+            top, left, height, width, keys = top[keep], left[keep], height[keep], width[keep], keys[keep]
+            if not len(top):
+                break
+
+            # Draws 0-2 of each chamber: orientation, wall position, passage position
+            draws = uniform(keys[:, None], np.arange(3, dtype=np.uint64))
+            horizontal = (height > width) | ((height == width) & (draws[:, 0] < 0.5))
+            span = np.where(horizontal, height, width)
+            length = np.where(horizontal, width, height)
+            wall = (draws[:, 1] * (span - 1)).astype(np.int64)
+            passage = (draws[:, 2] * length).astype(np.int64)
+
+            # Flat indices of the cells on the near side of every wall, minus the passage
+            owner = np.repeat(np.arange(len(top)), length)
+            offset = np.arange(len(owner)) - np.repeat(np.cumsum(length) - length, length)
+            cut = offset != passage[owner]
+            owner, offset = owner[cut], offset[cut]
+            across = horizontal[owner]
+            row = np.where(across, top[owner] + wall[owner], top[owner] + offset)
+            col = np.where(across, left[owner] + offset, left[owner] + wall[owner])
+            cells = row * cols + col
+
+            south = cells[across]
+            links[south] &= not_south
+            links[south + cols] &= not_north
+            east = cells[~across]
+            links[east] &= not_east
+            links[east + 1] &= not_west
+
+            # Queue both halves; their keys are draws 3 and 4 of the parent
+            first = wall + 1
+            top = np.concatenate([top, np.where(horizontal, top + first, top)])
+            left = np.concatenate([left, np.where(horizontal, left, left + first)])
+            height = np.concatenate([np.where(horizontal, first, height),
+                                     np.where(horizontal, height - first, height)])
+            width = np.concatenate([np.where(horizontal, width, first),
+                                    np.where(horizontal, width, width - first)])
+            keys = np.concatenate([hash64(keys, 3), hash64(keys, 4)])
+
+        return links.reshape(rows, cols)
+
+    @staticmethod
+    def explain():
+        """
+        Returns a detailed explanation of the Recursive Division algorithm for educational purposes.
+        """
+        explanation = """
+        THE RECURSIVE DIVISION ALGORITHM EXPLAINED
+
+        Recursive Division builds a maze by adding walls instead of carving passages.
+
+        1. INITIALIZATION:
+           - Start with an open grid where every cell is linked to its neighbors
+           - The whole grid is the first chamber
+
+        2. DIVIDING A CHAMBER:
+           - Choose a horizontal or vertical wall, usually across the longer side
+           - Place it at a random position inside the chamber
+           - Leave exactly one random gap in the wall as a passage
+           - The two sides of the wall become new chambers
+
+        3. TERMINATION:
+           - Chambers only one cell high or wide are already corridors
+           - Optionally, small chambers are left open as rooms
+
+        4. FEATURES AND PATTERNS:
+           - Long straight walls and a boxy, room-like structure
+           - Creates perfect mazes (exactly one path between any two points)
+           - Chambers are independent, so many can be divided at once
+        """
+        return explanation
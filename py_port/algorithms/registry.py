@@ -0,0 +1,312 @@
+"""
+Central registry of maze generation algorithms.
+
+Frontends look algorithms up here instead of keeping their own if/elif chains.
+Each entry names the generator class by import path, so nothing is imported
+until an algorithm is actually used, and declares capabilities that let a
+caller pick a suitable engine:
+
+- vectorized: the class provides batch(seeds, rows, cols) carving many mazes
+  with array operations
+- streaming: generation can be paused and resumed (the class provides run())
+- parallel_safe: seeded output is identical however the work is split
+- uniform: every perfect maze is generated with equal probability
+- random_access: the class provides region(seed, row_start, col_start, rows,
+  cols) computing any window of a practically unbounded maze directly from
+  cell coordinates
+
+The speed field is a relative cost hint (1 = fastest) used to order results.
+"""
+
+import sys
+import os
+import importlib
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+# Add the parent directory to the path so entry points can be imported
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@dataclass(frozen=True)
+class GeneratorSpec:
+    """Description of a registered maze generator."""
+    name: str
+    entry_point: str
+    label: str
+    summary: Tuple[str, ...]
+    aliases: Tuple[str, ...] = ()
+    vectorized: bool = False
+    streaming: bool = False
+    parallel_safe: bool = False
+    uniform: bool = False
+    random_access: bool = False
+    speed: int = 2
+    version: int = 1
+    stepper: Optional[str] = None
+    options: Tuple[str, ...] = field(default=())
+
+    @staticmethod
+    def _import(entry_point):
+        module_name, _, attribute = entry_point.partition(':')
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def load(self):
+        """Import and return the generator class."""
+        return self._import(self.entry_point)
+
+    def load_stepper(self):
+        """Import and return the step-by-step class, or None if there is none."""
+        return self._import(self.stepper) if self.stepper else None
+
+    def option_values(self, values):
+        """
+        Pick the options this generator accepts out of a mapping of values.
+
+        Args:
+            values: A dict (or argparse namespace) of candidate option values;
+                    entries that are None are left out
+
+        Returns:
+            A dict suitable for passing as **options to GeneratorRegistry.generate
+        """
+        if not isinstance(values, dict):
+            values = vars(values)
+        return {name: values[name] for name in self.options if values.get(name) is not None}
+
+
+class GeneratorRegistry:
+    """Manages the maze generation algorithms available to frontends."""
+
+    _generators = {}
+    _aliases = {}
+
+    @classmethod
+    def register(cls, spec):
+        """
+        Register a new generator.
+
+        Args:
+            spec: The GeneratorSpec describing the generator
+
+        Raises:
+            ValueError: If the name or one of its aliases is already registered
+        """
+        for name in (spec.name,) + spec.aliases:
+            if name in cls._generators or name in cls._aliases:
+                raise ValueError(f"Generator {name} is already registered")
+
+        cls._generators[spec.name] = spec
+        for alias in spec.aliases:
+            cls._aliases[alias] = spec.name
+
+    @classmethod
+    def get(cls, name):
+        """
+        Get a generator spec by name or alias.
+
+        Raises:
+            ValueError: If the name is not recognized
+        """
+        name = cls._aliases.get(name, name)
+        if name not in cls._generators:
+            raise ValueError(f"Unknown algorithm: {name}. Available algorithms: {', '.join(cls._generators)}")
+        return cls._generators[name]
+
+    @classmethod
+    def list_generators(cls):
+        """
+        List the canonical names of all registered generators.
+
+        Returns:
+            A list of generator names in registration order
+        """
+        return list(cls._generators.keys())
+
+    @classmethod
+    def find(cls, **capabilities):
+        """
+        Find generators with the requested capabilities, fastest first.
+
+        Example:
+            GeneratorRegistry.find(uniform=True, streaming=True)
+
+        Returns:
+            A list of GeneratorSpec objects
+        """
+        matches = [spec for spec in cls._generators.values()
+                   if all(getattr(spec, key) == value for key, value in capabilities.items())]
+        return sorted(matches, key=lambda spec: spec.speed)
+
+    @classmethod
+    def generate(cls, name, grid, seed=None, progress=None, every=None, **options):
+        """
+        Carve a maze into the grid with the named generator.
+
+        Args:
+            name: Generator name or alias
+            grid: The Grid object to carve
+            seed: Optional seed for reproducible output
+            progress: Optional callable progress(visited, total, iterations)
+                      (see algorithms.progress)
+            every: Units of work between progress reports (generator default if None)
+            **options: Generator-specific options (see GeneratorSpec.options)
+
+        Returns:
+            The carved grid
+
+        Raises:
+            ValueError: If progress is set and every is less than 1
+        """
+        if progress is not None:
+            options['progress'] = progress
+            if every is not None:
+                from algorithms.progress import check_every  # Deferred: importing the registry loads no algorithm module
+                check_every(progress, every)
+                options['every'] = every
+        result = cls.get(name).load().on(grid, seed=seed, **options)
+        return result[0] if isinstance(result, tuple) else result
+
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='binary',
+    entry_point='algorithms.binary_tree:BinaryTreeMaze',
+    label='Binary Tree',
+    summary=(
+        "For each cell, randomly carve a passage either north or east.",
+        "Creates a perfect maze with exactly one path between any two points.",
+        "Has a bias toward the northeast corner.",
+    ),
+    aliases=('binary_tree', 'binary-tree'),
+    vectorized=True,
+    parallel_safe=True,
+    random_access=True,
+    speed=1,
+    stepper='algorithms.step_by_step:StepByStepBinaryTree',
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='sidewinder',
+    entry_point='algorithms.sidewinder:SidewinderMaze',
+    label='Sidewinder',
+    summary=(
+        "Creates horizontal \"runs\" of connected cells.",
+        "Randomly ends runs by connecting one cell northward.",
+        "Creates east-west corridors with occasional north passages.",
+    ),
+    vectorized=True,
+    parallel_safe=True,
+    random_access=True,
+    speed=1,
+    stepper='algorithms.step_by_step:StepByStepSidewinder',
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='aldous-broder',
+    entry_point='algorithms.aldous_broder:AldousBroderMaze',
+    label='Aldous-Broder',
+    summary=(
+        "Performs a random walk, connecting unvisited cells.",
+        "Creates unbiased, perfect mazes.",
+        "Slower but produces more balanced mazes.",
+    ),
+    aliases=('aldous_broder',),
+    streaming=True,
+    parallel_safe=True,
+    uniform=True,
+    speed=3,
+    stepper='algorithms.step_by_step:StepByStepAldousBroder',
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='prims',
+    entry_point='algorithms.prims:SimplifiedPrimsMaze',
+    label="Simplified Prim's",
+    summary=(
+        "Grows the maze from a random active cell into an unvisited neighbor.",
+        "Creates perfect mazes with a radial, low-corridor texture.",
+        "Fast: every cell enters and leaves the active set once.",
+    ),
+    aliases=('simplified-prims', 'simplified_prims'),
+    parallel_safe=True,
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='true-prims',
+    entry_point='algorithms.prims:TruePrimsMaze',
+    label="True Prim's",
+    summary=(
+        "Gives every cell a random weight and always grows from the lightest one.",
+        "Creates perfect mazes with a radial, blobby texture.",
+        "Uses a binary heap of integer keys.",
+    ),
+    aliases=('true_prims',),
+    parallel_safe=True,
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='growing-tree',
+    entry_point='algorithms.growing_tree:GrowingTreeMaze',
+    label='Growing Tree',
+    summary=(
+        "Grows the maze from a cell chosen out of an active list by a policy.",
+        "newest gives backtracker-like corridors, random gives a Prim-like texture.",
+        "The mixed policy blends the two; tune it with --policy and --mix.",
+    ),
+    aliases=('growing_tree',),
+    parallel_safe=True,
+    options=('policy', 'mix'),
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='recursive-division',
+    entry_point='algorithms.recursive_division:RecursiveDivisionMaze',
+    label='Recursive Division',
+    summary=(
+        "Starts with an open grid and splits it with walls that have one gap.",
+        "Creates perfect mazes with long straight walls and a room-like layout.",
+        "Divides all pending chambers of a generation at once with array operations.",
+    ),
+    aliases=('recursive_division', 'division'),
+    parallel_safe=True,
+    speed=1,
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='hunt-and-kill',
+    entry_point='algorithms.hunt_and_kill:HuntAndKillMaze',
+    label='Hunt-and-Kill',
+    summary=(
+        "Random walk into unvisited cells; when stuck, hunt for a new start.",
+        "Creates perfect mazes with long, winding rivers and few dead ends.",
+        "The hunt scans rows with array operations, skipping finished rows.",
+    ),
+    aliases=('hunt_and_kill',),
+    parallel_safe=True,
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='origin-shift',
+    entry_point='algorithms.origin_shift:OriginShiftMaze',
+    label='Origin Shift',
+    summary=(
+        "Keeps the maze as a tree and repeatedly moves its root to a neighbor.",
+        "Every step keeps the maze perfect and changes at most two walls.",
+        "Can run live, reporting each change so displays update in place.",
+    ),
+    aliases=('origin_shift',),
+))
+
+GeneratorRegistry.register(GeneratorSpec(
+    name='cave',
+    entry_point='algorithms.cave:CaveMaze',
+    label='Cellular Cave',
+    summary=(
+        "Grows organic caves from random noise with cellular-automaton smoothing.",
+        "Separate caves are joined by tunnels along a short spanning tree.",
+        "Not a perfect maze: open areas have loops; tune with --fill and --iterations.",
+    ),
+    aliases=('caves', 'cellular'),
+    options=('fill', 'iterations'),
+    speed=1,
+))
@@ -2,10 +2,18 @@ import sys
 import os
 import random
 
+import numpy as np
+
 # Add the parent directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cell import Cell
+from grid import Grid
+from algorithms.progress import DEFAULT_EVERY, check_every, commit_links
+from algorithms.streams import WORLD_SIZE, check_window, coordinate_counters, stream_key, stream_keys, uniform
+
+# Streams of the coordinate-hashed (random access) variant: run closing, north picks
+_COORDINATE_STREAMS = (1, 2)
 
 class SidewinderMaze:
     """
@@ -28,7 +36,7 @@ class SidewinderMaze:
     """
     
     @staticmethod
-    def on(grid):
+    def on(grid, seed=None, progress=None, every=DEFAULT_EVERY):
         """
         Apply the Sidewinder algorithm to a grid to create a maze.
         
@@ -41,7 +49,20 @@ class SidewinderMaze:
         
         Args:
             grid: The Grid object to apply the algorithm to
+            seed: Optional seed; when given, decisions come from the deterministic
+                  stream for that seed and the maze is carved in one vectorized pass
+            progress: Optional callable progress(visited, total, iterations),
+                      called about every `every` cells (see algorithms.progress)
+            every: Number of cells between progress reports
         """
+        if seed is not None:
+            close, picks = SidewinderMaze.draws(seed, grid.rows, grid.cols)
+            return commit_links(grid, SidewinderMaze.link_array(close, picks), progress, every)
+
+        total = grid.rows * grid.cols
+        check_every(progress, every)
+        report_at = every
+
         # Special case for the northern row - create a single long corridor
         # This is a characteristic feature of the Sidewinder algorithm
         for c in range(grid.cols - 1):
@@ -78,9 +99,196 @@ class SidewinderMaze:
                 else:
                     # Connect east and continue the run
                     grid.link_cells(r, c, Cell.EAST)
+
+            if progress is not None and ((r + 1) * grid.cols >= report_at or r == grid.rows - 1):
+                report_at = (r + 1) * grid.cols + every
+                progress((r + 1) * grid.cols, total, (r + 1) * grid.cols)
+
+        if progress is not None and grid.rows <= 1:
+            progress(total, total, total)
         
         return grid
 
+    @staticmethod
+    def draws(seed, rows, cols, row_start=0, row_stop=None):
+        """
+        Get the random run decisions of a seeded maze.
+
+        Cell (r, c) uses counters 2 * (r * cols + c) and the one after it, so bands
+        of rows can be computed independently and stacked to get the serial result.
+
+        Args:
+            seed: The maze seed, or a sequence of seeds to draw a whole batch
+            rows: Number of rows in the maze
+            cols: Number of columns in the maze
+            row_start: First row to compute
+            row_stop: Row to stop before (defaults to rows)
+
+        Returns:
+            A (close, picks) pair of arrays of shape (..., row_stop - row_start, cols),
+            with one leading axis per seed dimension
+        """
+        row_stop = rows if row_stop is None else row_stop
+        shape = np.shape(seed) + (row_stop - row_start, cols)
+        counters = 2 * np.arange(row_start * cols, row_stop * cols, dtype=np.uint64)
+        keys = stream_keys(seed)
+        close = uniform(keys, counters).reshape(shape) < 0.5
+        picks = uniform(keys, counters + np.uint64(1)).reshape(shape)
+        return close, picks
+
+    @staticmethod
+    def batch(seeds, rows, cols):
+        """Carve one seeded maze per seed and return the stacked link flags."""
+        close, picks = SidewinderMaze.draws(seeds, rows, cols)
+        return SidewinderMaze.link_array(close, picks)
+
+    @staticmethod
+    def link_array(close, picks):
+        """
+        Build Sidewinder link flags for one or more mazes at once.
+
+        Each row only depends on its own random draws, so runs can be found with
+        cumulative scans instead of walking the row cell by cell.
+
+        Args:
+            close: Boolean array of shape (..., rows, cols); True where a run
+                   should be closed out (the eastern boundary always closes)
+            picks: Float array in [0, 1) of the same shape; at each closing cell
+                   it selects which member of the run carves north
+
+        Returns:
+            A uint8 array of the same shape holding Cell link flags
+        """
+        close = np.array(close, dtype=bool)
+        picks = np.asarray(picks)
+        cols = close.shape[-1]
+        close[..., -1] = True
+        close[..., 0, :] = False  # The northern row is one long corridor
+        close[..., 0, -1] = True
+
+        # Track where the run containing each cell started
+        positions = np.arange(cols)
+        run_starts = np.zeros(close.shape, dtype=np.int64)
+        run_starts[..., 1:] = np.where(close[..., :-1], positions[1:], 0)
+        run_starts = np.maximum.accumulate(run_starts, axis=-1)
+
+        # Choose the north-carving member of every run that closes out
+        run_lengths = positions - run_starts
+        offsets = np.minimum((picks * (run_lengths + 1)).astype(np.int64), run_lengths)
+        north = np.zeros(close.shape, dtype=bool)
+        closing = close.copy()
+        closing[..., 0, :] = False
+        index = np.nonzero(closing)
+        north[index[:-1] + ((run_starts + offsets)[index],)] = True
+
+        east = ~close
+        links = np.zeros(close.shape, dtype=np.uint8)
+        links[north] |= Cell.NORTH
+        links[..., :-1, :][north[..., 1:, :]] |= Cell.SOUTH
+        links[east] |= Cell.EAST
+        links[..., :, 1:][east[..., :, :-1]] |= Cell.WEST
+        return links
+
+    @staticmethod
+    def coordinate_draws(seed, rows, cols):
+        """
+        Get the raw run decisions of cells of a coordinate-hashed maze.
+
+        Each decision is a pure function of (seed, row, col), independent of
+        the size of the maze and of every other cell.
+
+        Args:
+            seed: The maze seed
+            rows: Row coordinates, broadcast against cols
+            cols: Column coordinates
+
+        Returns:
+            A (close, picks) pair of arrays, as used by link_array
+        """
+        counters = coordinate_counters(rows, cols)
+        close = uniform(stream_key(seed, _COORDINATE_STREAMS[0]), counters) < 0.5
+        picks = uniform(stream_key(seed, _COORDINATE_STREAMS[1]), counters)
+        return close, picks
+
+    @staticmethod
+    def region(seed, row_start, col_start, rows, cols,
+               world_rows=WORLD_SIZE, world_cols=WORLD_SIZE, clip=False):
+        """
+        Compute any window of a coordinate-hashed Sidewinder maze.
+
+        The world is a world_rows x world_cols Sidewinder maze whose decisions
+        come from coordinate_draws. A cell's north passage depends on the run
+        it belongs to, so the window is widened until every run that touches
+        it is complete (runs are short: each cell closes one with probability
+        1/2). A window costs O(rows * cols) expected time and memory wherever
+        it is, and overlapping windows always agree.
+
+        Args:
+            seed: The world seed
+            row_start: World row of the window's top edge
+            col_start: World column of the window's left edge
+            rows: Window height
+            cols: Window width
+            world_rows: Height of the world (at most WORLD_SIZE)
+            world_cols: Width of the world (at most WORLD_SIZE)
+            clip: Drop links that leave the window, so the result can be used
+                  as a standalone grid
+
+        Returns:
+            A (rows, cols) uint8 array of Cell link flags
+
+        Raises:
+            ValueError: If the window does not fit in the world
+        """
+        check_window(row_start, col_start, rows, cols, world_rows, world_cols)
+        links = np.zeros((rows, cols), dtype=np.uint8)
+        if rows == 0 or cols == 0:
+            return links
+
+        # One extra row below the window, for south links
+        r = np.arange(row_start, min(row_start + rows + 1, world_rows), dtype=np.int64)[:, None]
+        col_stop = col_start + cols
+        margin = 8
+        while True:
+            left = max(0, col_start - margin)
+            right = min(world_cols, col_stop + margin)
+            c = np.arange(left, right, dtype=np.int64)[None, :]
+            close, picks = SidewinderMaze.coordinate_draws(seed, r, c)
+
+            # The same edge rules as link_array
+            close |= c == world_cols - 1
+            close &= (r > 0) | (c == world_cols - 1)
+
+            # Runs touching the window must start and end inside the strip; the
+            # northern row carves nothing north, so its runs do not matter
+            starts_known = close[:, :col_start - left].any(axis=1) | (left == 0)
+            ends_known = close[:, col_stop - 1 - left:].any(axis=1)
+            if (starts_known & ends_known | (r[:, 0] == 0)).all():
+                break
+            margin *= 2
+
+        # Choose the north-carving member of every run that closes out
+        positions = np.arange(right - left)
+        run_starts = np.zeros(close.shape, dtype=np.int64)
+        run_starts[:, 1:] = np.where(close[:, :-1], positions[1:], 0)
+        run_starts = np.maximum.accumulate(run_starts, axis=-1)
+        run_lengths = positions - run_starts
+        offsets = np.minimum((picks * (run_lengths + 1)).astype(np.int64), run_lengths)
+        north = np.zeros((rows + 1, right - left), dtype=bool)
+        closing_rows, closing_cols = np.nonzero(close & (r > 0))
+        north[closing_rows, (run_starts + offsets)[closing_rows, closing_cols]] = True
+
+        window = slice(col_start - left, col_stop - left)
+        east = ~close[:rows]
+        links[north[:rows, window]] |= Cell.NORTH
+        links[north[1:, window]] |= Cell.SOUTH
+        links[east[:, window]] |= Cell.EAST
+        if col_start > 0:
+            links[east[:, col_start - left - 1:col_stop - left - 1]] |= Cell.WEST
+        else:
+            links[:, 1:][east[:, window][:, :-1]] |= Cell.WEST
+        return Grid.clip_links(links) if clip else links
+
     @staticmethod
     def explain():
         """
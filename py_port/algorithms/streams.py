@@ -0,0 +1,168 @@
+"""
+Deterministic random streams for maze generation.
+
+Every stream is identified by a (master seed, stream id) pair. The pair is turned
+into a 64-bit key with numpy's SeedSequence, and the n-th random number of the
+stream is a pure function of (key, n) computed with the SplitMix64 mixer. Because
+any draw can be computed directly from its counter, work can be split across
+rows, tiles, threads or processes and still produce bit-identical mazes.
+"""
+
+import random
+
+import numpy as np
+
+# SplitMix64 constants
+_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_MASK64 = (1 << 64) - 1
+
+
+def normalize_seed(seed):
+    """Map any integer seed (including negative hashes) onto an unsigned 64-bit value."""
+    return int(seed) & _MASK64
+
+
+def stream_key(seed, stream_id=0):
+    """
+    Derive the 64-bit key of the stream identified by (seed, stream_id).
+
+    Args:
+        seed: The master seed
+        stream_id: A non-negative integer or a tuple of them; the same scheme as
+                   SeedSequence.spawn, so stream i matches SeedSequence(seed).spawn(n)[i]
+
+    Returns:
+        The stream key as a Python int
+    """
+    spawn_key = stream_id if isinstance(stream_id, tuple) else (stream_id,)
+    sequence = np.random.SeedSequence(normalize_seed(seed), spawn_key=spawn_key)
+    return int(sequence.generate_state(1, dtype=np.uint64)[0])
+
+
+def stream_keys(seeds, stream_id=0):
+    """
+    Derive stream keys for a scalar seed or an array-like of seeds.
+
+    Returns:
+        A uint64 array with the shape of `seeds` plus one trailing axis, ready
+        to broadcast against a 1-D array of counters
+    """
+    seeds = np.asarray(seeds, dtype=object)
+    keys = [stream_key(seed, stream_id) for seed in seeds.ravel()]
+    return np.array(keys, dtype=np.uint64).reshape(seeds.shape + (1,))
+
+
+def hash64(key, counters):
+    """Mix (key, counter) pairs into uniformly distributed unsigned 64-bit integers."""
+    with np.errstate(over='ignore'):
+        x = np.asarray(counters, dtype=np.uint64) * _GAMMA + np.asarray(key, dtype=np.uint64)
+        x = (x ^ (x >> np.uint64(30))) * _MIX1
+        x = (x ^ (x >> np.uint64(27))) * _MIX2
+        return x ^ (x >> np.uint64(31))
+
+
+# Coordinates addressable by coordinate_counters (and so the side of the largest world)
+WORLD_SIZE = 1 << 32
+
+
+def coordinate_counters(rows, cols):
+    """
+    Name cells by their coordinates instead of a flat index.
+
+    The counter of (row, col) packs both coordinates into one 64-bit value, so
+    it does not depend on the width of the maze and any cell of a world up to
+    WORLD_SIZE x WORLD_SIZE can be drawn for directly.
+
+    Args:
+        rows: Row coordinates in [0, WORLD_SIZE), broadcast against cols
+        cols: Column coordinates in [0, WORLD_SIZE)
+
+    Returns:
+        A uint64 array of counters
+    """
+    rows = np.asarray(rows, dtype=np.uint64)
+    cols = np.asarray(cols, dtype=np.uint64)
+    return (rows << np.uint64(32)) | cols
+
+
+def check_window(row_start, col_start, rows, cols, world_rows=WORLD_SIZE, world_cols=WORLD_SIZE):
+    """
+    Check that a window lies inside a coordinate-hashed world.
+
+    Raises:
+        ValueError: If the world is larger than WORLD_SIZE or the window
+                    does not fit in it
+    """
+    if not (0 < world_rows <= WORLD_SIZE and 0 < world_cols <= WORLD_SIZE):
+        raise ValueError(f"World size ({world_rows}, {world_cols}) must be between 1 and {WORLD_SIZE}")
+    if rows < 0 or cols < 0 or row_start < 0 or col_start < 0 \
+            or row_start + rows > world_rows or col_start + cols > world_cols:
+        raise ValueError(f"Window of size ({rows}, {cols}) at ({row_start}, {col_start}) "
+                         f"does not fit world ({world_rows}, {world_cols})")
+
+
+def uniform(key, counters):
+    """Return the floats in [0, 1) found at the given counters of a stream."""
+    return (hash64(key, counters) >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+class RandomStream:
+    """
+    Sequential reader over a counter-based stream.
+
+    Draws are produced in vectorized blocks and handed out one at a time, which
+    keeps per-draw overhead low in Python loops. The whole state of the stream
+    is its key and position, so it can be recreated anywhere.
+    """
+
+    BLOCK_SIZE = 4096
+
+    def __init__(self, seed=None, stream_id=0, key=None, position=0):
+        """
+        Open a stream.
+
+        Args:
+            seed: Master seed; if None (and no key is given) a seed is drawn from
+                  the global random module so random.seed() still applies
+            stream_id: Stream identifier under the master seed
+            key: An existing stream key (overrides seed and stream_id)
+            position: Counter of the next draw
+        """
+        if key is None:
+            if seed is None:
+                seed = random.getrandbits(64)
+            key = stream_key(seed, stream_id)
+        self.key = key
+        self._block_start = position
+        self._buffer = []
+        self._index = 0
+
+    @property
+    def position(self):
+        """Counter of the next value this stream will return."""
+        return self._block_start + self._index
+
+    def random(self):
+        """Return the next float in [0, 1)."""
+        if self._index >= len(self._buffer):
+            self._block_start += len(self._buffer)
+            counters = np.arange(self._block_start, self._block_start + self.BLOCK_SIZE, dtype=np.uint64)
+            self._buffer = uniform(self.key, counters).tolist()
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        return value
+
+    def randrange(self, n):
+        """Return the next integer in [0, n)."""
+        return int(self.random() * n)
+
+    def block(self, count):
+        """Return the next `count` floats as an array."""
+        start = self.position
+        self._block_start = start + count
+        self._buffer = []
+        self._index = 0
+        return uniform(self.key, np.arange(start, start + count, dtype=np.uint64))
@@ -0,0 +1,226 @@
+"""
+Unbounded procedural maze world made of chunks generated on demand.
+
+The world is a plane of square chunks indexed by (chunk_row, chunk_col), which
+may be negative. Every chunk is a perfect maze carved by a registered generator
+with a seed derived from (world seed, chunk coordinate), so a chunk is the same
+whenever and wherever it is generated. Neighboring chunks are joined through one
+door per shared edge; the door's position is hashed from the world seed and the
+edge itself, so both chunks agree on it without looking at each other.
+
+Chunks are kept in a bounded LRU cache, and MazeWorld.prefetch generates chunks
+around a position on a background thread, so an explorer can walk forever in
+bounded memory without waiting for chunks ahead of it.
+"""
+
+import sys
+import os
+import queue
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from grid import Grid
+from algorithms.registry import GeneratorRegistry
+from algorithms.streams import coordinate_counters, stream_key, uniform
+
+# Streams under the world seed: chunk seeds, east doors, south doors
+_CHUNK_STREAM = 1
+_EAST_DOOR_STREAM = 2
+_SOUTH_DOOR_STREAM = 3
+
+
+def zigzag(value):
+    """Map an integer onto a non-negative one (0, -1, 1, -2, ... -> 0, 1, 2, 3, ...)."""
+    return 2 * value if value >= 0 else -2 * value - 1
+
+
+class MazeWorld:
+    """
+    An unbounded maze world generated chunk by chunk.
+
+    World cell (row, col) lies in chunk (row // chunk_size, col // chunk_size).
+    The world is connected: every chunk is a perfect maze, and adjacent chunks
+    share a door, so there are loops only at the scale of chunks.
+
+    Example:
+        world = MazeWorld(seed=42)
+        links = world.window(-10, -10, 20, 20)
+    """
+
+    def __init__(self, seed, chunk_size=16, algorithm='growing-tree', max_chunks=256, **options):
+        """
+        Create a world.
+
+        Args:
+            seed: The world seed
+            chunk_size: Side of a chunk in cells
+            algorithm: Name of the generator that carves each chunk
+            max_chunks: Bound on the number of chunks kept in memory
+            **options: Generator-specific options for the chunk generator
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.algorithm = GeneratorRegistry.get(algorithm).name
+        self.options = options
+        self.max_chunks = max(1, max_chunks)
+        self.generated = 0
+        self._east_key = stream_key(seed, _EAST_DOOR_STREAM)
+        self._south_key = stream_key(seed, _SOUTH_DOOR_STREAM)
+        self._chunks = OrderedDict()
+        self._lock = threading.Lock()
+        self._requests = None
+        self._pending = set()
+
+    def __len__(self):
+        return len(self._chunks)
+
+    def chunk_seed(self, chunk_row, chunk_col):
+        """Get the seed the chunk generator uses for a chunk."""
+        return stream_key(self.seed, (_CHUNK_STREAM, zigzag(chunk_row), zigzag(chunk_col)))
+
+    def door(self, chunk_row, chunk_col, side):
+        """
+        Get the position of the door through the east or south edge of a chunk.
+
+        Args:
+            chunk_row: Chunk row
+            chunk_col: Chunk column
+            side: Cell.EAST or Cell.SOUTH
+
+        Returns:
+            The row (east edge) or column (south edge) of the door within the chunk
+        """
+        key = self._east_key if side == Cell.EAST else self._south_key
+        draw = uniform(key, coordinate_counters(zigzag(chunk_row), zigzag(chunk_col)))
+        return int(draw * self.chunk_size)
+
+    def build_chunk(self, chunk_row, chunk_col):
+        """
+        Generate a chunk, including its doors, without touching the cache.
+
+        Returns:
+            A (chunk_size, chunk_size) uint8 array of Cell link flags
+        """
+        size = self.chunk_size
+        grid = GeneratorRegistry.generate(self.algorithm, Grid(size, size),
+                                          seed=self.chunk_seed(chunk_row, chunk_col), **self.options)
+        links = grid.to_links()
+        links[self.door(chunk_row, chunk_col, Cell.EAST), -1] |= Cell.EAST
+        links[-1, self.door(chunk_row, chunk_col, Cell.SOUTH)] |= Cell.SOUTH
+        links[self.door(chunk_row, chunk_col - 1, Cell.EAST), 0] |= Cell.WEST
+        links[0, self.door(chunk_row - 1, chunk_col, Cell.SOUTH)] |= Cell.NORTH
+        links.flags.writeable = False
+        return links
+
+    def chunk(self, chunk_row, chunk_col):
+        """
+        Get a chunk from the cache, generating it on a miss.
+
+        Returns:
+            A read-only (chunk_size, chunk_size) uint8 array of Cell link flags
+        """
+        key = (chunk_row, chunk_col)
+        with self._lock:
+            links = self._chunks.get(key)
+            if links is not None:
+                self._chunks.move_to_end(key)
+                return links
+
+        links = self.build_chunk(chunk_row, chunk_col)
+        self._remember(key, links)
+        return links
+
+    def _remember(self, key, links):
+        """Insert a chunk and evict the least recently used ones."""
+        with self._lock:
+            if key not in self._chunks:
+                self.generated += 1
+            self._chunks[key] = links
+            self._chunks.move_to_end(key)
+            while len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+
+    def links_at(self, row, col):
+        """Get the link flags of a world cell."""
+        chunk_row, r = divmod(row, self.chunk_size)
+        chunk_col, c = divmod(col, self.chunk_size)
+        return int(self.chunk(chunk_row, chunk_col)[r, c])
+
+    def window(self, row_start, col_start, rows, cols):
+        """
+        Assemble the link flags of a rectangle of the world.
+
+        Links leading out of the rectangle are kept; use Grid.clip_links to
+        turn the result into a standalone grid.
+
+        Returns:
+            A (rows, cols) uint8 array of Cell link flags
+        """
+        size = self.chunk_size
+        links = np.zeros((rows, cols), dtype=np.uint8)
+        for chunk_row in range(row_start // size, (row_start + rows - 1) // size + 1):
+            top = max(row_start, chunk_row * size)
+            bottom = min(row_start + rows, (chunk_row + 1) * size)
+            for chunk_col in range(col_start // size, (col_start + cols - 1) // size + 1):
+                left = max(col_start, chunk_col * size)
+                right = min(col_start + cols, (chunk_col + 1) * size)
+                links[top - row_start:bottom - row_start, left - col_start:right - col_start] = \
+                    self.chunk(chunk_row, chunk_col)[top - chunk_row * size:bottom - chunk_row * size,
+                                                     left - chunk_col * size:right - chunk_col * size]
+        return links
+
+    def prefetch(self, row, col, radius=1):
+        """
+        Generate the chunks around a world cell on a background thread.
+
+        Chunks within `radius` chunks of the cell's chunk that are not cached
+        yet are queued, nearest first; the call itself returns immediately.
+        """
+        chunk_row, chunk_col = row // self.chunk_size, col // self.chunk_size
+        wanted = sorted(((dr, dc) for dr in range(-radius, radius + 1) for dc in range(-radius, radius + 1)),
+                        key=lambda offset: abs(offset[0]) + abs(offset[1]))
+        with self._lock:
+            if self._requests is None:
+                self._requests = queue.Queue()
+                threading.Thread(target=self._prefetch_worker, name='maze-world-prefetch', daemon=True).start()
+            for dr, dc in wanted:
+                key = (chunk_row + dr, chunk_col + dc)
+                if key not in self._chunks and key not in self._pending:
+                    self._pending.add(key)
+                    self._requests.put(key)
+
+    def _prefetch_worker(self):
+        """Generate queued chunks until close() is called."""
+        while True:
+            key = self._requests.get()
+            if key is None:
+                return
+            try:
+                with self._lock:
+                    cached = key in self._chunks
+                if not cached:
+                    self._remember(key, self.build_chunk(*key))
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._requests.task_done()
+
+    def wait(self):
+        """Block until every queued prefetch has finished."""
+        if self._requests is not None:
+            self._requests.join()
+
+    def close(self):
+        """Stop the prefetch thread (a later prefetch starts a new one)."""
+        with self._lock:
+            requests, self._requests = self._requests, None
+        if requests is not None:
+            requests.put(None)
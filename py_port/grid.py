@@ -3,6 +3,8 @@ import sys
 import os
 import json
 
+import numpy as np
+
 # Add the current directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -20,6 +22,9 @@ class Grid:
         Cell.WEST: (0, -1)    # West decreases column
     }
     
+    # Column order of the flat neighbor table
+    NEIGHBOR_DIRECTIONS = (Cell.NORTH, Cell.SOUTH, Cell.EAST, Cell.WEST)
+
     def __init__(self, rows, cols):
         """Initialize a new grid with the given dimensions."""
         self.rows = rows
@@ -62,6 +67,148 @@ class Grid:
         self.at(row1, col1).link(direction)
         self.at(row2, col2).link(Cell.OPPOSITES[direction])
     
+    def unlink_cells(self, row1, col1, direction):
+        """Remove the link between the cell at (row1, col1) and its neighbor in the given direction."""
+        if not self.is_valid(row1, col1):
+            return
+
+        row_offset, col_offset = Grid.DIRECTION_OFFSETS[direction]
+        row2 = row1 + row_offset
+        col2 = col1 + col_offset
+
+        if not self.is_valid(row2, col2):
+            return
+
+        # Unlink both cells
+        self.at(row1, col1).unlink(direction)
+        self.at(row2, col2).unlink(Cell.OPPOSITES[direction])
+
+    def neighbor_table(self):
+        """
+        Get the flat-index neighbors of every cell.
+
+        Cell (row, col) has flat index row * cols + col. Column k of the result
+        holds the neighbor in direction NEIGHBOR_DIRECTIONS[k], or -1 where that
+        neighbor would fall outside the grid.
+
+        Returns:
+            An int32 array of shape (rows * cols, 4)
+        """
+        return Grid.neighbor_table_for(self.rows, self.cols)
+
+    def flat_neighbors(self):
+        """
+        Get, for every flat index, the list of (neighbor_index, direction) pairs.
+
+        This is the neighbor table in the form Python generation loops index fastest.
+        """
+        return Grid.flat_neighbors_for(self.rows, self.cols)
+
+    @staticmethod
+    def neighbor_table_for(rows, cols):
+        """neighbor_table() for a grid of the given size, without creating its cells."""
+        index = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+        table = np.full((rows, cols, 4), -1, dtype=np.int32)
+        table[1:, :, 0] = index[:-1, :]   # North
+        table[:-1, :, 1] = index[1:, :]   # South
+        table[:, :-1, 2] = index[:, 1:]   # East
+        table[:, 1:, 3] = index[:, :-1]   # West
+        return table.reshape(-1, 4)
+
+    @staticmethod
+    def flat_neighbors_for(rows, cols):
+        """flat_neighbors() for a grid of the given size, without creating its cells."""
+        directions = Grid.NEIGHBOR_DIRECTIONS
+        return [
+            [(neighbor, direction) for neighbor, direction in zip(row, directions) if neighbor >= 0]
+            for row in Grid.neighbor_table_for(rows, cols).tolist()
+        ]
+
+    def to_links(self):
+        """
+        Export the link flags of every cell as a (rows, cols) uint8 array.
+
+        The array uses the same bit flags as Cell.links, which makes it a compact
+        format for bulk processing and for passing mazes between processes.
+        """
+        values = [cell.links for row in self.cells for cell in row]
+        return np.array(values, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    def _check_links(self, links, row_start):
+        """Validate a link array (or a band of rows at row_start) and return the first row."""
+        if row_start is None:
+            if tuple(links.shape) != (self.rows, self.cols):
+                raise ValueError(f"Link array shape {tuple(links.shape)} does not match grid ({self.rows}, {self.cols})")
+            return 0
+        if links.ndim != 2 or links.shape[1] != self.cols or not 0 <= row_start <= self.rows - links.shape[0]:
+            raise ValueError(f"Link band of shape {tuple(links.shape)} at row {row_start} does not fit grid ({self.rows}, {self.cols})")
+        return row_start
+
+    def apply_links(self, links, row_start=None):
+        """
+        Overwrite the link flags of every cell from a (rows, cols) array.
+
+        With row_start, links may instead be a (k, cols) band of rows that is
+        written to rows row_start .. row_start + k - 1.
+        """
+        row_start = self._check_links(links, row_start)
+        for row_cells, row_links in zip(self.cells[row_start:], links.tolist()):
+            for cell, value in zip(row_cells, row_links):
+                cell.links = value
+
+    def add_links(self, links, row_start=None):
+        """
+        Add (bitwise OR) the link flags of a (rows, cols) array to every cell.
+
+        With row_start, links may instead be a (k, cols) band of rows that is
+        added to rows row_start .. row_start + k - 1.
+        """
+        row_start = self._check_links(links, row_start)
+        for row_cells, row_links in zip(self.cells[row_start:], links.tolist()):
+            for cell, value in zip(row_cells, row_links):
+                cell.links |= value
+
+    @staticmethod
+    def full_links(rows, cols):
+        """
+        Get the link array of a grid in which every cell is linked to all of its neighbors.
+
+        Returns:
+            A (rows, cols) uint8 array of Cell link flags
+        """
+        links = np.zeros((rows, cols), dtype=np.uint8)
+        links[1:, :] |= Cell.NORTH
+        links[:-1, :] |= Cell.SOUTH
+        links[:, :-1] |= Cell.EAST
+        links[:, 1:] |= Cell.WEST
+        return links
+
+    @staticmethod
+    def clip_links(links):
+        """
+        Drop the links of a (rows, cols) array that lead out of the array.
+
+        Windows cut from a larger maze keep links to cells outside the window;
+        clipping them makes the window usable as a standalone grid.
+
+        Returns:
+            A new uint8 array of Cell link flags
+        """
+        links = np.array(links, dtype=np.uint8)
+        links[0, :] &= ~Cell.NORTH & 0xFF
+        links[-1, :] &= ~Cell.SOUTH & 0xFF
+        links[:, -1] &= ~Cell.EAST & 0xFF
+        links[:, 0] &= ~Cell.WEST & 0xFF
+        return links
+
+    @classmethod
+    def from_links(cls, links):
+        """Create a Grid instance from a (rows, cols) array of link flags."""
+        rows, cols = links.shape
+        grid = cls(rows, cols)
+        grid.apply_links(links)
+        return grid
+
     def display(self):
         """Display the maze as ASCII art."""
         # Display the top border
@@ -144,4 +291,4 @@ class Grid:
         """Load a grid from a JSON file."""
         with open(filename, 'r') as f:
             data = json.load(f)
-        return cls.from_dict(data)
\ No newline at end of file
+        return cls.from_dict(data)
@@ -15,10 +15,8 @@ import logging
 logging.basicConfig(level=logging.ERROR)
 
 from grid import Grid
-from algorithms.binary_tree import BinaryTreeMaze
-from algorithms.sidewinder import SidewinderMaze
-from algorithms.aldous_broder import AldousBroderMaze
-from pathfinding.dijkstra import Dijkstra
+from algorithms.registry import GeneratorRegistry
+from pathfinding.solvers import DEFAULT_SOLVER, ENDPOINT_PLACEMENTS, SolverRegistry, place_endpoints
 from visualization import ThemeManager
 
 # Check if asciimatics is available
@@ -40,12 +38,16 @@ def main():
     parser = argparse.ArgumentParser(description='Interactive maze explorer')
     parser.add_argument('--rows', '-r', type=int, default=12, help='Number of rows in the maze')
     parser.add_argument('--cols', '-c', type=int, default=12, help='Number of columns in the maze')
-    parser.add_argument('--algorithm', '-a', choices=['binary', 'sidewinder', 'aldous-broder'],
+    parser.add_argument('--algorithm', '-a', choices=GeneratorRegistry.list_generators(),
                         default='binary', help='Maze generation algorithm to use')
     parser.add_argument('--seed', '-s', type=int, help='Random seed for reproducible mazes')
     parser.add_argument('--theme', '-t', choices=ThemeManager.list_themes(),
                         default='wizardry', help='Visual theme to use')
     parser.add_argument('--show-solution', action='store_true', help='Start with solution visible')
+    parser.add_argument('--solver', choices=SolverRegistry.list_solvers(), default=DEFAULT_SOLVER,
+                        help='Strategy used to find the solution path')
+    parser.add_argument('--endpoints', choices=ENDPOINT_PLACEMENTS, default='corners',
+                        help='Place entrance and exit at the corners or at the ends of the longest path')
     args = parser.parse_args()
 
     # Initialize random seed if provided
@@ -56,17 +58,11 @@ def main():
     grid = Grid(args.rows, args.cols)
 
     # Apply selected maze generation algorithm
-    if args.algorithm == 'binary':
-        BinaryTreeMaze.on(grid)
-    elif args.algorithm == 'sidewinder':
-        SidewinderMaze.on(grid)
-    elif args.algorithm == 'aldous-broder':
-        grid, _ = AldousBroderMaze.on(grid)
+    GeneratorRegistry.generate(args.algorithm, grid, seed=args.seed)
 
     # Calculate solution path
-    entrance = grid.at(grid.rows - 1, 0)  # Bottom left
-    exit = grid.at(0, grid.cols - 1)      # Top right
-    solution = Dijkstra.shortest_path(grid, entrance, exit)
+    entrance, exit = place_endpoints(grid, args.endpoints)
+    solution = SolverRegistry.shortest_path(args.solver, grid, entrance, exit)
 
     # Initialize the renderer and run the interactive UI
     print("Launching interactive maze explorer...")
@@ -79,7 +75,8 @@ def main():
             solution_path=solution, 
             interactive=True,
             show_solution=args.show_solution,
-            current_position=(entrance.row, entrance.col)
+            current_position=(entrance.row, entrance.col),
+            endpoints=(entrance, exit)
         )
     except KeyboardInterrupt:
         print("\nExiting interactive maze explorer.")
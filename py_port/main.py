@@ -2,19 +2,18 @@ import sys
 import argparse
 import os
 import platform
-import random
 
 # Add the current directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from cell import Cell
 from grid import Grid
-from algorithms.binary_tree import BinaryTreeMaze
-from algorithms.sidewinder import SidewinderMaze
-from algorithms.aldous_broder import AldousBroderMaze
+from algorithms.registry import GeneratorRegistry
 from pathfinding.dijkstra import Dijkstra
+from pathfinding.solvers import DEFAULT_SOLVER, ENDPOINT_PLACEMENTS, SolverRegistry, place_endpoints
 
-def display_with_path(grid, path, show_distances=False, distances=None, use_color=True, theme_name="default"):
+def display_with_path(grid, path, show_distances=False, distances=None, use_color=True, theme_name="default",
+                      endpoints=None):
     """
     Display the maze with a highlighted solution path and optionally show distances.
 
@@ -25,6 +24,7 @@ def display_with_path(grid, path, show_distances=False, distances=None, use_colo
         distances: The distances object (if show_distances is True)
         use_color: Whether to use color in the output
         theme_name: The name of the theme to use for rendering
+        endpoints: Optional (entrance, exit) Cells to mark instead of the corners
     """
     # Import here to avoid circular import issues
     from visualization.text_renderer import TextRenderer
@@ -33,7 +33,13 @@ def display_with_path(grid, path, show_distances=False, distances=None, use_colo
     renderer = TextRenderer(theme_name=theme_name, use_color=use_color)
 
     # Render the maze
-    return renderer.render_maze(grid, solution_path=path, show_distances=show_distances, distances=distances)
+    return renderer.render_maze(grid, solution_path=path, show_distances=show_distances, distances=distances,
+                                endpoints=endpoints)
+
+def report_progress(visited, total, iterations):
+    """Print generation progress on a single, continually updated line."""
+    percent = 100.0 * visited / total if total else 100.0
+    print(f"\r{visited}/{total} cells visited ({percent:.0f}%), {iterations} steps", end="", flush=True)
 
 def main():
     """Main entry point for the MazeBuilder program."""
@@ -43,13 +49,25 @@ def main():
     parser = argparse.ArgumentParser(description='Generate and display mazes')
     parser.add_argument('rows', nargs='?', type=int, default=10, help='Number of rows')
     parser.add_argument('cols', nargs='?', type=int, default=10, help='Number of columns')
-    parser.add_argument('--algorithm', '-a', choices=['binary', 'sidewinder', 'aldous-broder'],
+    parser.add_argument('--algorithm', '-a', choices=GeneratorRegistry.list_generators(),
                         default='binary', help='Maze generation algorithm to use')
     parser.add_argument('--solve', action='store_true', help='Display solution path')
+    parser.add_argument('--solver', choices=SolverRegistry.list_solvers(), default=DEFAULT_SOLVER,
+                        help='Strategy used to find the solution path')
+    parser.add_argument('--endpoints', choices=ENDPOINT_PLACEMENTS, default='corners',
+                        help='Place entrance and exit at the corners or at the ends of the longest path')
     parser.add_argument('--distances', action='store_true', help='Show distances from starting point')
     parser.add_argument('--color', action='store_true', help='Use color in output')
     parser.add_argument('--explain', action='store_true', help='Show explanation of the algorithm')
     parser.add_argument('--seed', type=int, help='Random seed for reproducible maze generation')
+    parser.add_argument('--policy', choices=['newest', 'random', 'oldest', 'mixed'],
+                        help='Cell selection policy (growing-tree only)')
+    parser.add_argument('--mix', type=float,
+                        help='Probability of choosing the newest cell with --policy mixed')
+    parser.add_argument('--fill', type=float,
+                        help='Initial probability that a cell is rock (cave only)')
+    parser.add_argument('--iterations', type=int,
+                        help='Number of smoothing passes (cave only)')
     parser.add_argument('--theme', '-t', choices=ThemeManager.list_themes(),
                         default='default', help='Visual theme to use for display')
     args = parser.parse_args()
@@ -60,32 +78,19 @@ def main():
     # Apply selected maze generation algorithm
     seed_info = f" (seed: {args.seed})" if args.seed is not None else ""
 
-    if args.algorithm == 'binary':
-        print(f"Generating maze using Binary Tree algorithm ({args.rows}x{args.cols}){seed_info}...")
-        # Set the random seed if provided
-        if args.seed is not None:
-            random.seed(args.seed)
-        BinaryTreeMaze.on(grid)
-        if args.explain:
-            print("\nBinary Tree Algorithm:")
-            print(BinaryTreeMaze.explain())
-    elif args.algorithm == 'sidewinder':
-        print(f"Generating maze using Sidewinder algorithm ({args.rows}x{args.cols}){seed_info}...")
-        # Set the random seed if provided
-        if args.seed is not None:
-            random.seed(args.seed)
-        SidewinderMaze.on(grid)
-        if args.explain:
-            print("\nSidewinder Algorithm:")
-            print(SidewinderMaze.explain())
-    elif args.algorithm == 'aldous-broder':
-        print(f"Generating maze using Aldous-Broder algorithm ({args.rows}x{args.cols}){seed_info}...")
+    spec = GeneratorRegistry.get(args.algorithm)
+    print(f"Generating maze using {spec.label} algorithm ({args.rows}x{args.cols}){seed_info}...")
+    progress = None
+    if spec.speed > 2:
         print("(This may take longer than other algorithms, especially for larger mazes...)")
-        grid, iterations = AldousBroderMaze.on(grid, seed=args.seed)
-        print(f"Completed in {iterations} iterations.")
-        if args.explain:
-            print("\nAldous-Broder Algorithm:")
-            print(AldousBroderMaze.explain())
+        progress = report_progress
+    GeneratorRegistry.generate(spec.name, grid, seed=args.seed, progress=progress,
+                               **spec.option_values(args))
+    if progress is not None:
+        print()
+    if args.explain:
+        print(f"\n{spec.label} Algorithm:")
+        print(spec.load().explain())
 
     # Always display the basic maze first
     print("\nGenerated Maze:")
@@ -94,24 +99,27 @@ def main():
 
     if args.solve:
         # Define entrance and exit
-        entrance = grid.at(grid.rows-1, 0)  # Bottom left
-        exit = grid.at(0, grid.cols-1)      # Top right
+        entrance, exit = place_endpoints(grid, args.endpoints)
 
         # Find the path from entrance to exit
-        solution = Dijkstra.shortest_path(grid, entrance, exit)
+        solution = SolverRegistry.shortest_path(args.solver, grid, entrance, exit)
 
         if solution:
             # Calculate distances from the exit to show in each cell
             distances = Dijkstra.calculate_distances(grid, exit)
 
-            print(f"Maze Solution (from entrance at bottom left to exit at top right):")
+            if args.endpoints == 'corners':
+                print(f"Maze Solution (from entrance at bottom left to exit at top right):")
+            else:
+                print(f"Maze Solution (between the ends of the longest path):")
             print(display_with_path(
                 grid,
                 solution,
                 show_distances=True,  # Always show distances
                 distances=distances,
                 use_color=args.color,
-                theme_name=args.theme
+                theme_name=args.theme,
+                endpoints=(entrance, exit)
             ))
             print()
 
@@ -0,0 +1,141 @@
+"""
+A* search over flat cell indices.
+
+A* expands cells in order of f = g + h, where g is the number of steps from the
+start and h is a heuristic estimate of the steps left. With an admissible
+heuristic (one that never overestimates) the first path to reach the target is
+a shortest one. The Manhattan distance is admissible in a grid maze; the zero
+heuristic turns A* into Dijkstra's algorithm with unit weights.
+"""
+
+import sys
+import os
+import heapq
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pathfinding.bfs import UNREACHABLE, link_steps
+from pathfinding.search import NO_PREDECESSOR, SearchResult, rebuild_path
+
+
+def manhattan(cols, end):
+    """Get a heuristic h(index) giving the Manhattan distance to end."""
+    end_row, end_col = divmod(end, cols)
+
+    def estimate(index):
+        row, col = divmod(index, cols)
+        return abs(row - end_row) + abs(col - end_col)
+    return estimate
+
+
+def zero(cols, end):
+    """Get a heuristic that always estimates 0 (uniform-cost search)."""
+    return lambda index: 0
+
+
+HEURISTICS = {
+    'manhattan': manhattan,
+    'zero': zero,
+}
+
+
+class AStar:
+    """
+    A* solver for mazes in which every passage has length 1.
+
+    Heap entries are single ints that pack (f, tie-break, index), so pushing
+    and comparing them never builds tuples. Among entries with equal f the one
+    with the larger g, the deeper node, is expanded first: it is closer to the
+    target by the heuristic's estimate, which keeps the search from widening
+    across the many equal-f cells of open areas.
+
+    Time complexity: O(n log n) in the worst case, usually far less with Manhattan
+    Space complexity: O(n) for costs and predecessors
+    """
+
+    @staticmethod
+    def search(links, cols, start, end, heuristic='manhattan'):
+        """
+        Find a shortest path between two cells.
+
+        Args:
+            links: Flat list of link flags (see pathfinding.bfs.flat_links)
+            cols: Number of columns in the maze
+            start: Flat index of the start cell
+            end: Flat index of the target cell
+            heuristic: Name of a heuristic in HEURISTICS, or a factory
+                       heuristic(cols, end) returning an estimate function
+
+        Returns:
+            A SearchResult with the path in flat indices (empty if end cannot
+            be reached) and the number of cells expanded
+        """
+        if isinstance(heuristic, str):
+            if heuristic not in HEURISTICS:
+                raise ValueError(f"Unknown heuristic: {heuristic}. Available heuristics: {', '.join(HEURISTICS)}")
+            heuristic = HEURISTICS[heuristic]
+        estimate = heuristic(cols, end)
+        steps = link_steps(cols)
+        size = len(links)
+
+        # key = (f * (size + 1) + (size - g)) * size + index orders by f, then deeper g, then index
+        depth_span = size + 1
+        costs = [UNREACHABLE] * size
+        predecessors = [NO_PREDECESSOR] * size
+        costs[start] = 0
+        predecessors[start] = start
+        expanded = 0
+
+        frontier = [(estimate(start) * depth_span + size) * size + start]
+        while frontier:
+            key = heapq.heappop(frontier)
+            rest, current = divmod(key, size)
+            cost = size - rest % depth_span
+            if cost != costs[current]:
+                continue  # Stale heap entry
+            expanded += 1
+            if current == end:
+                return SearchResult(rebuild_path(predecessors, start, end), expanded)
+
+            cost += 1
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                if costs[neighbor] < 0 or cost < costs[neighbor]:
+                    costs[neighbor] = cost
+                    predecessors[neighbor] = current
+                    f = cost + estimate(neighbor)
+                    heapq.heappush(frontier, ((f * depth_span + size - cost) * size) + neighbor)
+
+        return SearchResult([], expanded)
+
+    @staticmethod
+    def explain():
+        """
+        Returns a detailed explanation of A* search for educational purposes.
+        """
+        explanation = """
+        A* SEARCH EXPLAINED
+
+        A* is a best-first search guided by an estimate of the distance left.
+
+        1. SCORING:
+           - g: steps taken from the start to a cell
+           - h: heuristic estimate of the steps from the cell to the target
+           - Cells are expanded in order of f = g + h
+
+        2. HEURISTICS:
+           - Manhattan: |row difference| + |column difference|; it never
+             overestimates in a grid, so the path found is a shortest one
+           - Zero: every estimate is 0, which is Dijkstra's algorithm
+
+        3. TIE-BREAKING:
+           - Among cells with the same f, the deeper one (larger g) goes first,
+             so the search keeps following promising corridors
+
+        4. FEATURES AND PATTERNS:
+           - In open areas and caves A* heads straight for the target
+           - In perfect mazes the only path may lead away from the target,
+             so the heuristic helps less
+        """
+        return explanation
@@ -0,0 +1,331 @@
+"""
+Breadth-first search over flat cell indices.
+
+Every passage in a maze has the same length, so distances can be found with a
+breadth-first search instead of a priority queue. The search works on the link
+flags of the cells in a flat list (cell (row, col) has index row * cols + col)
+and keeps distances in an int32 array, so no Cell objects, string keys or heap
+entries are created while it runs.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from grid import Grid
+from pathfinding.search import NO_PREDECESSOR, SearchResult, rebuild_path
+
+# Distance of cells that cannot be reached
+UNREACHABLE = -1
+
+
+def flat_links(grid):
+    """
+    Get the link flags of every cell as a flat list indexed by row * cols + col.
+
+    Links leading out of the grid are dropped, so every link names a real cell.
+    """
+    return Grid.clip_links(grid.to_links()).reshape(-1).tolist()
+
+
+def link_steps(cols):
+    """
+    Get, for every link value 0-15, the flat-index offsets of the linked neighbors.
+
+    Looking the offsets up by link value replaces four bit tests per cell in
+    the search loops.
+    """
+    offsets = ((Cell.NORTH, -cols), (Cell.SOUTH, cols), (Cell.EAST, 1), (Cell.WEST, -1))
+    return [tuple(offset for bit, offset in offsets if value & bit) for value in range(16)]
+
+
+class BreadthFirstSearch:
+    """
+    Breadth-first search engine for mazes in which every passage has length 1.
+
+    Each cell is visited once and each link is followed once, so a search is
+    O(n) with a small constant: one list lookup per cell and one per link.
+    """
+
+    @staticmethod
+    def distance_list(links, cols, start):
+        """
+        Compute distances from a start cell over flat link flags.
+
+        Args:
+            links: Flat list of link flags (see flat_links)
+            cols: Number of columns in the maze
+            start: Flat index of the start cell
+
+        Returns:
+            A list holding each cell's distance, or UNREACHABLE
+        """
+        steps = link_steps(cols)
+        distances = [UNREACHABLE] * len(links)
+        distances[start] = 0
+
+        # The queue is a list that grows while it is being iterated
+        queue = [start]
+        for current in queue:
+            distance = distances[current] + 1
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                if distances[neighbor] < 0:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return distances
+
+    @staticmethod
+    def multi_source(links, cols, sources):
+        """
+        Compute every cell's distance to the nearest of several sources.
+
+        All sources are queued at distance 0, so one search covers them all.
+
+        Args:
+            links: Flat list of link flags (see flat_links)
+            cols: Number of columns in the maze
+            sources: Flat indices of the source cells
+
+        Returns:
+            A (distances, labels) pair of lists: each cell's distance to its
+            nearest source and the position of that source in `sources`, both
+            UNREACHABLE where no source reaches the cell. Ties go to the source
+            whose search front arrives first.
+        """
+        steps = link_steps(cols)
+        distances = [UNREACHABLE] * len(links)
+        labels = [UNREACHABLE] * len(links)
+        queue = []
+        for label, source in enumerate(sources):
+            if distances[source] < 0:
+                distances[source] = 0
+                labels[source] = label
+                queue.append(source)
+
+        for current in queue:
+            distance = distances[current] + 1
+            label = labels[current]
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                if distances[neighbor] < 0:
+                    distances[neighbor] = distance
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+        return distances, labels
+
+    @staticmethod
+    def distances(grid, start):
+        """
+        Compute distances from a start cell to every cell of a grid.
+
+        Args:
+            grid: The maze grid
+            start: The start Cell
+
+        Returns:
+            A (rows, cols) int32 array of distances, UNREACHABLE where a cell
+            cannot be reached
+        """
+        distances = BreadthFirstSearch.distance_list(
+            flat_links(grid), grid.cols, start.row * grid.cols + start.col)
+        return np.array(distances, dtype=np.int32).reshape(grid.rows, grid.cols)
+
+    @staticmethod
+    def sweep(links, cols, start):
+        """
+        Visit every cell reachable from a start cell in breadth-first order.
+
+        Args:
+            links: Flat list of link flags (see flat_links)
+            cols: Number of columns in the maze
+            start: Flat index of the start cell
+
+        Returns:
+            An (order, predecessors) pair: the reached cells in order of
+            distance (so the last one is a farthest cell), and each cell's
+            predecessor (start is its own, unreached cells NO_PREDECESSOR)
+        """
+        steps = link_steps(cols)
+        predecessors = [NO_PREDECESSOR] * len(links)
+        predecessors[start] = start
+        order = [start]
+        for current in order:
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                if predecessors[neighbor] < 0:
+                    predecessors[neighbor] = current
+                    order.append(neighbor)
+        return order, predecessors
+
+    @staticmethod
+    def diameter(links, cols, start=0):
+        """
+        Find a longest shortest path with two breadth-first sweeps.
+
+        The first sweep finds a cell farthest from start; the second finds a
+        cell farthest from that one and rebuilds the path between them from
+        its predecessors. In a perfect maze this is exactly the longest path
+        (the tree's diameter) of start's component; in mazes with loops it is
+        a long path, but not necessarily the longest.
+
+        Returns:
+            A SearchResult whose path runs between the two endpoints, with the
+            number of cells expanded by both sweeps
+        """
+        order, _ = BreadthFirstSearch.sweep(links, cols, start)
+        first = order[-1]
+        order_from_first, predecessors = BreadthFirstSearch.sweep(links, cols, first)
+        second = order_from_first[-1]
+        return SearchResult(rebuild_path(predecessors, first, second), len(order) + len(order_from_first))
+
+    @staticmethod
+    def search(links, cols, start, end):
+        """
+        Find a shortest path between two cells, stopping as soon as end is reached.
+
+        Every cell records the cell it was reached from, so the path is
+        rebuilt from predecessors in O(path length).
+
+        Args:
+            links: Flat list of link flags (see flat_links)
+            cols: Number of columns in the maze
+            start: Flat index of the start cell
+            end: Flat index of the target cell
+
+        Returns:
+            A SearchResult with the path in flat indices (empty if end cannot
+            be reached) and the number of cells expanded
+        """
+        steps = link_steps(cols)
+        predecessors = [NO_PREDECESSOR] * len(links)
+        predecessors[start] = start
+        if start == end:
+            return SearchResult([start], 0)
+
+        queue = [start]
+        for expanded, current in enumerate(queue, 1):
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                if predecessors[neighbor] < 0:
+                    predecessors[neighbor] = current
+                    if neighbor == end:
+                        return SearchResult(rebuild_path(predecessors, start, end), expanded)
+                    queue.append(neighbor)
+        return SearchResult([], len(queue))
+
+    @staticmethod
+    def bidirectional(links, cols, start, end):
+        """
+        Find a shortest path by searching from both ends until the frontiers meet.
+
+        The side with the smaller frontier expands one whole layer at a time.
+        When a layer reaches cells already found from the other side, the
+        layer is finished and the shortest connection found in it is used.
+        Each side explores roughly a disk of half the path length, so a
+        typical query expands about half the cells of a one-sided search.
+
+        Args:
+            links: Flat list of link flags (see flat_links)
+            cols: Number of columns in the maze
+            start: Flat index of the start cell
+            end: Flat index of the target cell
+
+        Returns:
+            A SearchResult with the path in flat indices (empty if end cannot
+            be reached) and the number of cells expanded on both sides
+        """
+        if start == end:
+            return SearchResult([start], 0)
+
+        steps = link_steps(cols)
+        size = len(links)
+        # Distances double as visited markers, predecessors rebuild each half
+        forward = [[UNREACHABLE] * size, [NO_PREDECESSOR] * size, [start]]
+        backward = [[UNREACHABLE] * size, [NO_PREDECESSOR] * size, [end]]
+        forward[0][start] = backward[0][end] = 0
+        forward[1][start], backward[1][end] = start, end
+        expanded = 0
+
+        while forward[2] and backward[2]:
+            if len(forward[2]) <= len(backward[2]):
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+            distances, predecessors, frontier = side
+            other_distances = other[0]
+
+            best, meeting = None, None
+            layer = []
+            for current in frontier:
+                expanded += 1
+                distance = distances[current] + 1
+                for offset in steps[links[current]]:
+                    neighbor = current + offset
+                    if distances[neighbor] < 0:
+                        # A cell seen by both sides is caught by whichever side sees it second
+                        if other_distances[neighbor] >= 0:
+                            total = distance + other_distances[neighbor]
+                            if best is None or total < best:
+                                best, meeting = total, (current, neighbor)
+                        distances[neighbor] = distance
+                        predecessors[neighbor] = current
+                        layer.append(neighbor)
+
+            if meeting is not None:
+                near, far = meeting if side is forward else meeting[::-1]
+                path = rebuild_path(forward[1], start, near)
+                path.extend(reversed(rebuild_path(backward[1], end, far)))
+                return SearchResult(path, expanded)
+            side[2] = layer
+
+        return SearchResult([], expanded)
+
+    @staticmethod
+    def path(grid, start, end):
+        """
+        Find a shortest path between two cells.
+
+        Returns:
+            The list of Cells from start to end, or an empty list if end
+            cannot be reached
+        """
+        cols = grid.cols
+        result = BreadthFirstSearch.search(flat_links(grid), cols, start.row * cols + start.col,
+                                           end.row * cols + end.col)
+        return result.cells(grid)
+
+
+def distance_field(grid, sources):
+    """
+    Compute distances to the nearest of several sources in one breadth-first search.
+
+    Useful for mazes with several exits, nearest-checkpoint hints, or keeping
+    placed objects away from each other.
+
+    Args:
+        grid: The maze grid
+        sources: Source Cells or (row, col) pairs
+
+    Returns:
+        A (distances, labels) pair of (rows, cols) int32 arrays: the distance
+        to the nearest source and that source's position in `sources`, both
+        UNREACHABLE where no source reaches a cell
+    """
+    cols = grid.cols
+    flat_sources = []
+    for source in sources:
+        row, col = (source.row, source.col) if isinstance(source, Cell) else source
+        if not grid.is_valid(row, col):
+            raise IndexError(f"Source position ({row}, {col}) is outside the grid")
+        flat_sources.append(row * cols + col)
+
+    distances, labels = BreadthFirstSearch.multi_source(flat_links(grid), cols, flat_sources)
+    shape = (grid.rows, cols)
+    return (np.array(distances, dtype=np.int32).reshape(shape),
+            np.array(labels, dtype=np.int32).reshape(shape))
@@ -2,12 +2,16 @@ import heapq
 import sys
 import os
 
+import numpy as np
+
 # Add the parent directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from cell import Cell
 from grid import Grid
 from pathfinding.distances import Distances
+from pathfinding.bfs import UNREACHABLE, BreadthFirstSearch, flat_links, link_steps
+from pathfinding.search import NO_PREDECESSOR, SearchResult, rebuild_path
 
 # For debugging
 import logging
@@ -21,120 +25,135 @@ class Dijkstra:
     
     Dijkstra's is a greedy algorithm that always expands the node with the
     smallest known distance from the start.
+
+    In an ordinary maze every passage has length 1, and Dijkstra's algorithm
+    visits cells in the same order as a breadth-first search. Unless a weight
+    function is given, the methods below therefore use the BFS engine in
+    pathfinding.bfs, which works on flat indices and skips the priority queue.
     """
     
     @staticmethod
-    def calculate_distances(grid, start):
-        """Calculate distances from a starting cell to all other cells."""
-        distances = Distances(start)
-        
-        # Priority queue with (distance, cell_key) pairs
-        frontier = [(0, f"{start.row},{start.col}")]
-        
+    def calculate_distances(grid, start, weight=None):
+        """
+        Calculate distances from a starting cell to all other cells.
+
+        Args:
+            grid: The maze grid
+            start: The starting Cell
+            weight: Optional function weight(cell, neighbor) giving the
+                    non-negative cost of a passage; uniform weights when None
+
+        Returns:
+            A Distances object
+        """
+        if weight is None:
+            return Distances.from_array(start, BreadthFirstSearch.distances(grid, start))
+
+        distances = Dijkstra._weighted_distances(grid, start, weight)
+        return Distances.from_array(start, np.array(distances).reshape(grid.rows, grid.cols))
+
+    @staticmethod
+    def _weighted_distances(grid, start, weight):
+        """Run Dijkstra's algorithm with a priority queue of (distance, flat index) pairs."""
+        cols = grid.cols
+        links = flat_links(grid)
+        steps = link_steps(cols)
+        cells = [cell for row in grid.cells for cell in row]
+        distances = [UNREACHABLE] * len(links)
+        start_index = start.row * cols + start.col
+        distances[start_index] = 0
+
+        frontier = [(0, start_index)]
         while frontier:
-            current_distance, current_key = heapq.heappop(frontier)
-            row, col = map(int, current_key.split(','))
-            
-            if not grid.is_valid(row, col):
-                continue
-                
-            cell = grid.at(row, col)
-            cell_distance = distances.get_distance(cell)
-            
+            current_distance, current = heapq.heappop(frontier)
+            if current_distance > distances[current]:
+                continue  # Stale queue entry
+
             # Process each linked neighbor
-            for direction in cell.get_links():
-                offset_row, offset_col = Grid.DIRECTION_OFFSETS[direction]
-                neighbor_row, neighbor_col = row + offset_row, col + offset_col
-                
-                if not grid.is_valid(neighbor_row, neighbor_col):
-                    continue
-                    
-                neighbor = grid.at(neighbor_row, neighbor_col)
-                new_distance = cell_distance + 1
-                neighbor_distance = distances.get_distance(neighbor)
-                
-                if new_distance < neighbor_distance:
-                    distances.set_distance(neighbor, new_distance)
-                    heapq.heappush(frontier, (new_distance, f"{neighbor_row},{neighbor_col}"))
-        
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                new_distance = current_distance + weight(cells[current], cells[neighbor])
+                if distances[neighbor] < 0 or new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    heapq.heappush(frontier, (new_distance, neighbor))
+
         return distances
     
     @staticmethod
-    def shortest_path(grid, start, end):
-        """Find the shortest path between two cells."""
-        # Calculate distances from start to all cells
-        distances = Dijkstra.calculate_distances(grid, start)
-
-        # Debug output
-        logging.debug(f"Calculating shortest path from ({start.row},{start.col}) to ({end.row},{end.col})")
-        logging.debug(f"End cell distance: {distances.get_distance(end)}")
-
-        # If end is unreachable, return empty path
-        if distances.get_distance(end) == sys.maxsize:
-            logging.debug("End cell is unreachable")
-            return []
-
-        # Reconstruct the path from end to start
-        path = []
-        current = end
-        path.append(current)
-
-        # Walk backward from end to start, always choosing the neighbor
-        # with the smallest distance value
-        while current != start:
-            row = current.row
-            col = current.col
-            current_distance = distances.get_distance(current)
-            logging.debug(f"Current cell: ({row},{col}) with distance {current_distance}")
-
-            next_cell = None
-            next_distance = current_distance
-
-            # Check each linked neighbor
-            for direction in current.get_links():
-                offset_row, offset_col = Grid.DIRECTION_OFFSETS[direction]
-                neighbor_row = row + offset_row
-                neighbor_col = col + offset_col
-
-                if not grid.is_valid(neighbor_row, neighbor_col):
-                    continue
-
-                neighbor = grid.at(neighbor_row, neighbor_col)
-                neighbor_distance = distances.get_distance(neighbor)
-
-                logging.debug(f"  Checking neighbor ({neighbor_row},{neighbor_col}) with distance {neighbor_distance}")
-
-                # If this neighbor is closer to the start
-                if neighbor_distance < next_distance:
-                    next_cell = neighbor
-                    next_distance = neighbor_distance
-                    logging.debug(f"    Found better path via ({neighbor_row},{neighbor_col})")
-
-            if next_cell is None:
-                logging.debug("Error: No path found! Breaking out of loop.")
-                break  # Something went wrong
-
-            path.append(next_cell)
-            current = next_cell
-
-        # Reverse the path so it goes from start to end
-        path.reverse()
-        logging.debug(f"Path length: {len(path)}")
-        return path
+    def shortest_path(grid, start, end, weight=None):
+        """
+        Find the shortest path between two cells.
+
+        The search stops as soon as the end cell is settled and the path is
+        rebuilt from recorded predecessors.
+
+        Args:
+            grid: The maze grid
+            start: The starting Cell
+            end: The target Cell
+            weight: Optional passage cost function (see calculate_distances)
+
+        Returns:
+            The list of Cells from start to end, or an empty list if end is unreachable
+        """
+        if weight is None:
+            return BreadthFirstSearch.path(grid, start, end)
+        cols = grid.cols
+        result = Dijkstra.search(grid, start.row * cols + start.col, end.row * cols + end.col, weight)
+        return result.cells(grid)
+
+    @staticmethod
+    def search(grid, start, end, weight):
+        """
+        Run Dijkstra's algorithm between two flat indices with early exit.
+
+        Args:
+            grid: The maze grid
+            start: Flat index of the start cell
+            end: Flat index of the target cell
+            weight: Function weight(cell, neighbor) giving the non-negative
+                    cost of a passage
+
+        Returns:
+            A SearchResult (path in flat indices, cells expanded)
+        """
+        links = flat_links(grid)
+        steps = link_steps(grid.cols)
+        cells = [cell for row in grid.cells for cell in row]
+        distances = [UNREACHABLE] * len(links)
+        predecessors = [NO_PREDECESSOR] * len(links)
+        distances[start] = 0
+        predecessors[start] = start
+        expanded = 0
+
+        frontier = [(0, start)]
+        while frontier:
+            current_distance, current = heapq.heappop(frontier)
+            if current_distance > distances[current]:
+                continue  # Stale queue entry
+            expanded += 1
+            if current == end:
+                return SearchResult(rebuild_path(predecessors, start, end), expanded)
+
+            for offset in steps[links[current]]:
+                neighbor = current + offset
+                new_distance = current_distance + weight(cells[current], cells[neighbor])
+                if distances[neighbor] < 0 or new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current
+                    heapq.heappush(frontier, (new_distance, neighbor))
+
+        return SearchResult([], expanded)
     
     @staticmethod
     def longest_path(grid):
-        """Find the longest shortest path (solution) in the maze."""
-        # Start from the top-left corner
-        start = grid.at(0, 0)
-        
-        # Find the farthest cell from the start
-        distances = Dijkstra.calculate_distances(grid, start)
-        farthest = distances.get_max_cell(grid)
-        
-        # Now find the farthest cell from that cell
-        distances = Dijkstra.calculate_distances(grid, farthest)
-        end = distances.get_max_cell(grid)
-        
-        # Return the path between these two maximally distant cells
-        return Dijkstra.shortest_path(grid, farthest, end)
\ No newline at end of file
+        """
+        Find the longest shortest path (solution) in the maze.
+
+        Two breadth-first sweeps from the top-left corner find the endpoints
+        (see BreadthFirstSearch.diameter); the result is exact for perfect mazes.
+
+        Returns:
+            The list of Cells between the two most distant cells
+        """
+        return BreadthFirstSearch.diameter(flat_links(grid), grid.cols, 0).cells(grid)
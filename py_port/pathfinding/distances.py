@@ -1,41 +1,90 @@
 import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pathfinding.bfs import UNREACHABLE
 
 class Distances:
     """
     Tracks distances from a starting cell to other cells in the maze.
     Acts like a specialized dictionary mapping cells to their distances.
+
+    Distances are stored in a (rows, cols) NumPy array indexed by cell
+    position, with UNREACHABLE (-1) for cells that have no distance. Lookups
+    are plain array indexing and get_max_cell is a single argmax. Cells
+    without a distance still read as sys.maxsize through get_distance.
     """
-    
-    def __init__(self, start):
-        """Initialize with a starting cell that has distance 0."""
-        self.cells = {}  # Dictionary mapping cell keys to distances
+
+    def __init__(self, start, rows=None, cols=None, array=None):
+        """
+        Initialize with a starting cell that has distance 0.
+
+        Args:
+            start: The root cell
+            rows: Number of rows of the maze, if known
+            cols: Number of columns of the maze, if known; without a shape the
+                  array grows as distances are set
+            array: Optional existing (rows, cols) array of distances to wrap
+                   (int32 from unit-weight searches, any numeric dtype otherwise)
+        """
         self.root = start
-        self.cells[self._key(start.row, start.col)] = 0
-    
-    def _key(self, row, col):
-        """Create a string key from row and column coordinates."""
-        return f"{row},{col}"
-    
+        if array is not None:
+            self.array = array
+        else:
+            shape = (rows if rows is not None else start.row + 1,
+                     cols if cols is not None else start.col + 1)
+            self.array = np.full(shape, UNREACHABLE, dtype=np.int32)
+            self.array[start.row, start.col] = 0
+
+    @classmethod
+    def from_array(cls, start, array):
+        """
+        Create a Distances object from a (rows, cols) array of distances.
+
+        Negative entries mark unreachable cells. The array is used as is, not copied.
+        """
+        return cls(start, array=array)
+
     def get_distance(self, cell):
         """Get the distance to the given cell (returns max int if not found)."""
-        key = self._key(cell.row, cell.col)
-        return self.cells.get(key, sys.maxsize)
-    
+        row, col = cell.row, cell.col
+        rows, cols = self.array.shape
+        if 0 <= row < rows and 0 <= col < cols:
+            distance = self.array.item(row, col)
+            if distance >= 0:
+                return distance
+        return sys.maxsize
+
     def set_distance(self, cell, distance):
         """Set the distance for the given cell."""
-        key = self._key(cell.row, cell.col)
-        self.cells[key] = distance
-    
+        row, col = cell.row, cell.col
+        rows, cols = self.array.shape
+        if row >= rows or col >= cols:
+            # Grow geometrically so repeated sets stay amortized O(1)
+            grown = np.full((max(row + 1, 2 * rows), max(col + 1, 2 * cols)), UNREACHABLE, dtype=self.array.dtype)
+            grown[:rows, :cols] = self.array
+            self.array = grown
+        self.array[row, col] = distance
+
+    @property
+    def cells(self):
+        """Dictionary of "row,col" keys to distances for every cell that has one."""
+        rows, cols = np.nonzero(self.array >= 0)
+        values = self.array[rows, cols].tolist()
+        return {f"{row},{col}": value for row, col, value in zip(rows.tolist(), cols.tolist(), values)}
+
     def get_max_cell(self, grid):
         """Get the cell with the maximum distance (farthest from root)."""
-        max_distance = 0
-        max_cell = self.root
-        
-        for key, distance in self.cells.items():
-            if distance > max_distance:
-                row, col = map(int, key.split(','))
-                if grid.is_valid(row, col):
-                    max_cell = grid.at(row, col)
-                    max_distance = distance
-        
-        return max_cell
\ No newline at end of file
+        distances = self.array[:grid.rows, :grid.cols]
+        if distances.size == 0:
+            return self.root
+
+        index = int(np.argmax(distances))
+        row, col = divmod(index, distances.shape[1])
+        if distances[row, col] <= 0:
+            return self.root
+        return grid.at(row, col)
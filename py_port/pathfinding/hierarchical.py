@@ -0,0 +1,301 @@
+"""
+Hierarchical pathfinding (HPA*) for very large mazes.
+
+The maze is cut into square clusters. Passages that cross the border between
+two clusters are grouped into runs of side-by-side crossings whose cells are
+also linked along the border. The middle crossing of each run (both end
+crossings of a long run) becomes an entrance: a pair of abstract nodes, one on
+each side, joined by an edge of length 1.
+Inside a cluster the abstract nodes are joined by edges whose lengths are
+found with breadth-first searches confined to the cluster. A query searches
+this abstract graph with A* and then refines only the clusters the route
+passes through into cells.
+"""
+
+import sys
+import os
+import heapq
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cell import Cell
+from grid import Grid
+from pathfinding.bfs import UNREACHABLE, BreadthFirstSearch
+from pathfinding.search import SearchResult
+
+# Runs of crossings at least this long get an entrance at each end
+LONG_RUN = 6
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* solver with lazily computed, cached cluster distances.
+
+    Entrances are found for the whole maze up front with array operations.
+    The distances between the entrances of a cluster are computed the first
+    time a search reaches the cluster and then cached, so repeated queries
+    only pay for clusters no earlier query has touched; precompute() fills the
+    cache for every cluster at once.
+
+    Paths are exact (shortest paths) on perfect mazes: a run of two crossings
+    would close a loop, so every crossing is its own entrance. Where a run of
+    crossings shares an entrance, as on braided mazes and across the wide
+    open borders of caves, paths can be slightly longer than the shortest.
+
+    Example:
+        finder = HierarchicalPathfinder.from_grid(grid, cluster_size=32)
+        result = finder.search(start, end)     # flat indices row * cols + col
+
+    Time complexity: O(n) to find entrances, O(c * e) per cluster of c cells
+                     with e entrances, then A* over the abstract graph per query
+    Space complexity: O(e^2) per cached cluster plus the maze's link array
+    """
+
+    def __init__(self, links, cluster_size=32):
+        """
+        Find the entrances of a maze.
+
+        Args:
+            links: A (rows, cols) array of Cell link flags
+            cluster_size: Side of a cluster in cells
+        """
+        if cluster_size < 1:
+            raise ValueError("cluster_size must be positive")
+        self.links = Grid.clip_links(links)
+        self.rows, self.cols = self.links.shape
+        self.cluster_size = cluster_size
+        self.expanded_clusters = 0
+
+        # Abstract nodes by flat cell index, their cross-border neighbors,
+        # and the nodes of every cluster
+        self.crossings = {}
+        self.cluster_nodes = {}
+        self._intra = {}
+        for first, second in self._find_entrances():
+            for a, b in ((first, second), (second, first)):
+                if a not in self.crossings:
+                    self.crossings[a] = []
+                    self.cluster_nodes.setdefault(self.cluster_of(a), []).append(a)
+                self.crossings[a].append(b)
+
+    @classmethod
+    def from_grid(cls, grid, cluster_size=32):
+        """Build a pathfinder for the maze in a grid."""
+        return cls(grid.to_links(), cluster_size)
+
+    def cluster_of(self, cell):
+        """Get the (cluster row, cluster col) of a flat cell index."""
+        row, col = divmod(cell, self.cols)
+        return row // self.cluster_size, col // self.cluster_size
+
+    def _find_entrances(self):
+        """
+        Pick entrances from the runs of linked crossings along each cluster border.
+
+        A run is entered through its middle crossing, or through both end
+        crossings if it is at least LONG_RUN crossings long.
+
+        Returns:
+            A list of (cell, cell) pairs of flat indices, one on each side
+        """
+        size, cols = self.cluster_size, self.cols
+        pairs = []
+        for axis in (0, 1):
+            # Vertical borders (axis 0) are crossed eastward and run along rows;
+            # horizontal ones are crossed southward and run along columns
+            if axis == 0:
+                border = np.arange(size - 1, cols - 1, size)
+                near_links, far_links = self.links[:, border], self.links[:, border + 1]
+                across, along_link = Cell.EAST, Cell.SOUTH
+                along_count = self.rows
+            else:
+                border = np.arange(size - 1, self.rows - 1, size)
+                near_links, far_links = self.links[border, :].T, self.links[border + 1, :].T
+                across, along_link = Cell.SOUTH, Cell.EAST
+                along_count = cols
+            if not len(border):
+                continue
+
+            # A run continues to the next crossing only if the cells on both
+            # sides are linked along the border and no cluster boundary intervenes
+            crossing = (near_links & across) != 0
+            continues = (crossing[:-1] & crossing[1:]
+                         & ((near_links[:-1] & far_links[:-1] & along_link) != 0)
+                         & (np.arange(1, along_count)[:, None] % size != 0))
+            starts = crossing.copy()
+            starts[1:] &= ~continues
+            ends = crossing.copy()
+            ends[:-1] &= ~continues
+            border_index, run_start = np.nonzero(starts.T)
+            run_end = np.nonzero(ends.T)[1]
+            # Short runs are entered in the middle, long ones at both ends
+            long_run = run_end - run_start + 1 >= LONG_RUN
+            middle = np.concatenate([((run_start + run_end) // 2)[~long_run],
+                                     run_start[long_run], run_end[long_run]])
+            position = border[np.concatenate([border_index[~long_run],
+                                              border_index[long_run], border_index[long_run]])]
+            if axis == 0:
+                near = middle * cols + position
+                far = near + 1
+            else:
+                near = position * cols + middle
+                far = near + cols
+            pairs.extend(zip(near.tolist(), far.tolist()))
+        return pairs
+
+    def _cluster_block(self, cluster):
+        """
+        Get the bounds and flat links of a cluster, confined to the cluster.
+
+        Returns:
+            A (top, left, width, flat links) tuple
+        """
+        size = self.cluster_size
+        top, left = cluster[0] * size, cluster[1] * size
+        block = Grid.clip_links(self.links[top:top + size, left:left + size])
+        return top, left, block.shape[1], block.reshape(-1).tolist()
+
+    def _cluster_distances(self, cluster):
+        """
+        Get (and cache) the distances between the abstract nodes of a cluster.
+
+        Returns:
+            A dict mapping each node to a list of (node, distance) pairs
+        """
+        edges = self._intra.get(cluster)
+        if edges is not None:
+            return edges
+        nodes = self.cluster_nodes.get(cluster, [])
+        edges = {node: [] for node in nodes}
+        if len(nodes) > 1:
+            top, left, width, block = self._cluster_block(cluster)
+            local = [(node // self.cols - top) * width + node % self.cols - left for node in nodes]
+            for index, node in enumerate(nodes):
+                distances = BreadthFirstSearch.distance_list(block, width, local[index])
+                for other in range(index + 1, len(nodes)):
+                    distance = distances[local[other]]
+                    if distance != UNREACHABLE:
+                        edges[node].append((nodes[other], distance))
+                        edges[nodes[other]].append((node, distance))
+        self._intra[cluster] = edges
+        self.expanded_clusters += 1
+        return edges
+
+    def precompute(self):
+        """Compute and cache the node distances of every cluster that has entrances."""
+        for cluster in self.cluster_nodes:
+            self._cluster_distances(cluster)
+
+    def _local_distances(self, cell):
+        """
+        Get the distances from a cell to the abstract nodes of its cluster.
+
+        Returns:
+            A (distances, to_local) pair: the cluster-confined distance list
+            indexed by local cell, and a function from flat to local indices
+        """
+        top, left, width, block = self._cluster_block(self.cluster_of(cell))
+        cols = self.cols
+
+        def to_local(index):
+            return (index // cols - top) * width + index % cols - left
+
+        return BreadthFirstSearch.distance_list(block, width, to_local(cell)), to_local
+
+    def search(self, start, end):
+        """
+        Find a path between two cells through the abstract graph.
+
+        Args:
+            start: Flat index of the start cell
+            end: Flat index of the target cell
+
+        Returns:
+            A SearchResult with the path in flat indices (empty if end cannot
+            be reached) and the number of abstract nodes expanded
+        """
+        if start == end:
+            return SearchResult([start], 0)
+
+        cols = self.cols
+        start_cluster, end_cluster = self.cluster_of(start), self.cluster_of(end)
+        start_distances, start_local = self._local_distances(start)
+        end_distances, end_local = self._local_distances(end)
+        exits = {node: end_distances[end_local(node)] for node in self.cluster_nodes.get(end_cluster, [])
+                 if end_distances[end_local(node)] != UNREACHABLE}
+
+        end_row, end_col = divmod(end, cols)
+
+        def estimate(cell):
+            row, col = divmod(cell, cols)
+            return abs(row - end_row) + abs(col - end_col)
+
+        # Abstract A*: the start seeds every node it reaches inside its cluster,
+        # and end is reached from the nodes that reach it inside its cluster
+        costs, parents = {}, {}
+        frontier = []
+        if start_cluster == end_cluster and start_distances[start_local(end)] != UNREACHABLE:
+            costs[end] = start_distances[start_local(end)]
+            parents[end] = start
+            heapq.heappush(frontier, (costs[end], -costs[end], end))
+        for node in self.cluster_nodes.get(start_cluster, []):
+            distance = start_distances[start_local(node)]
+            if distance != UNREACHABLE and (node not in costs or distance < costs[node]):
+                costs[node] = distance
+                parents[node] = start
+                heapq.heappush(frontier, (distance + estimate(node), -distance, node))
+
+        # End is walled into its cluster: only a direct path within one cluster can reach it
+        if not exits and end not in costs:
+            return SearchResult([], 0)
+
+        expanded = 0
+        while frontier:
+            _, negative_cost, current = heapq.heappop(frontier)
+            cost = -negative_cost
+            if cost != costs[current]:
+                continue  # Stale heap entry
+            if current == end:
+                return SearchResult(self._refine(start, end, parents), expanded)
+            expanded += 1
+
+            neighbors = [(other, 1) for other in self.crossings[current]]
+            neighbors.extend(self._cluster_distances(self.cluster_of(current))[current])
+            if current in exits:
+                neighbors.append((end, exits[current]))
+            for neighbor, length in neighbors:
+                new_cost = cost + length
+                if neighbor not in costs or new_cost < costs[neighbor]:
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = current
+                    heapq.heappush(frontier, (new_cost + estimate(neighbor), -new_cost, neighbor))
+
+        return SearchResult([], expanded)
+
+    def _refine(self, start, end, parents):
+        """Expand the abstract route into cells, searching only the clusters it passes through."""
+        route = [end]
+        while route[-1] != start:
+            route.append(parents[route[-1]])
+        route.reverse()
+
+        path = [start]
+        for a, b in zip(route, route[1:]):
+            if self.cluster_of(a) != self.cluster_of(b):
+                path.append(b)  # Entrance crossing
+                continue
+            top, left, width, block = self._cluster_block(self.cluster_of(a))
+            cols = self.cols
+            local_a = (a // cols - top) * width + a % cols - left
+            local_b = (b // cols - top) * width + b % cols - left
+            segment = BreadthFirstSearch.search(block, width, local_a, local_b).path
+            path.extend((top + index // width) * cols + left + index % width for index in segment[1:])
+        return path
+
+    def path_cells(self, grid, start, end):
+        """Find a path between two Cells of the grid as a list of Cells."""
+        cols = self.cols
+        return self.search(start.row * cols + start.col, end.row * cols + end.col).cells(grid)
@@ -0,0 +1,270 @@
+"""
+Corridor-contracted junction graph of a maze.
+
+Most cells of a maze link to exactly two neighbors, so a cell-by-cell search
+spends most of its time walking corridors. The junction graph keeps only the
+cells whose degree is not 2 (junctions, dead ends and isolated cells) as nodes
+and replaces every corridor between them with one weighted edge. Searches run
+on the small graph and corridors are expanded back into cells only for the
+path that is returned.
+"""
+
+import sys
+import os
+import heapq
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pathfinding.bfs import UNREACHABLE, flat_links, link_steps
+from pathfinding.search import SearchResult
+
+# Marker for cells that are nodes rather than corridor cells, and vice versa
+NOT_A_NODE = -1
+NOT_IN_CORRIDOR = -1
+
+# Number of links for every link value 0-15
+_DEGREE = [bin(value).count('1') for value in range(16)]
+
+
+class JunctionGraph:
+    """
+    Weighted graph of a maze's junctions and dead ends.
+
+    Edge e joins nodes edge_u[e] and edge_v[e] through the corridor cells
+    corridor[corridor_start[e]:corridor_start[e + 1]], listed from edge_u[e]
+    towards edge_v[e]; its length is the number of corridor cells plus one.
+    Every corridor cell knows its edge (edge_of) and its 1-based position
+    along it (position), so searches can start and end anywhere. A ring of
+    degree-2 cells with no junction gets one of its cells as a node.
+
+    Example:
+        graph = JunctionGraph.from_grid(grid)
+        result = graph.search(start, end)      # flat indices row * cols + col
+
+    Time complexity: O(n) to build, O(m log m) per query for m nodes
+    Space complexity: O(n) for the cell mapping, O(m) for the graph
+    """
+
+    def __init__(self, links, cols):
+        """
+        Contract the corridors of a maze.
+
+        Args:
+            links: Flat list of link flags (see pathfinding.bfs.flat_links)
+            cols: Number of columns in the maze
+        """
+        self.cols = cols
+        self.links = links
+        size = len(links)
+        steps = link_steps(cols)
+        self._steps = steps
+
+        node_of = [NOT_A_NODE] * size
+        nodes = [cell for cell in range(size) if _DEGREE[links[cell]] != 2]
+        for index, cell in enumerate(nodes):
+            node_of[cell] = index
+
+        self.edge_u, self.edge_v, self.edge_length = [], [], []
+        self.corridor, self.corridor_start = [], [0]
+        self.edge_of = [NOT_IN_CORRIDOR] * size
+        self.position = [0] * size
+        self.nodes = nodes
+        self.node_of = node_of
+        self.adjacency = [[] for _ in nodes]
+
+        for cell in nodes:
+            self._contract_from(cell)
+
+        # Rings of corridor cells with no node: promote one cell per ring
+        for cell in range(size):
+            if node_of[cell] < 0 and self.edge_of[cell] < 0 and links[cell]:
+                node_of[cell] = len(nodes)
+                nodes.append(cell)
+                self.adjacency.append([])
+                self._contract_from(cell)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Build the junction graph of a grid."""
+        return cls(flat_links(grid), grid.cols)
+
+    @property
+    def node_count(self):
+        """Number of nodes (junctions, dead ends, isolated cells)."""
+        return len(self.nodes)
+
+    @property
+    def edge_count(self):
+        """Number of corridor edges."""
+        return len(self.edge_u)
+
+    def _contract_from(self, start):
+        """Walk every corridor leaving a node and record the edges found first from this end."""
+        links, steps, node_of = self.links, self._steps, self.node_of
+        for offset in steps[links[start]]:
+            previous, current = start, start + offset
+            cells = []
+            while node_of[current] < 0:
+                cells.append(current)
+                first, second = steps[links[current]]
+                step = first if current + first != previous else second
+                previous, current = current, current + step
+
+            # Each corridor is walked from both ends; keep one walk
+            if current < start or (current == start and cells and cells[0] > cells[-1]):
+                continue
+            edge = len(self.edge_u)
+            for position, cell in enumerate(cells, 1):
+                self.edge_of[cell] = edge
+                self.position[cell] = position
+            self.edge_u.append(start)
+            self.edge_v.append(current)
+            self.edge_length.append(len(cells) + 1)
+            self.corridor.extend(cells)
+            self.corridor_start.append(len(self.corridor))
+            if current != start:
+                self.adjacency[node_of[start]].append((node_of[current], len(cells) + 1, edge))
+                self.adjacency[node_of[current]].append((node_of[start], len(cells) + 1, edge))
+
+    def _anchors(self, cell):
+        """
+        Get the nodes a cell reaches along its own corridor.
+
+        Returns:
+            A list of (node id, cost, toward_u) entries; a node itself gives
+            [(its id, 0, True)]
+        """
+        node = self.node_of[cell]
+        if node >= 0:
+            return [(node, 0, True)]
+        edge = self.edge_of[cell]
+        if edge < 0:
+            return []
+        position = self.position[cell]
+        return [(self.node_of[self.edge_u[edge]], position, True),
+                (self.node_of[self.edge_v[edge]], self.edge_length[edge] - position, False)]
+
+    def _corridor_cells(self, edge, from_u):
+        """Get an edge's corridor cells in the direction of travel."""
+        cells = self.corridor[self.corridor_start[edge]:self.corridor_start[edge + 1]]
+        return cells if from_u else cells[::-1]
+
+    def _partial(self, cell, toward_u):
+        """Get the corridor cells from a cell (included) to the end of its edge (excluded)."""
+        if self.node_of[cell] >= 0:
+            return [cell]
+        edge = self.edge_of[cell]
+        index = self.corridor_start[edge] + self.position[cell] - 1
+        if toward_u:
+            return self.corridor[index:self.corridor_start[edge] - 1 if self.corridor_start[edge] else None:-1]
+        return self.corridor[index:self.corridor_start[edge + 1]]
+
+    def search(self, start, end):
+        """
+        Find a shortest path between two cells with Dijkstra's algorithm on the graph.
+
+        Args:
+            start: Flat index of the start cell
+            end: Flat index of the target cell
+
+        Returns:
+            A SearchResult with the path in flat indices (empty if end cannot
+            be reached) and the number of graph nodes expanded
+        """
+        if start == end:
+            return SearchResult([start], 0)
+
+        count = len(self.nodes)
+        distances = [UNREACHABLE] * count
+        parent_node = [NOT_A_NODE] * count
+        parent_edge = [NOT_IN_CORRIDOR] * count
+        seed_side = [True] * count
+        frontier = []
+        for node, cost, toward_u in self._anchors(start):
+            if distances[node] < 0 or cost < distances[node]:
+                distances[node] = cost
+                seed_side[node] = toward_u
+                heapq.heappush(frontier, cost * count + node)
+
+        targets = {}
+        for node, cost, toward_u in self._anchors(end):
+            if node not in targets or cost < targets[node][0]:
+                targets[node] = (cost, toward_u)
+
+        # Both cells on the same corridor: walking straight along it is a candidate
+        best, best_node = None, None
+        edge = self.edge_of[start]
+        if edge >= 0 and edge == self.edge_of[end]:
+            best = abs(self.position[start] - self.position[end])
+
+        expanded = 0
+        while frontier:
+            distance, node = divmod(heapq.heappop(frontier), count)
+            if distance != distances[node]:
+                continue  # Stale heap entry
+            if best is not None and distance >= best:
+                break
+            expanded += 1
+            if node in targets:
+                total = distance + targets[node][0]
+                if best is None or total < best:
+                    best, best_node = total, node
+            for neighbor, length, via in self.adjacency[node]:
+                new_distance = distance + length
+                if distances[neighbor] < 0 or new_distance < distances[neighbor]:
+                    distances[neighbor] = new_distance
+                    parent_node[neighbor] = node
+                    parent_edge[neighbor] = via
+                    heapq.heappush(frontier, new_distance * count + neighbor)
+
+        if best is None:
+            return SearchResult([], expanded)
+        if best_node is None:
+            return SearchResult(self._along_corridor(start, end), expanded)
+        return SearchResult(self._expand(start, end, best_node, parent_node, parent_edge,
+                                         seed_side, targets[best_node][1]), expanded)
+
+    def _along_corridor(self, start, end):
+        """Get the cells between two cells of the same corridor."""
+        edge = self.edge_of[start]
+        base = self.corridor_start[edge] - 1
+        first, last = base + self.position[start], base + self.position[end]
+        if first <= last:
+            return self.corridor[first:last + 1]
+        return self.corridor[first:last - 1 if last else None:-1]
+
+    def _expand(self, start, end, last, parent_node, parent_edge, seed_side, end_toward_u):
+        """Turn the chain of graph nodes ending at `last` into the full list of cells."""
+        chain = [last]
+        while parent_node[chain[-1]] >= 0:
+            chain.append(parent_node[chain[-1]])
+        chain.reverse()
+
+        nodes = self.nodes
+        path = self._partial(start, seed_side[chain[0]])
+        if path[-1] != nodes[chain[0]]:
+            path.append(nodes[chain[0]])
+        for node in chain[1:]:
+            edge = parent_edge[node]
+            path.extend(self._corridor_cells(edge, self.edge_u[edge] == path[-1]))
+            path.append(nodes[node])
+
+        if end != nodes[last]:
+            path.extend(reversed(self._partial(end, end_toward_u)))
+        return path
+
+    def path_cells(self, grid, start, end):
+        """Find a shortest path between two Cells of the grid as a list of Cells."""
+        cols = self.cols
+        return self.search(start.row * cols + start.col, end.row * cols + end.col).cells(grid)
+
+    def stats(self):
+        """Get the size of the graph compared to the maze."""
+        cells = len(self.links)
+        return {
+            'cells': cells,
+            'nodes': self.node_count,
+            'edges': self.edge_count,
+            'contraction': cells / self.node_count if self.node_count else float('inf'),
+        }
@@ -0,0 +1,201 @@
+"""
+Constant-time distance queries on perfect mazes.
+
+A perfect maze is a tree, so the distance between two cells is
+depth(a) + depth(b) - 2 * depth(lca(a, b)), where lca is their lowest common
+ancestor once the tree is rooted. The lowest common ancestor is the shallowest
+cell visited between a and b on an Euler tour of the tree, which a sparse table
+of range minima answers with two lookups.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid import Grid
+from pathfinding.bfs import link_steps
+
+# Parent of the root cell
+NO_PARENT = -1
+
+
+class TreeDistanceOracle:
+    """
+    Distance and path oracle for perfect mazes.
+
+    Preprocessing roots the maze, records an Euler tour of its 2n - 1 visits
+    with each cell's depth and first visit, and builds a sparse table whose
+    level k holds the shallowest cell of every tour window of length 2**k.
+    After that distance() is O(1), path() is O(path length), and distances()
+    answers whole arrays of queries with array operations.
+
+    Example:
+        oracle = TreeDistanceOracle.from_grid(grid)
+        oracle.distance(0, grid.rows * grid.cols - 1)
+
+    Time complexity: O(n log n) preprocessing, O(1) per distance query
+    Space complexity: O(n log n) for the sparse table (int32 cell indices)
+    """
+
+    def __init__(self, links, root=0):
+        """
+        Preprocess a perfect maze.
+
+        Args:
+            links: A (rows, cols) array of Cell link flags; links leading out
+                   of the array are ignored
+            root: Flat index of the cell to root the tree at
+
+        Raises:
+            ValueError: If the maze is not perfect (it has a loop or cells
+                        that cannot be reached)
+        """
+        links = np.asarray(links)
+        self.rows, self.cols = links.shape
+        size = self.rows * self.cols
+        flat = Grid.clip_links(links).reshape(-1).tolist()
+        steps = link_steps(self.cols)
+
+        parents = [NO_PARENT] * size
+        depths = [0] * size
+        first = [-1] * size
+        next_step = [0] * size
+        tour = [root]
+        tour_depths = [0]
+        first[root] = 0
+
+        # Iterative depth-first walk: a cell is appended when entered and
+        # again after each child returns
+        stack = [root]
+        while stack:
+            cell = stack[-1]
+            offsets = steps[flat[cell]]
+            index = next_step[cell]
+            while index < len(offsets) and cell + offsets[index] == parents[cell]:
+                index += 1
+            if index < len(offsets):
+                next_step[cell] = index + 1
+                child = cell + offsets[index]
+                if first[child] >= 0:
+                    raise ValueError("Maze is not perfect: it contains a loop")
+                parents[child] = cell
+                depths[child] = depths[cell] + 1
+                first[child] = len(tour)
+                tour.append(child)
+                tour_depths.append(depths[child])
+                stack.append(child)
+            else:
+                stack.pop()
+                if stack:
+                    tour.append(stack[-1])
+                    tour_depths.append(depths[stack[-1]])
+
+        if len(tour) != 2 * size - 1:
+            raise ValueError("Maze is not perfect: some cells cannot be reached")
+
+        self.root = root
+        self.parents = parents
+        self.depths = depths
+        self.first = first
+        self._depth_array = np.array(depths, dtype=np.int32)
+        self._first_array = np.array(first, dtype=np.int32)
+        self.table = self._sparse_table(np.array(tour, dtype=np.int32), np.array(tour_depths, dtype=np.int32))
+
+    @classmethod
+    def from_grid(cls, grid, root=(0, 0)):
+        """
+        Preprocess the perfect maze in a grid.
+
+        Args:
+            grid: The maze grid
+            root: (row, col) of the cell to root the tree at
+        """
+        return cls(grid.to_links(), root[0] * grid.cols + root[1])
+
+    @staticmethod
+    def _sparse_table(tour, tour_depths):
+        """
+        Build the range-minimum table over an Euler tour.
+
+        Returns:
+            A (levels, len(tour)) int32 array; entry [k, i] is the shallowest
+            cell among tour[i:i + 2**k] (entries past the end are unused)
+        """
+        length = len(tour)
+        levels = max(1, length.bit_length())
+        table = np.zeros((levels, length), dtype=np.int32)
+        table[0] = tour
+        best_depths = tour_depths.copy()
+        for level in range(1, levels):
+            half = 1 << (level - 1)
+            count = length - (1 << level) + 1
+            left, right = best_depths[:count], best_depths[half:half + count]
+            take_right = right < left
+            table[level, :count] = np.where(take_right, table[level - 1, half:half + count], table[level - 1, :count])
+            best_depths = np.where(take_right, right, left)
+        return table
+
+    def lca(self, a, b):
+        """Get the flat index of the lowest common ancestor of two cells."""
+        low, high = self.first[a], self.first[b]
+        if low > high:
+            low, high = high, low
+        level = (high - low + 1).bit_length() - 1
+        left = self.table.item(level, low)
+        right = self.table.item(level, high - (1 << level) + 1)
+        return left if self.depths[left] <= self.depths[right] else right
+
+    def distance(self, a, b):
+        """Get the number of steps between two cells given by flat index."""
+        return self.depths[a] + self.depths[b] - 2 * self.depths[self.lca(a, b)]
+
+    def distances(self, a, b):
+        """
+        Answer many distance queries at once.
+
+        Args:
+            a: Array of flat indices
+            b: Array of flat indices, the same shape as a
+
+        Returns:
+            An int32 array of the distances between a[i] and b[i]
+        """
+        a, b = np.asarray(a), np.asarray(b)
+        first_a, first_b = self._first_array[a], self._first_array[b]
+        low, high = np.minimum(first_a, first_b), np.maximum(first_a, first_b)
+        # floor(log2(span)) from the float exponent, exact for any int32 span
+        level = np.frexp(high - low + 1)[1] - 1
+        left = self.table[level, low]
+        right = self.table[level, high - (1 << level) + 1]
+        depths = self._depth_array
+        ancestor = np.where(depths[left] <= depths[right], left, right)
+        return depths[a] + depths[b] - 2 * depths[ancestor]
+
+    def path(self, a, b):
+        """
+        Get the path between two cells by walking up to their common ancestor.
+
+        Returns:
+            The flat indices of the cells from a to b
+        """
+        ancestor = self.lca(a, b)
+        up = [a]
+        while up[-1] != ancestor:
+            up.append(self.parents[up[-1]])
+        down = []
+        cell = b
+        while cell != ancestor:
+            down.append(cell)
+            cell = self.parents[cell]
+        down.reverse()
+        return up + down
+
+    def path_cells(self, grid, a, b):
+        """Get the path between two Cells of the grid as a list of Cells."""
+        cols = self.cols
+        return [grid.cells[index // cols][index % cols]
+                for index in self.path(a.row * cols + a.col, b.row * cols + b.col)]
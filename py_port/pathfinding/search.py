@@ -0,0 +1,58 @@
+"""
+Results of single-pair searches.
+
+Single-pair solvers record, for every cell they reach, the cell they reached it
+from. The path is rebuilt from these predecessors in O(path length) once the
+target is settled, so the search can stop early and never has to rescan the
+neighbors of path cells.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+# Predecessor of cells that have not been reached
+NO_PREDECESSOR = -1
+
+
+def rebuild_path(predecessors, start, end):
+    """
+    Follow predecessors from end back to start.
+
+    Args:
+        predecessors: Flat sequence of predecessor indices; the start cell may
+                      be its own predecessor
+        start: Flat index of the start cell
+        end: Flat index of a reached cell
+
+    Returns:
+        The flat indices of the path from start to end
+    """
+    path = [end]
+    current = end
+    while current != start:
+        current = predecessors[current]
+        path.append(current)
+    path.reverse()
+    return path
+
+
+@dataclass
+class SearchResult:
+    """Outcome of a single-pair search."""
+    path: List[int] = field(default_factory=list)
+    expanded: int = 0
+
+    @property
+    def found(self) -> bool:
+        """True if the target was reached."""
+        return bool(self.path)
+
+    @property
+    def distance(self) -> int:
+        """Number of steps on the path, or -1 if the target was not reached."""
+        return len(self.path) - 1
+
+    def cells(self, grid):
+        """Get the path as a list of the grid's Cells."""
+        cols = grid.cols
+        return [grid.cells[index // cols][index % cols] for index in self.path]
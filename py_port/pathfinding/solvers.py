@@ -0,0 +1,145 @@
+"""
+Registry of single-pair solver strategies.
+
+Frontends find the path between the entrance and the exit through this
+registry, so the strategy can be chosen by name (for example with --solver).
+Every strategy is a function search(links, cols, start, end) over the flat link
+flags of a maze (see pathfinding.bfs.flat_links) that returns a SearchResult.
+"""
+
+import sys
+import os
+from dataclasses import dataclass
+from typing import Callable, Tuple
+
+# Add the parent directory to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pathfinding.astar import AStar
+from pathfinding.bfs import BreadthFirstSearch, flat_links
+
+DEFAULT_SOLVER = 'bfs'
+
+# Ways of placing the entrance and exit (see place_endpoints)
+ENDPOINT_PLACEMENTS = ('corners', 'diameter')
+
+
+@dataclass(frozen=True)
+class SolverSpec:
+    """Description of a registered solver strategy."""
+    name: str
+    search: Callable
+    label: str
+    summary: str
+    aliases: Tuple[str, ...] = ()
+
+
+class SolverRegistry:
+    """Manages the solver strategies available to frontends."""
+
+    _solvers = {}
+    _aliases = {}
+
+    @classmethod
+    def register(cls, spec):
+        """
+        Register a new solver.
+
+        Raises:
+            ValueError: If the name or one of its aliases is already registered
+        """
+        for name in (spec.name,) + spec.aliases:
+            if name in cls._solvers or name in cls._aliases:
+                raise ValueError(f"Solver {name} is already registered")
+
+        cls._solvers[spec.name] = spec
+        for alias in spec.aliases:
+            cls._aliases[alias] = spec.name
+
+    @classmethod
+    def get(cls, name):
+        """
+        Get a solver spec by name or alias.
+
+        Raises:
+            ValueError: If the name is not recognized
+        """
+        name = cls._aliases.get(name, name)
+        if name not in cls._solvers:
+            raise ValueError(f"Unknown solver: {name}. Available solvers: {', '.join(cls._solvers)}")
+        return cls._solvers[name]
+
+    @classmethod
+    def list_solvers(cls):
+        """List the canonical names of all registered solvers in registration order."""
+        return list(cls._solvers.keys())
+
+    @classmethod
+    def search(cls, name, grid, start, end):
+        """
+        Run a solver between two Cells of a grid.
+
+        Returns:
+            The SearchResult of the solver (path in flat indices)
+        """
+        cols = grid.cols
+        return cls.get(name).search(flat_links(grid), cols, start.row * cols + start.col,
+                                    end.row * cols + end.col)
+
+    @classmethod
+    def shortest_path(cls, name, grid, start, end):
+        """
+        Find the shortest path between two Cells with the named solver.
+
+        Returns:
+            The list of Cells from start to end, or an empty list if end is unreachable
+        """
+        return cls.search(name or DEFAULT_SOLVER, grid, start, end).cells(grid)
+
+
+def place_endpoints(grid, placement='corners'):
+    """
+    Choose the entrance and exit of a maze.
+
+    Args:
+        grid: The maze grid
+        placement: 'corners' for the bottom-left entrance and top-right exit,
+                   or 'diameter' for the two ends of the maze's longest path
+                   (found with two breadth-first sweeps, see
+                   BreadthFirstSearch.diameter)
+
+    Returns:
+        An (entrance, exit) pair of Cells
+    """
+    if placement == 'corners':
+        return grid.at(grid.rows - 1, 0), grid.at(0, grid.cols - 1)
+    if placement == 'diameter':
+        result = BreadthFirstSearch.diameter(flat_links(grid), grid.cols, (grid.rows - 1) * grid.cols)
+        entrance, exit = result.path[0], result.path[-1]
+        return grid.at(*divmod(entrance, grid.cols)), grid.at(*divmod(exit, grid.cols))
+    raise ValueError(f"Unknown endpoint placement: {placement}. Available placements: {', '.join(ENDPOINT_PLACEMENTS)}")
+
+
+SolverRegistry.register(SolverSpec(
+    name='bfs',
+    search=BreadthFirstSearch.search,
+    label="Breadth-First Search",
+    summary="Expands outward from the start and stops when the target is reached",
+    aliases=('breadth-first',),
+))
+
+SolverRegistry.register(SolverSpec(
+    name='bidirectional',
+    search=BreadthFirstSearch.bidirectional,
+    label="Bidirectional BFS",
+    summary="Expands the smaller frontier from both ends until they meet",
+    aliases=('bidirectional-bfs', 'bibfs'),
+))
+
+SolverRegistry.register(SolverSpec(
+    name='astar',
+    search=AStar.search,
+    label="A* Search",
+    summary="Expands cells in order of steps taken plus Manhattan distance left",
+    aliases=('a-star',),
+))
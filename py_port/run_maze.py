@@ -15,11 +15,13 @@ import time
 import os
 
 from grid import Grid
-from algorithms.binary_tree import BinaryTreeMaze
-from algorithms.sidewinder import SidewinderMaze
-from algorithms.aldous_broder import AldousBroderMaze
-from algorithms.step_by_step import StepByStepBinaryTree, StepByStepSidewinder, StepByStepAldousBroder
+from algorithms.registry import GeneratorRegistry
+from algorithms.braid import braid
+from algorithms.cache import MazeCache
+from algorithms.origin_shift import OriginShiftMaze
+from algorithms.world import MazeWorld
 from pathfinding.dijkstra import Dijkstra
+from pathfinding.solvers import DEFAULT_SOLVER, ENDPOINT_PLACEMENTS, SolverRegistry, place_endpoints
 from visualization import TextRenderer, MatplotlibRenderer, ThemeManager
 
 # Check if asciimatics is available
@@ -30,12 +32,61 @@ except ImportError:
     HAS_ASCIIMATICS = False
 
 
+def explain_algorithm(spec):
+    """Print the short explanation of an algorithm shown by --explain."""
+    print(f"\n{spec.label} Algorithm:")
+    for line in spec.summary:
+        print(line)
+    print()
+
+
+def throughput_reporter(stream=sys.stderr):
+    """Build a progress callback that prints cells visited and throughput on one line."""
+    start = time.perf_counter()
+    finished = []
+
+    def report(visited, total, iterations):
+        if finished:
+            return
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        percent = 100.0 * visited / total if total else 100.0
+        stream.write(f"\rGenerating: {percent:5.1f}% ({visited:,}/{total:,} cells, "
+                     f"{iterations / elapsed:,.0f} steps/s)")
+        if visited >= total:
+            finished.append(True)
+            stream.write("\n")
+        stream.flush()
+
+    return report
+
+
+def show_world(args):
+    """Show or explore the unbounded chunked world requested with --world."""
+    spec = GeneratorRegistry.get(args.algorithm)
+    seed = args.seed if args.seed is not None else random.getrandbits(32)
+    world = MazeWorld(seed, chunk_size=args.chunk_size, algorithm=spec.name, **spec.option_values(args))
+    row, col = args.region if args.region else (0, 0)
+
+    if args.renderer == 'asciimatics':
+        print(f"Exploring world {seed} with {spec.label} chunks; use arrow keys to walk, 'q' to quit")
+        AsciimaticsRenderer(theme_name=args.theme).explore_world(world, start=(row, col))
+    else:
+        links = Grid.clip_links(world.window(row, col, args.rows, args.cols))
+        print(f"World {seed}, window at ({row}, {col}):")
+        print(Grid.from_links(links).display())
+
+
 def main():
     """Main entry point for the unified maze script."""
+    algorithm_help = '\n'.join(
+        f"  {name:<13} - {GeneratorRegistry.get(name).summary[0]}"
+        for name in GeneratorRegistry.list_generators()
+    )
+
     # Set up command-line arguments
     parser = argparse.ArgumentParser(description='MazeBuilder - A maze generation and visualization tool',
                                      formatter_class=argparse.RawDescriptionHelpFormatter,
-                                     epilog='''
+                                     epilog=f'''
 Examples:
   %(prog)s --rows 20 --cols 20 --algorithm binary
     Generate a 20x20 maze using binary tree algorithm
@@ -55,10 +106,17 @@ Examples:
   %(prog)s --algorithm sidewinder --step-by-step --interactive
     Step through Sidewinder algorithm interactively
 
+  %(prog)s --algorithm sidewinder --seed 7 --region 1000000000 123456789
+    Show a window far inside a practically unbounded maze
+
+  %(prog)s --algorithm growing-tree --renderer asciimatics --world
+    Walk an endless maze world generated chunk by chunk
+
+  %(prog)s --renderer asciimatics --shift --speed 0.1
+    Explore a maze that keeps rearranging itself (Origin Shift)
+
 Algorithms:
-  binary        - Simple algorithm creating mazes with northeast bias
-  sidewinder    - Creates balanced horizontal runs with north connections
-  aldous-broder - Random walk algorithm creating unbiased mazes
+{algorithm_help}
 
 Renderers:  
   text         - ASCII text display in terminal
@@ -78,9 +136,31 @@ For more information about the algorithms, use:
     # Maze generation parameters
     parser.add_argument('--rows', '-r', type=int, default=12, help='Number of rows in the maze')
     parser.add_argument('--cols', '-c', type=int, default=12, help='Number of columns in the maze')
-    parser.add_argument('--algorithm', '-a', choices=['binary', 'sidewinder', 'aldous-broder'],
+    parser.add_argument('--algorithm', '-a', choices=GeneratorRegistry.list_generators(),
                         default='binary', help='Maze generation algorithm to use')
     parser.add_argument('--seed', '-s', type=int, help='Random seed for reproducible mazes')
+    parser.add_argument('--policy', choices=['newest', 'random', 'oldest', 'mixed'],
+                        help='Cell selection policy (growing-tree only)')
+    parser.add_argument('--mix', type=float,
+                        help='Probability of choosing the newest cell with --policy mixed')
+    parser.add_argument('--fill', type=float,
+                        help='Initial probability that a cell is rock (cave only)')
+    parser.add_argument('--iterations', type=int,
+                        help='Number of smoothing passes (cave only)')
+    parser.add_argument('--braid', type=float, metavar='P',
+                        help='Remove each dead end with probability P, adding loops')
+    parser.add_argument('--region', type=int, nargs=2, metavar=('ROW', 'COL'),
+                        help='Show the rows x cols window at (ROW, COL) of a practically unbounded '
+                             'maze computed from cell coordinates (binary and sidewinder)')
+    parser.add_argument('--world', action='store_true',
+                        help='Use an unbounded world of generated chunks (walk it with the asciimatics '
+                             'renderer; --region sets the start)')
+    parser.add_argument('--chunk-size', type=int, default=16, help='Side of a world chunk in cells')
+    parser.add_argument('--shift', action='store_true',
+                        help='Keep the maze changing with Origin Shift while it is shown '
+                             '(text and asciimatics renderers; --speed sets the interval)')
+    parser.add_argument('--progress', action='store_true',
+                        help='Show generation progress and throughput')
     
     # Visualization parameters
     parser.add_argument('--theme', '-t', choices=ThemeManager.list_themes(),
@@ -88,6 +168,10 @@ For more information about the algorithms, use:
     parser.add_argument('--renderer', '-R', choices=['text', 'matplotlib', 'asciimatics'],
                         default='text', help='Renderer to use for visualization')
     parser.add_argument('--show-solution', action='store_true', help='Show solution path')
+    parser.add_argument('--solver', choices=SolverRegistry.list_solvers(), default=DEFAULT_SOLVER,
+                        help='Strategy used to find the solution path')
+    parser.add_argument('--endpoints', choices=ENDPOINT_PLACEMENTS, default='corners',
+                        help='Place entrance and exit at the corners or at the ends of the longest path')
     parser.add_argument('--no-distances', dest='show_distances', action='store_false',
                         help='Hide distances on solution path')
     parser.add_argument('--save', '-S', help='Save output to file (for matplotlib renderer)')
@@ -95,6 +179,7 @@ For more information about the algorithms, use:
     # Save/load parameters
     parser.add_argument('--save-maze', help='Save generated maze to JSON file')
     parser.add_argument('--load-maze', help='Load maze from JSON file')
+    parser.add_argument('--cache-dir', help='Reuse seeded mazes stored in this directory')
     
     # Help/info parameters
     parser.add_argument('--explain', action='store_true', help='Show explanation of the chosen algorithm')
@@ -112,10 +197,18 @@ For more information about the algorithms, use:
         print("Please install it with: pip install asciimatics")
         sys.exit(1)
 
+    if args.shift and args.speed <= 0:
+        print("Error: --shift needs a positive --speed (seconds between origin shifts).")
+        sys.exit(1)
+
     # Initialize random seed if provided
     if args.seed is not None:
         random.seed(args.seed)
 
+    if args.world:
+        show_world(args)
+        return
+
     # Load maze from file or generate new one
     if args.load_maze:
         grid = Grid.load_from_file(args.load_maze)
@@ -125,34 +218,27 @@ For more information about the algorithms, use:
         grid = Grid(args.rows, args.cols)
 
         # Apply selected maze generation algorithm and handle explain flag
-        if args.step_by_step:
+        spec = GeneratorRegistry.get(args.algorithm)
+        if args.explain:
+            explain_algorithm(spec)
+
+        if args.region:
+            # Random access: compute just the requested window of the world
+            if not spec.random_access:
+                print(f"Error: {spec.label} does not support --region.")
+                sys.exit(1)
+            seed = args.seed if args.seed is not None else random.getrandbits(32)
+            links = spec.load().region(seed, args.region[0], args.region[1], args.rows, args.cols, clip=True)
+            grid = Grid.from_links(links)
+        elif args.step_by_step:
             # Use step-by-step version
-            if args.algorithm == 'binary':
-                if args.explain:
-                    print("\nBinary Tree Algorithm:")
-                    print("For each cell, randomly carve a passage either north or east.")
-                    print("Creates a perfect maze with exactly one path between any two points.")
-                    print("Has a bias toward the northeast corner.\n")
-                stepper = StepByStepBinaryTree(grid)
-            elif args.algorithm == 'sidewinder':
-                if args.explain:
-                    print("\nSidewinder Algorithm:")
-                    print("Creates horizontal \"runs\" of connected cells.")
-                    print("Randomly ends runs by connecting one cell northward.")
-                    print("Creates east-west corridors with occasional north passages.\n")
-                stepper = StepByStepSidewinder(grid)
-            elif args.algorithm == 'aldous-broder':
-                if args.explain:
-                    print("\nAldous-Broder Algorithm:")
-                    print("Performs a random walk, connecting unvisited cells.")
-                    print("Creates unbiased, perfect mazes.")
-                    print("Slower but produces more balanced mazes.\n")
-                stepper = StepByStepAldousBroder(grid)
-            
+            stepper_class = spec.load_stepper()
+            if stepper_class is None:
+                print(f"Error: {spec.label} does not support step-by-step visualization.")
+                sys.exit(1)
+            stepper = stepper_class(grid)
+
             # Run step-by-step visualization
-            import time
-            import os
-            
             for step in stepper.steps():
                 # Clear screen
                 os.system('clear' if os.name == 'posix' else 'cls')
@@ -171,27 +257,17 @@ For more information about the algorithms, use:
                     time.sleep(args.speed)
         else:
             # Normal generation
-            if args.algorithm == 'binary':
-                if args.explain:
-                    print("\nBinary Tree Algorithm:")
-                    print("For each cell, randomly carve a passage either north or east.")
-                    print("Creates a perfect maze with exactly one path between any two points.")
-                    print("Has a bias toward the northeast corner.\n")
-                BinaryTreeMaze.on(grid)
-            elif args.algorithm == 'sidewinder':
-                if args.explain:
-                    print("\nSidewinder Algorithm:")
-                    print("Creates horizontal \"runs\" of connected cells.")
-                    print("Randomly ends runs by connecting one cell northward.")
-                    print("Creates east-west corridors with occasional north passages.\n")
-                SidewinderMaze.on(grid)
-            elif args.algorithm == 'aldous-broder':
-                if args.explain:
-                    print("\nAldous-Broder Algorithm:")
-                    print("Performs a random walk, connecting unvisited cells.")
-                    print("Creates unbiased, perfect mazes.")
-                    print("Slower but produces more balanced mazes.\n")
-                grid, _ = AldousBroderMaze.on(grid)
+            progress = throughput_reporter() if args.progress else None
+            if args.cache_dir:
+                grid = MazeCache(disk_dir=args.cache_dir).generate(
+                    spec.name, args.rows, args.cols, seed=args.seed, progress=progress,
+                    **spec.option_values(args))
+            else:
+                GeneratorRegistry.generate(spec.name, grid, seed=args.seed, progress=progress,
+                                           **spec.option_values(args))
+
+        if args.braid:
+            braid(grid, args.braid, seed=args.seed)
         
         # Save maze to file if requested
         if args.save_maze:
@@ -199,20 +275,41 @@ For more information about the algorithms, use:
             print(f"Saved maze to {args.save_maze}")
 
     # Calculate solution path
-    entrance = grid.at(grid.rows - 1, 0)  # Bottom left
-    exit = grid.at(0, grid.cols - 1)      # Top right
-    solution = Dijkstra.shortest_path(grid, entrance, exit)
+    entrance, exit = place_endpoints(grid, args.endpoints)
+    solution = SolverRegistry.shortest_path(args.solver, grid, entrance, exit)
     distances = Dijkstra.calculate_distances(grid, exit)
 
+    shifter = None
+    if args.shift:
+        if args.braid:
+            print("Error: --shift needs a perfect maze and cannot be combined with --braid.")
+            sys.exit(1)
+        shifter = OriginShiftMaze.from_grid(grid, origin=(exit.row, exit.col), seed=args.seed)
+
     # Render the maze using the selected renderer
-    if args.renderer == 'text':
+    if args.renderer == 'text' and shifter is not None:
+        # Shifting text maze: keep one canvas and patch the walls that change
+        text_renderer = TextRenderer(theme_name=args.theme, use_color=False)
+        canvas = text_renderer.wall_canvas(grid)
+        try:
+            while True:
+                os.system('clear' if os.name == 'posix' else 'cls')
+                print(text_renderer.canvas_text(canvas))
+                print(f"\nOrigin shifts: {shifter.steps} (Ctrl-C to stop)")
+                time.sleep(args.speed)
+                text_renderer.patch_canvas(canvas, shifter.step())
+        except KeyboardInterrupt:
+            pass
+
+    elif args.renderer == 'text':
         # Text renderer
         text_renderer = TextRenderer(theme_name=args.theme, use_color=True)
         output = text_renderer.render_maze(
             grid, 
             solution_path=solution if args.show_solution else None, 
             show_distances=args.show_distances,
-            distances=distances
+            distances=distances,
+            endpoints=(entrance, exit)
         )
         print(output)
         
@@ -222,7 +319,8 @@ For more information about the algorithms, use:
         fig = matplot_renderer.render_maze(
             grid, 
             solution_path=solution if args.show_solution else None, 
-            show_distances=args.show_distances
+            show_distances=args.show_distances,
+            endpoints=(entrance, exit)
         )
         
         filename = args.save if args.save else f"maze_{args.algorithm}_{args.theme}.png"
@@ -240,7 +338,10 @@ For more information about the algorithms, use:
             solution_path=solution, 
             interactive=True,
             show_solution=args.show_solution,
-            current_position=(entrance.row, entrance.col)
+            current_position=(entrance.row, entrance.col),
+            shifter=shifter,
+            shift_interval=args.speed,
+            endpoints=(entrance, exit)
         )
 
 
@@ -9,10 +9,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from grid import Grid
 from cell import Cell
-from algorithms.binary_tree import BinaryTreeMaze
-from algorithms.sidewinder import SidewinderMaze
-from algorithms.aldous_broder import AldousBroderMaze
-from pathfinding.dijkstra import Dijkstra
+from algorithms.registry import GeneratorRegistry
+from algorithms.cache import MazeCache
+from pathfinding.solvers import DEFAULT_SOLVER, SolverRegistry
 
 # Set page configuration
 st.set_page_config(
@@ -22,14 +21,20 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+@st.cache_resource
+def get_maze_cache():
+    """Maze cache shared by all sessions of this server process."""
+    return MazeCache()
+
 # Initialize session state first
 if 'maze' not in st.session_state:
     st.session_state.maze = Grid(10, 10)
-    st.session_state.algorithm = "binary_tree"
+    st.session_state.algorithm = "binary"
     st.session_state.seed = 1234
     st.session_state.show_solution = False
     st.session_state.current_position = (9, 0)  # Entrance at bottom left
     st.session_state.path = []
+    st.session_state.solver = DEFAULT_SOLVER
     st.session_state.active_tab = "Constructor's Workshop"
     st.session_state.theme = "wizardry"  # Default theme: wizardry or retro
 
@@ -243,7 +248,7 @@ if st.session_state.active_tab == "Constructor's Workshop":
         if st.session_state.show_solution:
             entrance = st.session_state.maze.at(st.session_state.maze.rows - 1, 0)
             exit = st.session_state.maze.at(0, st.session_state.maze.cols - 1)
-            st.session_state.path = Dijkstra.shortest_path(st.session_state.maze, entrance, exit)
+            st.session_state.path = SolverRegistry.shortest_path(st.session_state.solver, st.session_state.maze, entrance, exit)
         
         # Display the maze
         fig = render_maze(st.session_state.maze, st.session_state.path)
@@ -272,25 +277,47 @@ if st.session_state.active_tab == "Constructor's Workshop":
         st.markdown("## MAZE GRIMOIRE")
         
         # Algorithm selection
-        if st.session_state.theme == "retro":
-            algorithm_options = {
-                "binary_tree": "BINTREE.SYS - Basic Maze",
-                "sidewinder": "SNAKERUN.SYS - Advanced Maze",
-                "aldous_broder": "RANDWALK.SYS - Premium Maze"
-            }
-        else:
-            algorithm_options = {
-                "binary_tree": "Binary Tree Algorithm",
-                "sidewinder": "Sidewinder Algorithm",
-                "aldous_broder": "Aldous-Broder Algorithm"
-            }
-        
+        retro_names = {
+            "binary": "BINTREE.SYS - Basic Maze",
+            "sidewinder": "SNAKERUN.SYS - Advanced Maze",
+            "aldous-broder": "RANDWALK.SYS - Premium Maze"
+        }
+        algorithm_options = {}
+        for name in GeneratorRegistry.list_generators():
+            label = GeneratorRegistry.get(name).label
+            if st.session_state.theme == "retro":
+                default_name = label.upper().replace(" ", "").replace("-", "")[:8] + ".SYS"
+                algorithm_options[name] = retro_names.get(name, default_name)
+            else:
+                algorithm_options[name] = f"{label} Algorithm"
+
+        current_algorithm = GeneratorRegistry.get(st.session_state.algorithm).name
         algorithm = st.selectbox(
             "Algorithm:",
             options=list(algorithm_options.keys()),
             format_func=lambda x: algorithm_options[x],
-            index=list(algorithm_options.keys()).index(st.session_state.algorithm)
+            index=list(algorithm_options.keys()).index(current_algorithm)
         )
+
+        # Generator-specific options
+        option_values = {}
+        if 'policy' in GeneratorRegistry.get(algorithm).options:
+            option_values['policy'] = st.selectbox(
+                "Growth Policy:" if st.session_state.theme == "wizardry" else "SELECTION POLICY:",
+                options=["newest", "random", "oldest", "mixed"],
+                index=0
+            )
+            if option_values['policy'] == "mixed":
+                option_values['mix'] = st.slider(
+                    "Chance of newest cell:", min_value=0.0, max_value=1.0, value=0.5, step=0.05
+                )
+        if 'fill' in GeneratorRegistry.get(algorithm).options:
+            option_values['fill'] = st.slider(
+                "Initial rock:", min_value=0.3, max_value=0.6, value=0.45, step=0.01
+            )
+            option_values['iterations'] = st.slider(
+                "Smoothing passes:", min_value=0, max_value=8, value=4
+            )
         
         # Dimensions selection with theme-specific labels
         if st.session_state.theme == "retro":
@@ -337,20 +364,26 @@ if st.session_state.active_tab == "Constructor's Workshop":
         solution_label = "Show Path with Distances" if st.session_state.theme == "wizardry" else "DISPLAY SOLUTION PATH"
         st.checkbox(solution_label, value=st.session_state.show_solution,
                    on_change=lambda: setattr(st.session_state, 'show_solution', not st.session_state.show_solution))
+        solver_names = SolverRegistry.list_solvers()
+        st.session_state.solver = st.selectbox(
+            "Pathfinder:" if st.session_state.theme == "wizardry" else "SOLVER ROUTINE:",
+            options=solver_names,
+            format_func=lambda x: SolverRegistry.get(x).label,
+            index=solver_names.index(st.session_state.solver)
+        )
 
         # Generate button with theme-specific label
         button_label = "CAST THE SPELL" if st.session_state.theme == "wizardry" else "EXECUTE PROGRAM"
         if st.button(button_label, use_container_width=True):
-            # Create the grid
-            new_grid = Grid(rows, cols)
-            
-            # Apply the selected algorithm
-            if algorithm == "binary_tree":
-                BinaryTreeMaze.on(new_grid)
-            elif algorithm == "sidewinder":
-                SidewinderMaze.on(new_grid)
-            else:  # aldous_broder
-                new_grid, _ = AldousBroderMaze.on(new_grid, seed=seed)
+            # Generate the maze (or reuse a cached one), reporting progress about 20 times
+            progress_bar = st.progress(0.0)
+            new_grid = get_maze_cache().generate(
+                algorithm, rows, cols, seed=seed,
+                progress=lambda visited, total, iterations: progress_bar.progress(visited / total if total else 1.0),
+                every=max(1, rows * cols // 20),
+                **option_values
+            )
+            progress_bar.empty()
             
             # Update session state
             st.session_state.maze = new_grid
@@ -363,7 +396,7 @@ if st.session_state.active_tab == "Constructor's Workshop":
             if st.session_state.show_solution:
                 entrance = new_grid.at(new_grid.rows - 1, 0)
                 exit = new_grid.at(0, new_grid.cols - 1)
-                st.session_state.path = Dijkstra.shortest_path(new_grid, entrance, exit)
+                st.session_state.path = SolverRegistry.shortest_path(st.session_state.solver, new_grid, entrance, exit)
                 
             st.rerun()
         
@@ -378,7 +411,7 @@ if st.session_state.active_tab == "Constructor's Workshop":
         else:
             st.markdown("## TECHNICAL DOCUMENTATION")
 
-        if algorithm == "binary_tree":
+        if algorithm == "binary":
             if st.session_state.theme == "wizardry":
                 st.markdown("""
                 **Binary Tree Algorithm**
@@ -432,7 +465,7 @@ if st.session_state.active_tab == "Constructor's Workshop":
 
                 WARNING: MAY CAUSE SYSTEM SLOWDOWN ON OLDER HARDWARE
                 """)
-        else:  # aldous_broder
+        elif algorithm == "aldous-broder":
             if st.session_state.theme == "wizardry":
                 st.markdown("""
                 **Aldous-Broder Algorithm**
@@ -460,6 +493,14 @@ if st.session_state.active_tab == "Constructor's Workshop":
                 WARNING: EXTENDED MEMORY REQUIRED (286K MINIMUM)
                 CAUTION: MAY CAUSE SYSTEM MEMORY OVERFLOW ON PROLONGED USE
                 """)
+        else:
+            # Algorithms without a hand-written entry use their registry summary
+            spec = GeneratorRegistry.get(algorithm)
+            summary = "\n".join(f"* {line}" for line in spec.summary)
+            if st.session_state.theme == "wizardry":
+                st.markdown(f"**{spec.label} Algorithm**\n\n{summary}")
+            else:
+                st.markdown(f"**{algorithm_options[algorithm]}**\n\n{summary.upper()}")
         
         st.markdown('</div>', unsafe_allow_html=True)
     
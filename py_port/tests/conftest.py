@@ -29,4 +29,43 @@ def sample_3x3_grid():
     grid.link_cells(1, 2, Cell.SOUTH)  # (1,2) -> (2,2)
     grid.link_cells(2, 1, Cell.WEST)   # (2,1) -> (2,0)
     
-    return grid
\ No newline at end of file
+    return grid
+
+@pytest.fixture
+def is_perfect_links():
+    """Return a checker that tells whether a link array forms a perfect maze."""
+    def check(links):
+        from cell import Cell
+
+        links = links.tolist()
+        rows, cols = len(links), len(links[0])
+
+        # A perfect maze is a spanning tree: n - 1 passages and fully connected
+        passages = 0
+        parent = list(range(rows * cols))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for r in range(rows):
+            for c in range(cols):
+                value = links[r][c]
+                if value & Cell.NORTH and (r == 0 or not links[r - 1][c] & Cell.SOUTH):
+                    return False
+                if value & Cell.WEST and (c == 0 or not links[r][c - 1] & Cell.EAST):
+                    return False
+                for linked, nr, nc in ((value & Cell.EAST, r, c + 1), (value & Cell.SOUTH, r + 1, c)):
+                    if not linked:
+                        continue
+                    if nr >= rows or nc >= cols:
+                        return False
+                    passages += 1
+                    parent[find(r * cols + c)] = find(nr * cols + nc)
+
+        roots = {find(i) for i in range(rows * cols)}
+        return passages == rows * cols - 1 and len(roots) == 1
+
+    return check
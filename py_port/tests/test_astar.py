@@ -0,0 +1,48 @@
+import sys
+import os
+import random
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathfinding.astar import AStar, manhattan
+from pathfinding.bfs import BreadthFirstSearch, flat_links, link_steps
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+class TestAStar:
+    def test_manhattan(self):
+        """The Manhattan heuristic measures rows plus columns to the target."""
+        estimate = manhattan(10, 23)
+        assert estimate(23) == 0
+        assert estimate(0) == 2 + 3
+        assert estimate(99) == 7 + 6
+
+    @pytest.mark.parametrize("heuristic", ['manhattan', 'zero'])
+    @pytest.mark.parametrize("algorithm", ['growing-tree', 'cave'])
+    def test_finds_shortest_paths(self, algorithm, heuristic):
+        """A* paths are as short as breadth-first ones and follow links."""
+        grid = GeneratorRegistry.generate(algorithm, Grid(20, 20), seed=6)
+        links = flat_links(grid)
+        steps = link_steps(20)
+        pairs = random.Random(2).sample(range(400), 30)
+        for start, end in zip(pairs[::2], pairs[1::2]):
+            result = AStar.search(links, 20, start, end, heuristic=heuristic)
+            assert result.distance == BreadthFirstSearch.search(links, 20, start, end).distance
+            assert all(b - a in steps[links[a]] for a, b in zip(result.path, result.path[1:]))
+
+    def test_heuristic_reduces_expansions(self):
+        """In an open grid the Manhattan heuristic heads straight for the target."""
+        grid = Grid.from_links(Grid.full_links(30, 30))
+        links = flat_links(grid)
+        guided = AStar.search(links, 30, 0, 899)
+        blind = AStar.search(links, 30, 0, 899, heuristic='zero')
+        assert guided.distance == blind.distance == 58
+        assert guided.expanded == 59
+        assert blind.expanded > 800
+
+    def test_unknown_heuristic(self):
+        """Heuristics are looked up by name."""
+        with pytest.raises(ValueError):
+            AStar.search([0], 1, 0, 0, heuristic='euclid')
@@ -0,0 +1,75 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.batch import generate_batch
+from grid import Grid
+from cell import Cell
+
+
+class TestGenerateBatch:
+    @pytest.mark.parametrize("algorithm", ["binary", "sidewinder", "aldous-broder"])
+    def test_batch_shape_and_perfect_mazes(self, algorithm, is_perfect_links):
+        """Every entry in the batch should be a perfect maze of the requested size."""
+        batch = generate_batch(algorithm, 6, 7, seeds=range(5), workers=1)
+
+        assert batch.shape == (5, 6, 7)
+        assert batch.dtype == np.uint8
+        for links in batch:
+            assert is_perfect_links(links)
+
+    @pytest.mark.parametrize("algorithm", ["binary", "sidewinder"])
+    def test_batch_entries_depend_only_on_seed(self, algorithm):
+        """A maze should not change when the rest of the batch changes."""
+        first = generate_batch(algorithm, 8, 8, seeds=[3, 11, 42])
+        second = generate_batch(algorithm, 8, 8, seeds=[42, 3])
+
+        assert np.array_equal(first[2], second[0])
+        assert np.array_equal(first[0], second[1])
+        assert not np.array_equal(first[0], first[1])
+
+    def test_batch_matches_seeded_generation(self):
+        """Vectorized batch entries equal mazes generated one at a time."""
+        from algorithms.binary_tree import BinaryTreeMaze
+        from algorithms.sidewinder import SidewinderMaze
+
+        for name, maze_class in (("binary", BinaryTreeMaze), ("sidewinder", SidewinderMaze)):
+            batch = generate_batch(name, 6, 9, seeds=[4, 8])
+            grid = maze_class.on(Grid(6, 9), seed=8)
+            assert np.array_equal(batch[1], grid.to_links())
+
+    def test_binary_tree_edges(self):
+        """Vectorized Binary Tree keeps the straight north and east corridors."""
+        links = generate_batch("binary", 5, 5, seeds=[7])[0]
+
+        assert all(links[0, c] & Cell.EAST for c in range(4))
+        assert all(links[r, 4] & Cell.NORTH for r in range(1, 5))
+
+    def test_sidewinder_top_row(self):
+        """Vectorized Sidewinder keeps the unbroken northern corridor."""
+        links = generate_batch("sidewinder", 5, 5, seeds=[7])[0]
+
+        assert all(links[0, c] & Cell.EAST for c in range(4))
+        assert not any(links[0, c] & Cell.NORTH for c in range(5))
+
+    def test_process_pool_matches_serial(self):
+        """Pooled generation gives the same mazes as in-process generation."""
+        serial = generate_batch("aldous-broder", 4, 4, seeds=[1, 2, 3], workers=1)
+        pooled = generate_batch("aldous-broder", 4, 4, seeds=[1, 2, 3], workers=2)
+
+        assert np.array_equal(serial, pooled)
+
+    def test_batch_converts_to_grid(self):
+        """Batch entries can be loaded back into regular Grid objects."""
+        links = generate_batch("sidewinder", 4, 6, seeds=[5])[0]
+        grid = Grid.from_links(links)
+
+        assert np.array_equal(grid.to_links(), links)
+
+    def test_unknown_algorithm(self):
+        """Unknown algorithm names raise a ValueError."""
+        with pytest.raises(ValueError):
+            generate_batch("unknown", 3, 3, seeds=[1])
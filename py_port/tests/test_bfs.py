@@ -0,0 +1,145 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathfinding.bfs import UNREACHABLE, BreadthFirstSearch, distance_field, flat_links, link_steps
+from pathfinding.dijkstra import Dijkstra
+from pathfinding.search import rebuild_path
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+from cell import Cell
+
+
+class TestBreadthFirstSearch:
+    def test_link_steps(self):
+        """Link values map to the flat offsets of their neighbors."""
+        steps = link_steps(5)
+        assert steps[0] == ()
+        assert steps[Cell.NORTH | Cell.EAST] == (-5, 1)
+        assert steps[15] == (-5, 5, 1, -1)
+
+    def test_flat_links_drop_outside_links(self):
+        """Links that leave the grid are not followed."""
+        grid = Grid.from_links(np.full((2, 2), 15, dtype=np.uint8))
+        assert flat_links(grid) == [Cell.SOUTH | Cell.EAST, Cell.SOUTH | Cell.WEST,
+                                    Cell.NORTH | Cell.EAST, Cell.NORTH | Cell.WEST]
+
+    def test_distances(self, sample_3x3_grid):
+        """Distances along the sample maze, with unreachable cells marked."""
+        distances = BreadthFirstSearch.distances(sample_3x3_grid, sample_3x3_grid.at(0, 0))
+        assert distances.dtype == np.int32
+        assert distances[0].tolist() == [0, 1, 2]
+        assert distances[2, 2] == 4
+        assert distances[1, 1] == UNREACHABLE
+
+    def test_matches_weighted_dijkstra(self):
+        """With unit weights the BFS engine agrees with the priority-queue search."""
+        grid = GeneratorRegistry.generate('cave', Grid(30, 30), seed=4)
+        start = grid.at(29, 0)
+        fast = Dijkstra.calculate_distances(grid, start)
+        slow = Dijkstra.calculate_distances(grid, start, weight=lambda cell, neighbor: 1)
+        assert fast.cells == slow.cells
+
+        path = BreadthFirstSearch.path(grid, start, grid.at(0, 29))
+        assert len(path) - 1 == fast.get_distance(grid.at(0, 29))
+
+    def test_weighted_paths(self):
+        """A weight function steers the path around an expensive passage."""
+        grid = Grid.from_links(Grid.full_links(2, 3))
+        expensive = {grid.at(0, 1), grid.at(1, 1)}
+
+        def weight(cell, neighbor):
+            return 10 if cell in expensive and neighbor in expensive else 1
+
+        path = Dijkstra.shortest_path(grid, grid.at(0, 1), grid.at(1, 1), weight=weight)
+        assert len(path) == 4
+        assert path[1].col == path[2].col != 1
+        assert Dijkstra.shortest_path(grid, grid.at(0, 1), grid.at(1, 1)) == [grid.at(0, 1), grid.at(1, 1)]
+
+
+class TestSinglePairSearch:
+    def test_rebuild_path(self):
+        """Predecessors are followed back to the start."""
+        assert rebuild_path([0, 0, 1, 2], 0, 3) == [0, 1, 2, 3]
+        assert rebuild_path([0], 0, 0) == [0]
+
+    def test_search_stops_early(self):
+        """The search stops as soon as the target is reached."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(20, 20), seed=3)
+        links = flat_links(grid)
+        near = BreadthFirstSearch.search(links, 20, 0, 1 if links[0] & Cell.EAST else 20)
+        assert near.distance == 1
+        assert near.expanded == 1
+
+        far = BreadthFirstSearch.search(links, 20, 0, 399)
+        distances = BreadthFirstSearch.distance_list(links, 20, 0)
+        assert far.distance == distances[399]
+        assert far.path[0] == 0 and far.path[-1] == 399
+        assert far.expanded <= 400
+
+    def test_unreachable_target(self, sample_3x3_grid):
+        """A target that cannot be reached gives an empty result."""
+        result = BreadthFirstSearch.search(flat_links(sample_3x3_grid), 3, 0, 4)
+        assert not result.found
+        assert result.distance == -1
+        assert result.cells(sample_3x3_grid) == []
+
+    def test_weighted_search_expands_fewer_cells(self):
+        """Weighted searches also stop once the target is settled."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(15, 15), seed=8)
+        result = Dijkstra.search(grid, 0, 1 if grid.at(0, 0).linked(Cell.EAST) else 15,
+                                 lambda cell, neighbor: 1)
+        assert result.distance == 1
+        assert result.expanded < 15 * 15
+
+
+class TestDiameter:
+    def test_perfect_maze_diameter(self):
+        """Two sweeps find the longest path of a perfect maze."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(12, 12), seed=4)
+        links = flat_links(grid)
+        result = BreadthFirstSearch.diameter(links, 12)
+        longest = max(max(BreadthFirstSearch.distance_list(links, 12, cell)) for cell in range(144))
+        assert result.distance == longest
+        assert result.expanded == 2 * 144
+        assert BreadthFirstSearch.search(links, 12, result.path[0], result.path[-1]).distance == longest
+
+    def test_sweep_order(self, sample_3x3_grid):
+        """A sweep lists reached cells by distance and leaves the rest out."""
+        order, predecessors = BreadthFirstSearch.sweep(flat_links(sample_3x3_grid), 3, 0)
+        assert order[:3] == [0, 1, 2]
+        assert 4 not in order and predecessors[4] == -1
+        assert predecessors[0] == 0
+
+
+class TestDistanceField:
+    def test_matches_minimum_of_single_source_searches(self):
+        """The field is the per-cell minimum over the sources, labelled by the nearest one."""
+        grid = GeneratorRegistry.generate('cave', Grid(30, 30), seed=4)
+        sources = [(29, 0), (0, 29)]
+        distances, labels = distance_field(grid, [grid.at(*sources[0]), sources[1]])
+        assert distances.dtype == labels.dtype == np.int32
+
+        singles = np.stack([BreadthFirstSearch.distances(grid, grid.at(*source)) for source in sources])
+        reached = singles >= 0
+        expected = np.where(reached, singles, np.iinfo(np.int32).max).min(axis=0)
+        assert (distances[reached.any(axis=0)] == expected[reached.any(axis=0)]).all()
+        assert (distances[~reached.any(axis=0)] == UNREACHABLE).all()
+        assert (labels[~reached.any(axis=0)] == UNREACHABLE).all()
+
+        nearest = np.take_along_axis(singles, np.maximum(labels, 0)[None], axis=0)[0]
+        assert (nearest[labels >= 0] == distances[labels >= 0]).all()
+        assert labels[29, 0] == 0 and labels[0, 29] == 1
+
+    def test_duplicate_sources_keep_first_label(self):
+        grid = Grid.from_links(Grid.full_links(1, 5))
+        distances, labels = distance_field(grid, [(0, 4), (0, 4), (0, 0)])
+        assert distances[0].tolist() == [0, 1, 2, 1, 0]
+        assert labels[0, 4] == 0 and labels[0, 0] == 2
+
+    def test_source_outside_grid(self):
+        with pytest.raises(IndexError):
+            distance_field(Grid(2, 2), [(5, 5)])
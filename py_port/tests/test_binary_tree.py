@@ -1,6 +1,7 @@
 import sys
 import os
 import pytest
+import numpy as np
 from unittest.mock import patch
 
 # Add parent directory to path to import modules
@@ -179,4 +180,31 @@ class TestBinaryTreeMaze:
         explanation = BinaryTreeMaze.explain()
         assert isinstance(explanation, str)
         assert len(explanation) > 0
-        assert "BINARY TREE ALGORITHM" in explanation
\ No newline at end of file
+        assert "BINARY TREE ALGORITHM" in explanation
+
+
+class TestBinaryTreeRegion:
+    def test_full_world_matches_link_array(self, is_perfect_links):
+        """A window covering a small world is that world's Binary Tree maze."""
+        rows, cols = 7, 9
+        north = BinaryTreeMaze.coordinate_draws(5, np.arange(rows)[:, None], np.arange(cols)[None, :])
+        links = BinaryTreeMaze.region(5, 0, 0, rows, cols, world_rows=rows, world_cols=cols)
+
+        assert np.array_equal(links, BinaryTreeMaze.link_array(north))
+        assert is_perfect_links(links)
+
+    def test_windows_agree(self):
+        """Overlapping windows far inside the world agree cell for cell."""
+        start = 3 * 10 ** 9
+        big = BinaryTreeMaze.region(11, start, start, 20, 30)
+        small = BinaryTreeMaze.region(11, start + 5, start + 7, 6, 8)
+        assert np.array_equal(small, big[5:11, 7:15])
+
+    def test_clip_and_bounds(self):
+        """Clipped windows have no links leaving them; windows must fit the world."""
+        links = BinaryTreeMaze.region(2, 100, 100, 5, 5, clip=True)
+        assert not (links[0] & Cell.NORTH).any()
+        assert not (links[:, -1] & Cell.EAST).any()
+
+        with pytest.raises(ValueError):
+            BinaryTreeMaze.region(2, 5, 5, 4, 4, world_rows=8, world_cols=8)
@@ -0,0 +1,76 @@
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.binary_tree import BinaryTreeMaze
+from algorithms.braid import braid, braid_links, dead_ends
+from cell import Cell
+from grid import Grid
+
+
+def _is_consistent(links):
+    """Every link is recorded on both of its cells."""
+    south = (links[:-1] & Cell.SOUTH) != 0
+    north = (links[1:] & Cell.NORTH) != 0
+    east = (links[:, :-1] & Cell.EAST) != 0
+    west = (links[:, 1:] & Cell.WEST) != 0
+    return np.array_equal(south, north) and np.array_equal(east, west)
+
+
+class TestBraid:
+    def test_dead_ends(self):
+        """Cells with exactly one link are dead ends."""
+        links = np.array([[Cell.EAST, Cell.WEST | Cell.EAST, Cell.WEST]], dtype=np.uint8)
+        assert dead_ends(links).tolist() == [[True, False, True]]
+
+    def test_full_braid_removes_all_dead_ends(self):
+        """With p=1 no dead ends are left and every link is two-sided."""
+        maze = BinaryTreeMaze.on(Grid(20, 25), seed=3).to_links()
+        braided = braid_links(maze, 1.0, seed=4)
+
+        assert not dead_ends(braided).any()
+        assert _is_consistent(braided)
+        # Braiding only adds links
+        assert np.array_equal(braided & maze, maze)
+
+    def test_partial_braid(self):
+        """With 0 < p < 1 some, but not all, dead ends are removed."""
+        maze = BinaryTreeMaze.on(Grid(30, 30), seed=3).to_links()
+        before = dead_ends(maze).sum()
+        after = dead_ends(braid_links(maze, 0.5, seed=4)).sum()
+        assert 0 < after < before
+
+        assert np.array_equal(braid_links(maze, 0.0, seed=4), maze)
+
+    def test_prefers_dead_end_neighbors(self):
+        """A dead end next to another dead end is joined to one of them."""
+        maze = BinaryTreeMaze.on(Grid(20, 20), seed=6).to_links()
+        braided = braid_links(maze, 1.0, seed=2)
+        dead = dead_ends(maze)
+        offsets = {Cell.NORTH: (-1, 0), Cell.SOUTH: (1, 0), Cell.EAST: (0, 1), Cell.WEST: (0, -1)}
+
+        checked = 0
+        for r, c in zip(*np.nonzero(dead)):
+            candidates = {}
+            for direction, (dr, dc) in offsets.items():
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < 20 and 0 <= nc < 20 and not maze[r, c] & direction:
+                    candidates[direction] = dead[nr, nc]
+            if any(candidates.values()):
+                added = [d for d in candidates if braided[r, c] & d]
+                assert any(candidates[d] for d in added)
+                checked += 1
+        assert checked > 0
+
+    def test_seed_is_reproducible(self):
+        """The same seed braids the same way."""
+        maze = BinaryTreeMaze.on(Grid(15, 15), seed=3).to_links()
+        assert np.array_equal(braid_links(maze, 0.7, seed=9), braid_links(maze, 0.7, seed=9))
+
+    def test_braid_grid(self):
+        """braid() updates a Grid in place."""
+        grid = BinaryTreeMaze.on(Grid(8, 8), seed=2)
+        assert braid(grid, seed=5) is grid
+        assert not dead_ends(grid.to_links()).any()
@@ -0,0 +1,95 @@
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.batch import generate_batch
+from algorithms.cache import MazeCache, CELL_BYTES, pack_links, unpack_links
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+class TestMazeCache:
+    def test_pack_round_trip(self):
+        """Packed link arrays unpack to the original, including odd cell counts."""
+        links = GeneratorRegistry.generate('prims', Grid(5, 7), seed=1).to_links()
+        packed = pack_links(links)
+
+        assert len(packed) == 8 + 18
+        assert np.array_equal(unpack_links(packed), links)
+
+    def test_memory_hit_returns_same_grid(self):
+        """A second request is served from memory without regenerating."""
+        cache = MazeCache()
+        first = cache.generate('prims', 10, 10, seed=3)
+        second = cache.generate('simplified-prims', 10, 10, seed=3)
+
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_matches_direct_generation(self):
+        """Cached mazes are the mazes the generator produces."""
+        cache = MazeCache()
+        grid = cache.generate('growing-tree', 8, 9, seed=4, policy='oldest')
+        expected = GeneratorRegistry.generate('growing-tree', Grid(8, 9), seed=4, policy='oldest')
+        assert np.array_equal(grid.to_links(), expected.to_links())
+
+    def test_key_includes_options_and_version(self):
+        """Different options, versions or seeds never share an entry."""
+        base = MazeCache.key('growing-tree', 5, 5, 1, policy='newest')
+        assert base != MazeCache.key('growing-tree', 5, 5, 1, policy='oldest')
+        assert base != MazeCache.key('growing-tree', 5, 5, 2, policy='newest')
+        assert GeneratorRegistry.get('growing-tree').version in base
+
+    def test_unseeded_requests_bypass_cache(self):
+        """Without a seed nothing is stored."""
+        cache = MazeCache()
+        cache.generate('binary', 5, 5)
+        assert len(cache) == 0
+        assert MazeCache.key('binary', 5, 5, None) is None
+
+    def test_memory_bound_evicts_least_recently_used(self):
+        """The in-memory tier stays within its byte bound, evicting the oldest entry."""
+        cache = MazeCache(max_bytes=2 * 100 * CELL_BYTES)
+        first = cache.generate('binary', 10, 10, seed=1)
+        cache.generate('binary', 10, 10, seed=2)
+        cache.generate('binary', 10, 10, seed=1)  # Touch seed 1
+        cache.generate('binary', 10, 10, seed=3)
+
+        assert len(cache) == 2
+        assert cache.size_bytes <= cache.max_bytes
+        assert cache.get('binary', 10, 10, 1) is first
+        assert cache.get('binary', 10, 10, 2) is None
+
+    def test_disk_tier(self, tmp_path):
+        """Mazes written to disk are found by a fresh cache."""
+        writer = MazeCache(disk_dir=str(tmp_path))
+        grid = writer.generate('aldous-broder', 6, 6, seed=9)
+
+        reader = MazeCache(disk_dir=str(tmp_path))
+        cached = reader.get('aldous-broder', 6, 6, 9)
+        assert cached is not None and reader.disk_hits == 1
+        assert np.array_equal(cached.to_links(), grid.to_links())
+
+    def test_disk_bound(self, tmp_path):
+        """The disk tier deletes its oldest files to stay within its bound."""
+        cache = MazeCache(disk_dir=str(tmp_path), max_disk_bytes=3 * (8 + 50))
+        for seed in range(6):
+            cache.generate('binary', 10, 10, seed=seed)
+
+        files = [name for name in os.listdir(tmp_path) if name.endswith('.maze')]
+        assert len(files) == 3
+        cache.clear()
+        assert cache.get('binary', 10, 10, 5) is not None
+        assert cache.get('binary', 10, 10, 0) is None
+
+    def test_batch_uses_cache(self):
+        """Batch jobs reuse and fill the cache."""
+        cache = MazeCache()
+        cache.generate('prims', 6, 6, seed=2)
+        batch = generate_batch('prims', 6, 6, seeds=[1, 2, 3], workers=1, cache=cache)
+
+        assert cache.hits == 1
+        assert np.array_equal(cache.get_links('prims', 6, 6, 3), batch[2])
+        assert np.array_equal(generate_batch('prims', 6, 6, seeds=[1, 2, 3], workers=1), batch)
@@ -0,0 +1,91 @@
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.cave import CaveMaze
+from algorithms.streams import stream_key
+from grid import Grid
+from cell import Cell
+from pathfinding.dijkstra import Dijkstra
+
+
+def reachable_cells(links, start):
+    """Flat indices reachable from start by following links."""
+    rows, cols = links.shape
+    flat = links.reshape(-1)
+    steps = ((Cell.NORTH, -cols), (Cell.SOUTH, cols), (Cell.EAST, 1), (Cell.WEST, -1))
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        current = frontier.pop()
+        for direction, offset in steps:
+            if flat[current] & direction and current + offset not in seen:
+                seen.add(current + offset)
+                frontier.append(current + offset)
+    return seen
+
+
+class TestCaveMaze:
+    def test_explain_method(self):
+        """The explain method returns a non-empty string."""
+        assert "CAVE" in CaveMaze.explain()
+
+    def test_caves_are_connected(self):
+        """Every open cell can be reached from the bottom-left cell."""
+        for seed in range(4):
+            links = CaveMaze.on(Grid(30, 40), seed=seed).to_links()
+            start = 29 * 40
+            open_cells = set(np.flatnonzero(links.reshape(-1))) | {start, 39}
+            assert reachable_cells(links, start) == open_cells
+
+    def test_links_are_symmetric(self):
+        """Links are recorded on both cells of a passage."""
+        links = CaveMaze.link_array(stream_key(1), 25, 35)
+        assert np.array_equal((links[:, :-1] & Cell.EAST) != 0, (links[:, 1:] & Cell.WEST) != 0)
+        assert np.array_equal((links[:-1] & Cell.SOUTH) != 0, (links[1:] & Cell.NORTH) != 0)
+
+    def test_seed_is_reproducible(self):
+        """The same seed gives the same cave; different seeds differ."""
+        first = CaveMaze.on(Grid(20, 20), seed=5).to_links()
+        assert np.array_equal(first, CaveMaze.on(Grid(20, 20), seed=5).to_links())
+        assert not np.array_equal(first, CaveMaze.on(Grid(20, 20), seed=6).to_links())
+
+    def test_solvable(self):
+        """Dijkstra finds a path between the standard entrance and exit."""
+        grid = CaveMaze.on(Grid(25, 25), seed=2)
+        path = Dijkstra.shortest_path(grid, grid.at(24, 0), grid.at(0, 24))
+        assert path and path[0] is grid.at(24, 0)
+
+    def test_smoothing_fills_and_opens(self):
+        """Without smoothing the field is the noise; with it, isolated cells disappear."""
+        key = stream_key(3)
+        noise = CaveMaze.field(key, 40, 40, iterations=0)
+        assert 0.4 < 1 - noise.mean() < 0.5
+        smooth = CaveMaze.field(key, 40, 40, iterations=4)
+        assert not np.array_equal(noise, smooth)
+
+    def test_label_regions(self):
+        """Regions are 4-connected: diagonal contact does not join them."""
+        field = np.array([
+            [1, 1, 0, 1],
+            [0, 0, 1, 1],
+            [1, 0, 1, 0],
+            [1, 1, 0, 0],
+        ], dtype=bool)
+        labels, count = CaveMaze.label_regions(field)
+
+        assert count == 3
+        assert labels[0, 0] == labels[0, 1]
+        assert labels[0, 3] == labels[1, 2] == labels[2, 2]
+        assert labels[2, 0] == labels[3, 1]
+        assert labels[0, 0] != labels[0, 3] != labels[3, 0]
+        assert (labels[~field] == -1).all()
+
+    def test_degenerate_grids(self):
+        """Single rows, columns and cells are handled."""
+        assert CaveMaze.on(Grid(1, 1), seed=1).at(0, 0).links == 0
+        for rows, cols in ((1, 12), (12, 1)):
+            links = CaveMaze.on(Grid(rows, cols), seed=1).to_links()
+            assert len(reachable_cells(links, (rows - 1) * cols)) >= 2
@@ -64,6 +64,15 @@ class TestCLI:
         assert "Aldous-Broder Algorithm:" in result.stdout
         assert "Performs a random walk, connecting unvisited cells." in result.stdout
         
+    def test_run_maze_shift_needs_positive_speed(self):
+        """--shift with a non-positive --speed is rejected instead of spinning."""
+        result = subprocess.run([sys.executable, "run_maze.py", "--shift", "--speed", "0"],
+                                capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert result.returncode == 1
+        assert "--shift needs a positive --speed" in result.stdout
+
     def test_main_py_help_short_flag(self):
         """Test the -h flag displays help for main.py."""
         result = subprocess.run([sys.executable, "main.py", "-h"], 
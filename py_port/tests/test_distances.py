@@ -1,6 +1,7 @@
 import sys
 import os
 import pytest
+import numpy as np
 
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -102,4 +103,31 @@ class TestDistances:
         # Create a new cell with the same coordinates
         # This tests that the key is based on coordinates, not object identity
         same_coords = Cell(2, 1)
-        assert distances.get_distance(same_coords) == 42
\ No newline at end of file
+        assert distances.get_distance(same_coords) == 42
+
+    def test_array_backed(self):
+        """Distances live in an int32 array with -1 for unreachable cells."""
+        start = self.grid.at(0, 0)
+        distances = Distances(start, rows=3, cols=3)
+        distances.set_distance(self.grid.at(2, 2), 4)
+
+        assert distances.array.shape == (3, 3)
+        assert distances.array.dtype == np.int32
+        assert distances.array[2, 2] == 4
+        assert distances.array[1, 1] == -1
+        assert distances.cells == {"0,0": 0, "2,2": 4}
+
+    def test_from_array(self):
+        """Wrapping a search result keeps the public API."""
+        array = np.array([[0, 1], [-1, 2]], dtype=np.int32)
+        distances = Distances.from_array(self.grid.at(0, 0), array)
+
+        assert distances.get_distance(self.grid.at(1, 1)) == 2
+        assert distances.get_distance(self.grid.at(1, 0)) == sys.maxsize
+        assert distances.get_distance(self.grid.at(2, 2)) == sys.maxsize
+        assert distances.get_max_cell(self.grid) == self.grid.at(1, 1)
+
+    def test_max_cell_of_isolated_root(self):
+        """With nothing reachable, the root is the farthest cell."""
+        start = self.grid.at(1, 1)
+        assert Distances(start, rows=3, cols=3).get_max_cell(self.grid) == start
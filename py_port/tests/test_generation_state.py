@@ -0,0 +1,84 @@
+import sys
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.aldous_broder import AldousBroderMaze
+from algorithms.generation_state import GenerationState
+from grid import Grid
+
+
+def _continue_in_worker(state):
+    """Finish a generation from a checkpoint inside another process."""
+    return AldousBroderMaze.run(state=state)
+
+
+class TestGenerationState:
+    def test_budgeted_run_returns_incomplete_state(self):
+        """A run stopped by max_iterations reports where it stopped."""
+        grid = Grid(8, 8)
+        state = AldousBroderMaze.run(grid, max_iterations=10, seed=4)
+
+        assert not state.complete
+        assert state.iterations == 10
+        assert 1 <= state.visited_count <= 11
+        assert state.visited_mask().sum() == state.visited_count
+        assert state.visited_mask()[state.current]
+        assert np.array_equal(state.link_array(), grid.to_links())
+
+    def test_sliced_run_matches_uninterrupted_run(self, is_perfect_links):
+        """Resuming in slices produces exactly the same maze as one run."""
+        full = Grid(10, 10)
+        AldousBroderMaze.on(full, seed=21)
+
+        sliced = Grid(10, 10)
+        state = AldousBroderMaze.run(sliced, max_iterations=37, seed=21)
+        slices = 1
+        while not state.complete:
+            state = AldousBroderMaze.run(sliced, max_iterations=37, state=state)
+            slices += 1
+
+        assert slices > 1
+        assert np.array_equal(sliced.to_links(), full.to_links())
+        assert is_perfect_links(sliced.to_links())
+
+    def test_on_resumes_from_state(self):
+        """on() accepts a state and reports only the iterations it performed."""
+        grid = Grid(6, 6)
+        state = AldousBroderMaze.run(grid, max_iterations=5, seed=2)
+        _, iterations = AldousBroderMaze.on(grid, max_iterations=7, state=state)
+
+        assert iterations == 7
+
+    def test_save_and_load(self, tmp_path):
+        """States survive a round trip through a file."""
+        state = AldousBroderMaze.run(Grid(7, 5), max_iterations=20, seed=9)
+        filename = tmp_path / "checkpoint.pkl"
+        state.save(filename)
+
+        loaded = GenerationState.load(filename)
+        assert loaded == state
+        assert np.array_equal(loaded.restore_grid().to_links(), state.link_array())
+
+    def test_resume_in_another_process(self):
+        """A pickled state can be finished in a different process."""
+        expected = Grid(9, 9)
+        AldousBroderMaze.on(expected, seed=33)
+
+        state = AldousBroderMaze.run(Grid(9, 9), max_iterations=50, seed=33)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            finished = pool.submit(_continue_in_worker, pickle.loads(pickle.dumps(state))).result()
+
+        assert finished.complete
+        assert np.array_equal(finished.link_array(), expected.to_links())
+
+    def test_mismatched_grid_is_rejected(self):
+        """Resuming onto a grid of a different size raises a ValueError."""
+        state = AldousBroderMaze.run(Grid(4, 4), max_iterations=3, seed=1)
+        with pytest.raises(ValueError):
+            AldousBroderMaze.run(Grid(5, 5), state=state)
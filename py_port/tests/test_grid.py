@@ -2,6 +2,7 @@ import sys
 import os
 import pytest
 from unittest.mock import patch
+import numpy as np
 
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -89,6 +90,19 @@ class TestGrid:
         assert grid.at(1, 1).linked(Cell.EAST) is True
         assert grid.at(1, 1).linked(Cell.SOUTH) is True
 
+    def test_unlink_cells(self):
+        """Test removing a link between cells."""
+        grid = Grid(3, 3)
+        grid.link_cells(1, 1, Cell.EAST)
+        grid.link_cells(1, 1, Cell.SOUTH)
+
+        # Unlink from the other side of the wall
+        grid.unlink_cells(1, 2, Cell.WEST)
+
+        assert grid.at(1, 1).linked(Cell.EAST) is False
+        assert grid.at(1, 2).linked(Cell.WEST) is False
+        assert grid.at(1, 1).linked(Cell.SOUTH) is True
+
     def test_display(self):
         """Test maze display functionality."""
         # Create a simple 2x2 grid
@@ -118,4 +132,62 @@ class TestGrid:
         assert "|       |" in output
 
         # There should be a south opening from (0,0)
-        assert "+   +" in output
\ No newline at end of file
+        assert "+   +" in output
+
+    def test_link_array_round_trip(self):
+        """Test exporting links to an array and loading them back."""
+        grid = Grid(2, 3)
+        grid.link_cells(0, 0, Cell.EAST)
+        grid.link_cells(0, 1, Cell.SOUTH)
+
+        links = grid.to_links()
+        assert links.shape == (2, 3)
+        assert links[0, 0] == Cell.EAST
+        assert links[0, 1] == Cell.WEST | Cell.SOUTH
+
+        restored = Grid.from_links(links)
+        assert restored.at(1, 1).linked(Cell.NORTH)
+        assert (restored.to_links() == links).all()
+
+        with pytest.raises(ValueError):
+            grid.apply_links(links[:1])
+
+    def test_neighbor_table(self):
+        """Test the flat-index neighbor table."""
+        grid = Grid(2, 3)
+        table = grid.neighbor_table()
+
+        assert table.shape == (6, 4)
+        # Columns follow NEIGHBOR_DIRECTIONS: north, south, east, west
+        assert list(table[0]) == [-1, 3, 1, -1]
+        assert list(table[4]) == [1, -1, 5, 3]
+
+    def test_full_links(self):
+        """Test the fully linked link array."""
+        links = Grid.full_links(2, 3)
+
+        assert links[0, 0] == Cell.SOUTH | Cell.EAST
+        assert links[1, 1] == Cell.NORTH | Cell.EAST | Cell.WEST
+        assert links[0, 2] == Cell.SOUTH | Cell.WEST
+
+    def test_clip_links(self):
+        """Test dropping links that lead out of a window."""
+        links = Grid.clip_links(Grid.full_links(4, 4)[1:3, 1:3] | Cell.NORTH)
+
+        assert links[0, 0] == Cell.SOUTH | Cell.EAST
+        assert links[1, 1] == Cell.NORTH | Cell.WEST
+
+    def test_link_bands(self):
+        """Test adding and applying bands of rows."""
+        grid = Grid(3, 2)
+        band = np.array([[Cell.EAST, Cell.WEST]], dtype=np.uint8)
+
+        grid.add_links(band, row_start=1)
+        assert grid.at(1, 0).linked(Cell.EAST)
+        assert not grid.at(0, 0).linked(Cell.EAST)
+
+        grid.apply_links(np.zeros((1, 2), dtype=np.uint8), row_start=1)
+        assert grid.at(1, 0).links == 0
+
+        with pytest.raises(ValueError):
+            grid.add_links(band, row_start=3)
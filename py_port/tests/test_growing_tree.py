@@ -0,0 +1,99 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms import growing_tree
+from algorithms.growing_tree import GrowingTreeMaze
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+class TestGrowingTreeMaze:
+    def test_explain_method(self):
+        """The explain method returns a non-empty string."""
+        assert "GROWING TREE" in GrowingTreeMaze.explain()
+
+    @pytest.mark.parametrize("policy", ["newest", "random", "oldest", "mixed"])
+    def test_policies_create_perfect_mazes(self, policy, is_perfect_links):
+        """Every built-in policy produces a perfect maze."""
+        grid = GrowingTreeMaze.on(Grid(11, 13), seed=4, policy=policy)
+        assert is_perfect_links(grid.to_links())
+
+    def test_seed_is_reproducible(self):
+        """The same seed and policy give the same maze."""
+        first = GrowingTreeMaze.on(Grid(10, 10), seed=8, policy='mixed', mix=0.3).to_links()
+        second = GrowingTreeMaze.on(Grid(10, 10), seed=8, policy='mixed', mix=0.3).to_links()
+        assert np.array_equal(first, second)
+
+    def test_policies_change_texture(self):
+        """newest grows long corridors, random leaves many more dead ends."""
+        def dead_ends(links):
+            counts = np.unpackbits(links[..., None], axis=-1).sum(axis=-1)
+            return int((counts == 1).sum())
+
+        newest = GrowingTreeMaze.on(Grid(30, 30), seed=2, policy='newest').to_links()
+        random = GrowingTreeMaze.on(Grid(30, 30), seed=2, policy='random').to_links()
+        assert dead_ends(newest) < dead_ends(random)
+
+    def test_mix_of_one_always_picks_newest(self):
+        """mix=1.0 always picks the newest cell."""
+        mixed = GrowingTreeMaze.policy('mixed', mix=1.0)
+        assert mixed(5, lambda: 0.99) == 4
+
+    def test_custom_policy(self, is_perfect_links):
+        """A callable policy is used as-is."""
+        calls = []
+
+        def second_newest(count, random):
+            calls.append(count)
+            return max(0, count - 2)
+
+        grid = GrowingTreeMaze.on(Grid(8, 8), seed=1, policy=second_newest)
+        assert calls
+        assert is_perfect_links(grid.to_links())
+
+    def test_oldest_policy_on_large_grid(self, is_perfect_links):
+        """The oldest policy drains its active list without losing cells."""
+        grid = GrowingTreeMaze.on(Grid(80, 80), seed=3, policy='oldest')
+        assert is_perfect_links(grid.to_links())
+
+    @pytest.mark.parametrize("policy", ["newest", "random", "oldest", "mixed"])
+    def test_block_size_does_not_change_the_maze(self, policy, monkeypatch):
+        """Splitting the active list into many small blocks keeps its age order."""
+        expected = GrowingTreeMaze.on(Grid(24, 24), seed=6, policy=policy).to_links()
+        monkeypatch.setattr(growing_tree, 'BLOCK_SIZE', 3)
+        grid = GrowingTreeMaze.on(Grid(24, 24), seed=6, policy=policy)
+        assert np.array_equal(grid.to_links(), expected)
+
+    @pytest.mark.parametrize("policy", ["newest", "mixed"])
+    def test_tail_block_stays_bounded(self, policy, monkeypatch):
+        """The tail block never grows past BLOCK_SIZE, even after a full block is reopened."""
+        monkeypatch.setattr(growing_tree, 'BLOCK_SIZE', 4)
+        select = GrowingTreeMaze.policy(policy)
+        tail_sizes = []
+
+        def watched(count, random):
+            # The active list's tail block is a local of GrowingTreeMaze.on
+            tail_sizes.append(len(sys._getframe(1).f_locals['tail']))
+            return select(count, random)
+
+        GrowingTreeMaze.on(Grid(30, 30), seed=6, policy=watched)
+        assert max(tail_sizes) <= 4
+
+    def test_unknown_policy(self):
+        """An unknown policy name raises ValueError."""
+        with pytest.raises(ValueError):
+            GrowingTreeMaze.on(Grid(3, 3), seed=1, policy='sideways')
+
+    def test_registry_passes_options(self):
+        """Policy options given to the registry reach the generator."""
+        spec = GeneratorRegistry.get('growing-tree')
+        options = spec.option_values({'policy': 'oldest', 'mix': None, 'theme': 'retro'})
+        assert options == {'policy': 'oldest'}
+
+        grid = GeneratorRegistry.generate('growing_tree', Grid(6, 6), seed=5, **options)
+        expected = GrowingTreeMaze.on(Grid(6, 6), seed=5, policy='oldest')
+        assert np.array_equal(grid.to_links(), expected.to_links())
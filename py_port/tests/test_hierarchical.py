@@ -0,0 +1,81 @@
+import sys
+import os
+import random
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathfinding.bfs import BreadthFirstSearch, flat_links, link_steps
+from pathfinding.hierarchical import HierarchicalPathfinder
+from algorithms.braid import braid
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+def random_pairs(cells, count, seed=0):
+    rng = random.Random(seed)
+    return [(rng.randrange(cells), rng.randrange(cells)) for _ in range(count)]
+
+
+class TestHierarchicalPathfinder:
+    @pytest.mark.parametrize("cluster_size", [1, 4, 7, 50])
+    @pytest.mark.parametrize("algorithm", ['growing-tree', 'binary', 'recursive-division'])
+    def test_shortest_paths_in_perfect_mazes(self, algorithm, cluster_size):
+        """In perfect mazes, paths are shortest paths."""
+        grid = GeneratorRegistry.generate(algorithm, Grid(24, 20), seed=5)
+        links = flat_links(grid)
+        steps = link_steps(20)
+        finder = HierarchicalPathfinder.from_grid(grid, cluster_size)
+        for start, end in random_pairs(480, 25):
+            result = finder.search(start, end)
+            assert result.distance == BreadthFirstSearch.search(links, 20, start, end).distance
+            assert result.path[0] == start and result.path[-1] == end
+            assert all(b - a in steps[links[a]] for a, b in zip(result.path, result.path[1:]))
+
+    @pytest.mark.parametrize("maze", ['cave', 'braided'])
+    def test_paths_with_shared_entrances_are_valid_and_near_shortest(self, maze):
+        """Runs of crossings share entrances in caves and braided mazes, so paths may be a little longer."""
+        if maze == 'braided':
+            grid = braid(GeneratorRegistry.generate('growing-tree', Grid(40, 40), seed=2), 1.0, seed=2)
+        else:
+            grid = GeneratorRegistry.generate('cave', Grid(40, 40), seed=2)
+        links = flat_links(grid)
+        steps = link_steps(40)
+        finder = HierarchicalPathfinder.from_grid(grid, 8)
+        for start, end in random_pairs(1600, 40, seed=3):
+            result = finder.search(start, end)
+            shortest = BreadthFirstSearch.search(links, 40, start, end)
+            assert result.found == shortest.found
+            if result.found:
+                assert shortest.distance <= result.distance <= 1.5 * shortest.distance + 2
+                assert all(b - a in steps[links[a]] for a, b in zip(result.path, result.path[1:]))
+
+    def test_long_runs_get_two_entrances(self):
+        """An open border is entered at both ends of the run of crossings."""
+        finder = HierarchicalPathfinder(Grid.full_links(10, 20), cluster_size=10)
+        assert sorted(finder.crossings) == [9, 10, 189, 190]
+
+    def test_cluster_distances_are_cached(self):
+        """Clusters are computed once and reused by later queries."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(30, 30), seed=8)
+        finder = HierarchicalPathfinder.from_grid(grid, 10)
+        finder.search(29 * 30, 29)
+        computed = finder.expanded_clusters
+        assert 0 < computed <= 9
+        finder.search(29 * 30, 29)
+        assert finder.expanded_clusters == computed
+        finder.precompute()
+        assert finder.expanded_clusters == len(finder.cluster_nodes)
+
+    def test_unreachable_and_trivial(self, sample_3x3_grid):
+        """Walled-in cells cannot be reached; a cell reaches itself."""
+        finder = HierarchicalPathfinder.from_grid(sample_3x3_grid, 2)
+        assert not finder.search(0, 4).found
+        assert finder.search(4, 4).path == [4]
+        path = finder.path_cells(sample_3x3_grid, sample_3x3_grid.at(0, 0), sample_3x3_grid.at(0, 2))
+        assert [(cell.row, cell.col) for cell in path] == [(0, 0), (0, 1), (0, 2)]
+
+    def test_invalid_cluster_size(self):
+        with pytest.raises(ValueError):
+            HierarchicalPathfinder(np.zeros((2, 2), dtype=np.uint8), cluster_size=0)
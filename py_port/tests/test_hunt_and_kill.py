@@ -0,0 +1,53 @@
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.hunt_and_kill import HuntAndKillMaze
+from grid import Grid
+
+
+class TestHuntAndKillMaze:
+    def test_explain_method(self):
+        """The explain method returns a non-empty string."""
+        assert "HUNT-AND-KILL" in HuntAndKillMaze.explain()
+
+    def test_creates_perfect_maze(self, is_perfect_links):
+        """Every cell is reachable and there are no loops."""
+        for seed in range(4):
+            grid = HuntAndKillMaze.on(Grid(14, 11), seed=seed)
+            assert is_perfect_links(grid.to_links())
+
+    def test_seed_is_reproducible(self):
+        """The same seed gives the same maze; different seeds differ."""
+        first = HuntAndKillMaze.on(Grid(10, 10), seed=8).to_links()
+        second = HuntAndKillMaze.on(Grid(10, 10), seed=8).to_links()
+        other = HuntAndKillMaze.on(Grid(10, 10), seed=9).to_links()
+
+        assert np.array_equal(first, second)
+        assert not np.array_equal(first, other)
+
+    def test_degenerate_grids(self, is_perfect_links):
+        """Single cells, rows and columns are handled."""
+        assert HuntAndKillMaze.on(Grid(1, 1), seed=1).at(0, 0).links == 0
+        assert is_perfect_links(HuntAndKillMaze.on(Grid(1, 9), seed=1).to_links())
+        assert is_perfect_links(HuntAndKillMaze.on(Grid(9, 1), seed=1).to_links())
+
+    def test_hunt_finds_first_candidate(self):
+        """The hunt returns the first unvisited cell touching a visited cell."""
+        visited = np.array([
+            [1, 1, 1],
+            [0, 1, 0],
+            [0, 0, 0],
+        ], dtype=np.uint8)
+        assert HuntAndKillMaze.hunt(visited) == (1, 0)
+
+        visited = np.array([
+            [0, 0, 0],
+            [0, 0, 0],
+            [0, 0, 1],
+        ], dtype=np.uint8)
+        assert HuntAndKillMaze.hunt(visited) == (1, 2)
+
+        assert HuntAndKillMaze.hunt(np.ones((2, 2), dtype=np.uint8)) is None
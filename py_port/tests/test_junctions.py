@@ -0,0 +1,65 @@
+import sys
+import os
+import random
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathfinding.bfs import BreadthFirstSearch, flat_links, link_steps
+from pathfinding.junctions import JunctionGraph
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+def check_path(links, cols, path, start, end):
+    steps = link_steps(cols)
+    assert path[0] == start and path[-1] == end
+    assert all(b - a in steps[links[a]] for a, b in zip(path, path[1:]))
+
+
+class TestJunctionGraph:
+    def test_corridor_is_one_edge(self):
+        """A 1xN corridor contracts to two dead ends and one edge."""
+        grid = Grid.from_links(Grid.full_links(1, 6))
+        graph = JunctionGraph.from_grid(grid)
+        assert graph.nodes == [0, 5]
+        assert graph.edge_count == 1
+        assert graph.edge_length == [5]
+        assert graph.corridor == [1, 2, 3, 4]
+        assert graph.search(2, 4).path == [2, 3, 4]
+        assert graph.search(4, 1).path == [4, 3, 2, 1]
+        assert graph.search(0, 5).path == [0, 1, 2, 3, 4, 5]
+
+    def test_ring_without_junctions(self):
+        """A loop of degree-2 cells gets a node of its own."""
+        graph = JunctionGraph(flat_links(Grid.from_links(Grid.full_links(2, 2))), 2)
+        assert graph.node_count == 1
+        assert graph.search(1, 2).distance == 2
+        assert graph.search(0, 3).distance == 2
+
+    @pytest.mark.parametrize("algorithm", ['growing-tree', 'cave', 'recursive-division'])
+    def test_matches_breadth_first_search(self, algorithm):
+        """Graph paths are shortest paths and expand back to linked cells."""
+        grid = GeneratorRegistry.generate(algorithm, Grid(25, 25), seed=12)
+        links = flat_links(grid)
+        graph = JunctionGraph(links, 25)
+        pairs = random.Random(7).sample(range(625), 60)
+        for start, end in zip(pairs[::2], pairs[1::2]):
+            result = graph.search(start, end)
+            assert result.distance == BreadthFirstSearch.search(links, 25, start, end).distance
+            if result.found:
+                check_path(links, 25, result.path, start, end)
+
+    def test_contracts_perfect_mazes(self):
+        """Perfect mazes shrink to a tree with far fewer nodes than cells."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(30, 30), seed=1)
+        graph = JunctionGraph.from_grid(grid)
+        assert graph.edge_count == graph.node_count - 1
+        assert graph.stats()['contraction'] > 2
+        path = graph.path_cells(grid, grid.at(29, 0), grid.at(0, 29))
+        assert path[0] is grid.at(29, 0) and path[-1] is grid.at(0, 29)
+
+    def test_unreachable(self, sample_3x3_grid):
+        """Cells with no links are isolated nodes."""
+        graph = JunctionGraph.from_grid(sample_3x3_grid)
+        assert not graph.search(0, 4).found
@@ -0,0 +1,57 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathfinding.bfs import BreadthFirstSearch, flat_links, link_steps
+from pathfinding.lca import TreeDistanceOracle
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+@pytest.fixture
+def perfect_maze():
+    return GeneratorRegistry.generate('growing-tree', Grid(15, 12), seed=9)
+
+
+class TestTreeDistanceOracle:
+    def test_distances_match_breadth_first_search(self, perfect_maze):
+        """Every distance from a few sources agrees with a BFS."""
+        oracle = TreeDistanceOracle.from_grid(perfect_maze)
+        links = flat_links(perfect_maze)
+        for source in (0, 37, 179):
+            expected = BreadthFirstSearch.distance_list(links, 12, source)
+            assert [oracle.distance(source, cell) for cell in range(180)] == expected
+            assert oracle.distances(np.full(180, source), np.arange(180)).tolist() == expected
+
+    def test_paths(self, perfect_maze):
+        """Paths run from a to b along links and have the queried length."""
+        oracle = TreeDistanceOracle.from_grid(perfect_maze, root=(7, 5))
+        steps = link_steps(12)
+        links = flat_links(perfect_maze)
+        for a, b in ((0, 179), (179, 0), (50, 50), (13, 100)):
+            path = oracle.path(a, b)
+            assert path[0] == a and path[-1] == b
+            assert len(path) - 1 == oracle.distance(a, b)
+            assert all(y - x in steps[links[x]] for x, y in zip(path, path[1:]))
+
+        cells = oracle.path_cells(perfect_maze, perfect_maze.at(14, 0), perfect_maze.at(0, 11))
+        assert cells[0] is perfect_maze.at(14, 0) and cells[-1] is perfect_maze.at(0, 11)
+
+    def test_single_cell(self):
+        """A 1x1 maze is a tree with one node."""
+        oracle = TreeDistanceOracle(np.zeros((1, 1), dtype=np.uint8))
+        assert oracle.distance(0, 0) == 0
+        assert oracle.path(0, 0) == [0]
+
+    def test_rejects_loops(self):
+        """A maze with a loop is not a tree."""
+        with pytest.raises(ValueError, match="loop"):
+            TreeDistanceOracle(Grid.full_links(2, 2))
+
+    def test_rejects_disconnected_mazes(self):
+        """A maze with unreachable cells is not a tree."""
+        with pytest.raises(ValueError, match="reached"):
+            TreeDistanceOracle(np.zeros((2, 2), dtype=np.uint8))
@@ -0,0 +1,110 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.origin_shift import OriginShiftMaze, LinkDelta
+from algorithms.hunt_and_kill import HuntAndKillMaze
+from grid import Grid
+from visualization import TextRenderer
+
+
+class TestOriginShiftMaze:
+    def test_explain_method(self):
+        """The explain method returns a non-empty string."""
+        assert "ORIGIN SHIFT" in OriginShiftMaze.explain()
+
+    def test_initial_maze_is_perfect(self, is_perfect_links):
+        """The starting tree is a perfect maze rooted at the top-right cell."""
+        engine = OriginShiftMaze(5, 7)
+        assert engine.origin == 6
+        assert is_perfect_links(engine.link_array())
+
+    def test_creates_perfect_maze(self, is_perfect_links):
+        """on() gives perfect mazes and the same seed gives the same maze."""
+        for seed in range(3):
+            grid = OriginShiftMaze.on(Grid(12, 9), seed=seed)
+            assert is_perfect_links(grid.to_links())
+
+        first = OriginShiftMaze.on(Grid(10, 10), seed=4).to_links()
+        second = OriginShiftMaze.on(Grid(10, 10), seed=4).to_links()
+        other = OriginShiftMaze.on(Grid(10, 10), seed=5).to_links()
+        assert np.array_equal(first, second)
+        assert not np.array_equal(first, other)
+
+    def test_steps_keep_maze_perfect(self, is_perfect_links):
+        """Each step changes at most two walls and the maze stays perfect."""
+        engine = OriginShiftMaze(8, 6, seed=3)
+        for _ in range(500):
+            deltas = engine.step()
+            assert len(deltas) in (0, 2)
+        assert engine.steps == 500
+        assert is_perfect_links(engine.link_array())
+
+    def test_deltas_reproduce_link_array(self):
+        """Applying the reported deltas to a grid tracks the engine's maze."""
+        engine = OriginShiftMaze(7, 9, seed=11)
+        grid = engine.to_grid()
+        renderer = TextRenderer(use_color=False)
+        for _ in range(50):
+            touched = renderer.apply_deltas(grid, engine.run(20))
+            assert all(grid.is_valid(r, c) for r, c in touched)
+        assert np.array_equal(grid.to_links(), engine.link_array())
+
+    def test_advance_matches_run(self):
+        """advance() makes the same moves as run() without recording them."""
+        recorded = OriginShiftMaze(6, 6, seed=2)
+        recorded.run(300)
+        silent = OriginShiftMaze(6, 6, seed=2)
+        silent.advance(300)
+        assert silent.parents == recorded.parents
+        assert silent.origin == recorded.origin
+
+    def test_from_grid(self, is_perfect_links):
+        """An engine can continue from an existing perfect maze."""
+        grid = HuntAndKillMaze.on(Grid(9, 9), seed=1)
+        engine = OriginShiftMaze.from_grid(grid, origin=(4, 4), seed=1)
+        assert np.array_equal(engine.link_array(), grid.to_links())
+
+        engine.run(200)
+        assert is_perfect_links(engine.link_array())
+
+    def test_from_grid_rejects_imperfect_maze(self):
+        """Mazes with loops or unreachable cells have no parent tree."""
+        with pytest.raises(ValueError):
+            OriginShiftMaze.from_grid(Grid(3, 3))
+        with pytest.raises(ValueError):
+            OriginShiftMaze.from_grid(Grid.from_links(Grid.full_links(3, 3)))
+
+    def test_degenerate_grids(self, is_perfect_links):
+        """Single cells, rows and columns are handled."""
+        assert OriginShiftMaze(1, 1, seed=1).step() == []
+        assert OriginShiftMaze.on(Grid(1, 1), seed=1).at(0, 0).links == 0
+        assert is_perfect_links(OriginShiftMaze.on(Grid(1, 9), seed=1).to_links())
+        assert is_perfect_links(OriginShiftMaze.on(Grid(9, 1), seed=1).to_links())
+
+
+class TestIncrementalText:
+    def test_patch_canvas_matches_full_render(self):
+        """Patching a canvas with deltas gives the same text as rendering again."""
+        engine = OriginShiftMaze(6, 8, seed=7)
+        grid = engine.to_grid()
+        renderer = TextRenderer(use_color=False)
+        canvas = renderer.wall_canvas(grid)
+        for _ in range(100):
+            deltas = engine.step()
+            renderer.apply_deltas(grid, deltas)
+            renderer.patch_canvas(canvas, deltas)
+        assert renderer.canvas_text(canvas) == grid.display()
+
+    def test_patch_canvas_all_directions(self):
+        """Deltas given from either side of a wall patch the same characters."""
+        renderer = TextRenderer(use_color=False)
+        grid = Grid(2, 2)
+        canvas = renderer.wall_canvas(grid)
+        renderer.patch_canvas(canvas, [LinkDelta(1, 1, 1, True), LinkDelta(1, 1, 8, True)])
+        grid.link_cells(0, 1, 2)
+        grid.link_cells(1, 0, 4)
+        assert renderer.canvas_text(canvas) == grid.display()
@@ -0,0 +1,67 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.prims import SimplifiedPrimsMaze, TruePrimsMaze
+from algorithms.indexed_set import IndexedSet
+from grid import Grid
+
+
+class TestIndexedSet:
+    def test_add_remove_contains(self):
+        """Items can be added, found and removed."""
+        active = IndexedSet(10)
+        for item in (3, 7, 1, 7):
+            active.add(item)
+
+        assert len(active) == 3
+        assert 7 in active and 5 not in active
+
+        active.remove(3)
+        assert 3 not in active
+        assert sorted(active) == [1, 7]
+
+        with pytest.raises(KeyError):
+            active.remove(3)
+
+    def test_positions_stay_consistent(self):
+        """Swap-removal keeps the position table in sync with the items."""
+        active = IndexedSet(20)
+        for item in range(20):
+            active.add(item)
+        for item in (0, 19, 5, 10, 6):
+            active.remove(item)
+
+        for index, item in enumerate(active.items):
+            assert active.positions[item] == index
+        assert active.pick(0.0) == active.items[0]
+        assert active.pick(0.999) == active.items[-1]
+
+
+@pytest.mark.parametrize("maze_class", [SimplifiedPrimsMaze, TruePrimsMaze])
+class TestPrimsMaze:
+    def test_explain_method(self, maze_class):
+        """The explain method returns a non-empty string."""
+        assert "PRIM'S ALGORITHM" in maze_class.explain()
+
+    def test_creates_perfect_maze(self, maze_class, is_perfect_links):
+        """Every cell is reachable and there are no loops."""
+        grid = maze_class.on(Grid(12, 9), seed=5)
+        assert is_perfect_links(grid.to_links())
+
+    def test_seed_is_reproducible(self, maze_class):
+        """The same seed gives the same maze; different seeds differ."""
+        first = maze_class.on(Grid(10, 10), seed=8).to_links()
+        second = maze_class.on(Grid(10, 10), seed=8).to_links()
+        other = maze_class.on(Grid(10, 10), seed=9).to_links()
+
+        assert np.array_equal(first, second)
+        assert not np.array_equal(first, other)
+
+    def test_single_cell_and_single_row(self, maze_class, is_perfect_links):
+        """Degenerate grids are handled."""
+        assert maze_class.on(Grid(1, 1), seed=1).at(0, 0).links == 0
+        assert is_perfect_links(maze_class.on(Grid(1, 7), seed=1).to_links())
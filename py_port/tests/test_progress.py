@@ -0,0 +1,72 @@
+import sys
+import os
+import pytest
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.aldous_broder import AldousBroderMaze
+from algorithms.binary_tree import BinaryTreeMaze
+from algorithms.progress import commit_links
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+class TestProgress:
+    @pytest.mark.parametrize("name", GeneratorRegistry.list_generators())
+    def test_every_generator_reports(self, name):
+        """Every generator reports monotonic progress and finishes with all cells visited."""
+        calls = []
+        grid = GeneratorRegistry.generate(name, Grid(20, 30), seed=3,
+                                          progress=lambda *report: calls.append(report), every=100)
+
+        assert calls
+        assert calls[-1][:2] == (600, 600)
+        visited = [report[0] for report in calls]
+        assert visited == sorted(visited)
+        assert all(total == 600 for _, total, _ in calls)
+
+        # Reporting does not change the maze
+        expected = GeneratorRegistry.generate(name, Grid(20, 30), seed=3)
+        assert np.array_equal(grid.to_links(), expected.to_links())
+
+    @pytest.mark.parametrize("name", GeneratorRegistry.list_generators())
+    @pytest.mark.parametrize("every", [0, -5])
+    def test_every_must_be_positive(self, name, every):
+        """A report interval below 1 is rejected instead of stalling the generator."""
+        with pytest.raises(ValueError, match="every"):
+            GeneratorRegistry.generate(name, Grid(6, 6), seed=1, progress=lambda *report: None, every=every)
+
+    def test_direct_calls_check_every(self):
+        """Generators called without the registry reject it too."""
+        with pytest.raises(ValueError):
+            AldousBroderMaze.run(Grid(6, 6), seed=1, progress=lambda *report: None, every=0)
+        with pytest.raises(ValueError):
+            BinaryTreeMaze.on(Grid(6, 6), progress=lambda *report: None, every=0)
+        with pytest.raises(ValueError):
+            commit_links(Grid(2, 2), np.zeros((2, 2), dtype=np.uint8), lambda *report: None, every=0)
+
+    def test_reports_are_spaced_by_every(self):
+        """A walk reports once per `every` steps, plus once at the end."""
+        calls = []
+        AldousBroderMaze.on(Grid(15, 15), seed=2, progress=lambda *report: calls.append(report), every=500)
+
+        iterations = [report[2] for report in calls]
+        assert all(b - a == 500 for a, b in zip(iterations, iterations[1:-1]))
+        assert iterations[-1] - iterations[-2] <= 500
+
+    def test_unseeded_generation_reports(self):
+        """The legacy (unseeded) Binary Tree loop also reports by rows."""
+        calls = []
+        BinaryTreeMaze.on(Grid(10, 10), progress=lambda *report: calls.append(report), every=30)
+
+        assert [report[0] for report in calls] == [30, 60, 90, 100]
+
+    def test_commit_links_bands(self):
+        """commit_links writes the same links band by band."""
+        links = BinaryTreeMaze.link_array(BinaryTreeMaze.draws(5, 9, 7))
+        calls = []
+        grid = commit_links(Grid(9, 7), links, lambda *report: calls.append(report), every=14)
+
+        assert np.array_equal(grid.to_links(), links)
+        assert [report[0] for report in calls] == [14, 28, 42, 56, 63]
@@ -0,0 +1,53 @@
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.recursive_division import RecursiveDivisionMaze
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+class TestRecursiveDivisionMaze:
+    def test_explain_method(self):
+        """The explain method returns a non-empty string."""
+        assert "RECURSIVE DIVISION" in RecursiveDivisionMaze.explain()
+
+    def test_creates_perfect_maze(self, is_perfect_links):
+        """Every cell is reachable and there are no loops."""
+        for seed in range(5):
+            grid = RecursiveDivisionMaze.on(Grid(13, 17), seed=seed)
+            assert is_perfect_links(grid.to_links())
+
+    def test_seed_is_reproducible(self):
+        """The same seed gives the same maze; different seeds differ."""
+        first = RecursiveDivisionMaze.on(Grid(10, 10), seed=8).to_links()
+        second = RecursiveDivisionMaze.on(Grid(10, 10), seed=8).to_links()
+        other = RecursiveDivisionMaze.on(Grid(10, 10), seed=9).to_links()
+
+        assert np.array_equal(first, second)
+        assert not np.array_equal(first, other)
+
+    def test_replaces_existing_links(self, is_perfect_links):
+        """Division defines the whole maze, whatever the grid held before."""
+        grid = Grid.from_links(Grid.full_links(6, 6))
+        RecursiveDivisionMaze.on(grid, seed=2)
+        assert is_perfect_links(grid.to_links())
+
+    def test_rooms_stay_open(self):
+        """With a room size, chambers that small are not divided."""
+        links = RecursiveDivisionMaze.on(Grid(4, 4), seed=1, room_size=4).to_links()
+        assert np.array_equal(links, Grid.full_links(4, 4))
+
+    def test_degenerate_grids(self, is_perfect_links):
+        """Single rows and columns are already corridors."""
+        assert is_perfect_links(RecursiveDivisionMaze.on(Grid(1, 6), seed=1).to_links())
+        assert is_perfect_links(RecursiveDivisionMaze.on(Grid(6, 1), seed=1).to_links())
+        assert RecursiveDivisionMaze.on(Grid(1, 1), seed=1).at(0, 0).links == 0
+
+    def test_registered(self):
+        """The generator is available through the registry."""
+        grid = GeneratorRegistry.generate('division', Grid(5, 5), seed=3)
+        expected = RecursiveDivisionMaze.on(Grid(5, 5), seed=3)
+        assert np.array_equal(grid.to_links(), expected.to_links())
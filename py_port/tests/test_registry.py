@@ -0,0 +1,63 @@
+import sys
+import os
+import subprocess
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.registry import GeneratorRegistry, GeneratorSpec
+from algorithms.binary_tree import BinaryTreeMaze
+from grid import Grid
+
+
+class TestGeneratorRegistry:
+    def test_builtin_generators(self):
+        """The original three algorithms are registered under their CLI names."""
+        names = GeneratorRegistry.list_generators()
+        assert names[:3] == ['binary', 'sidewinder', 'aldous-broder']
+
+    def test_aliases(self):
+        """Alternative spellings resolve to the canonical entry."""
+        assert GeneratorRegistry.get('binary_tree').name == 'binary'
+        assert GeneratorRegistry.get('aldous_broder').name == 'aldous-broder'
+
+    def test_unknown_generator(self):
+        """Unknown names raise a ValueError listing the alternatives."""
+        with pytest.raises(ValueError, match="Available algorithms"):
+            GeneratorRegistry.get('nope')
+
+    def test_load_entry_point(self):
+        """Specs import their generator class on demand."""
+        assert GeneratorRegistry.get('binary').load() is BinaryTreeMaze
+
+    def test_find_by_capability(self):
+        """find() filters on capabilities and orders by speed."""
+        uniform = [spec.name for spec in GeneratorRegistry.find(uniform=True)]
+        assert 'aldous-broder' in uniform
+        assert 'binary' not in uniform
+
+        vectorized = GeneratorRegistry.find(vectorized=True)
+        assert {'binary', 'sidewinder'} <= {spec.name for spec in vectorized}
+        speeds = [spec.speed for spec in GeneratorRegistry.find()]
+        assert speeds == sorted(speeds)
+
+    @pytest.mark.parametrize("name", ['binary', 'sidewinder', 'aldous-broder'])
+    def test_generate(self, name, is_perfect_links):
+        """generate() returns the carved grid for every generator."""
+        grid = GeneratorRegistry.generate(name, Grid(5, 6), seed=12)
+        assert isinstance(grid, Grid)
+        assert is_perfect_links(grid.to_links())
+
+    def test_duplicate_registration(self):
+        """Registering an existing name or alias raises a ValueError."""
+        spec = GeneratorSpec(name='binary_tree', entry_point='x:y', label='Dup', summary=())
+        with pytest.raises(ValueError):
+            GeneratorRegistry.register(spec)
+
+    def test_imports_are_lazy(self):
+        """Importing the registry does not import any algorithm module."""
+        code = ("import sys; import algorithms.registry; "
+                "print(any(m.startswith('algorithms.') and m != 'algorithms.registry' for m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        assert result.stdout.strip() == "False"
@@ -1,6 +1,7 @@
 import sys
 import os
 import pytest
+import numpy as np
 from unittest.mock import patch
 
 # Add parent directory to path to import modules
@@ -134,4 +135,26 @@ class TestSidewinderMaze:
         explanation = SidewinderMaze.explain()
         assert isinstance(explanation, str)
         assert len(explanation) > 0
-        assert "SIDEWINDER ALGORITHM" in explanation
\ No newline at end of file
+        assert "SIDEWINDER ALGORITHM" in explanation
+
+
+class TestSidewinderRegion:
+    def test_windows_match_full_world(self, is_perfect_links):
+        """Every window of a small world matches the same cells of the whole maze."""
+        rows, cols = 6, 30
+        close, picks = SidewinderMaze.coordinate_draws(3, np.arange(rows)[:, None], np.arange(cols)[None, :])
+        full = SidewinderMaze.link_array(close, picks)
+        assert is_perfect_links(full)
+
+        for row_start, col_start, height, width in [(0, 0, rows, cols), (1, 4, 3, 5),
+                                                    (5, 29, 1, 1), (2, 0, 4, 12), (0, 20, 2, 10)]:
+            window = SidewinderMaze.region(3, row_start, col_start, height, width,
+                                           world_rows=rows, world_cols=cols)
+            assert np.array_equal(window, full[row_start:row_start + height, col_start:col_start + width])
+
+    def test_windows_agree(self):
+        """Overlapping windows far inside the world agree cell for cell."""
+        start = 2 ** 31
+        big = SidewinderMaze.region(4, start, start, 16, 40)
+        small = SidewinderMaze.region(4, start + 3, start + 10, 5, 6)
+        assert np.array_equal(small, big[3:8, 10:16])
@@ -0,0 +1,103 @@
+import sys
+import os
+import random
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathfinding.bfs import BreadthFirstSearch, flat_links, link_steps
+from pathfinding.dijkstra import Dijkstra
+from pathfinding.solvers import DEFAULT_SOLVER, SolverRegistry, place_endpoints
+from visualization.text_renderer import TextRenderer
+from algorithms.registry import GeneratorRegistry
+from grid import Grid
+
+
+def is_walk(links, cols, path):
+    """Check that consecutive path cells are linked."""
+    steps = link_steps(cols)
+    return all(b - a in steps[links[a]] for a, b in zip(path, path[1:]))
+
+
+class TestBidirectionalSearch:
+    @pytest.mark.parametrize("algorithm", ['growing-tree', 'cave'])
+    def test_matches_breadth_first_search(self, algorithm):
+        """Both searches find paths of the same, shortest length."""
+        grid = GeneratorRegistry.generate(algorithm, Grid(25, 25), seed=11)
+        links = flat_links(grid)
+        pairs = random.Random(5).sample(range(625), 40)
+        for start, end in zip(pairs[::2], pairs[1::2]):
+            one_sided = BreadthFirstSearch.search(links, 25, start, end)
+            two_sided = BreadthFirstSearch.bidirectional(links, 25, start, end)
+            assert two_sided.distance == one_sided.distance
+            if two_sided.found:
+                assert two_sided.path[0] == start and two_sided.path[-1] == end
+                assert is_walk(links, 25, two_sided.path)
+
+    def test_expands_fewer_cells_on_corner_query(self):
+        """The entrance-to-exit query explores less from both ends."""
+        grid = GeneratorRegistry.generate('cave', Grid(60, 60), seed=2)
+        links = flat_links(grid)
+        start, end = 59 * 60, 59
+        one_sided = BreadthFirstSearch.search(links, 60, start, end)
+        two_sided = BreadthFirstSearch.bidirectional(links, 60, start, end)
+        assert two_sided.distance == one_sided.distance
+        assert two_sided.expanded < one_sided.expanded
+
+    def test_trivial_and_unreachable(self, sample_3x3_grid):
+        """Same start and end gives a single cell; unreachable gives nothing."""
+        links = flat_links(sample_3x3_grid)
+        assert BreadthFirstSearch.bidirectional(links, 3, 2, 2).path == [2]
+        assert not BreadthFirstSearch.bidirectional(links, 3, 0, 4).found
+
+
+class TestSolverRegistry:
+    def test_solvers_are_registered(self):
+        """Frontends can pick the solver by name or alias."""
+        assert DEFAULT_SOLVER in SolverRegistry.list_solvers()
+        assert SolverRegistry.get('bibfs').name == 'bidirectional'
+        with pytest.raises(ValueError):
+            SolverRegistry.get('no-such-solver')
+
+    def test_shortest_path_returns_cells(self):
+        """Every solver returns the Cells of a shortest path."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(10, 10), seed=1)
+        entrance, exit = grid.at(9, 0), grid.at(0, 9)
+        lengths = {len(SolverRegistry.shortest_path(name, grid, entrance, exit))
+                   for name in SolverRegistry.list_solvers()}
+        assert len(lengths) == 1
+        path = SolverRegistry.shortest_path(None, grid, entrance, exit)
+        assert path[0] is entrance and path[-1] is exit
+
+
+class TestPlaceEndpoints:
+    def test_corners(self):
+        """The default placement is bottom left to top right."""
+        grid = Grid(4, 6)
+        assert place_endpoints(grid) == (grid.at(3, 0), grid.at(0, 5))
+
+    def test_diameter(self):
+        """The diameter placement uses the ends of the longest path."""
+        grid = GeneratorRegistry.generate('growing-tree', Grid(10, 10), seed=3)
+        entrance, exit = place_endpoints(grid, 'diameter')
+        path = SolverRegistry.shortest_path('bfs', grid, entrance, exit)
+        assert len(path) == len(Dijkstra.longest_path(grid))
+
+    def test_unknown_placement(self):
+        with pytest.raises(ValueError):
+            place_endpoints(Grid(2, 2), 'middle')
+
+    def test_renderer_marks_endpoints(self):
+        """Renderers mark the given endpoints instead of the corners."""
+        grid = Grid.from_links(Grid.full_links(3, 3))
+        output = TextRenderer(use_color=False).render_maze(grid, endpoints=(grid.at(1, 1), grid.at(2, 2)))
+        lines = output.splitlines()
+        assert 'E' in lines[3] and 'X' in lines[5]
+
+    def test_renderer_forgets_endpoints(self):
+        """Endpoints passed to one render do not carry over to the next."""
+        grid = Grid.from_links(Grid.full_links(3, 3))
+        renderer = TextRenderer(use_color=False)
+        renderer.render_maze(grid, endpoints=(grid.at(1, 1), grid.at(2, 2)))
+        lines = renderer.render_maze(grid).splitlines()
+        assert 'E' in lines[5] and 'X' in lines[1]
@@ -0,0 +1,112 @@
+import sys
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.streams import RandomStream, stream_key, uniform
+from algorithms.binary_tree import BinaryTreeMaze
+from algorithms.sidewinder import SidewinderMaze
+from algorithms.aldous_broder import AldousBroderMaze
+from grid import Grid
+
+
+def _generate(task):
+    """Generate one maze and return its links (used from worker processes)."""
+    name, seed = task
+    grid = Grid(12, 9)
+    if name == 'aldous-broder':
+        AldousBroderMaze.on(grid, seed=seed)
+    elif name == 'sidewinder':
+        SidewinderMaze.on(grid, seed=seed)
+    else:
+        BinaryTreeMaze.on(grid, seed=seed)
+    return grid.to_links()
+
+
+class TestStreams:
+    def test_stream_key_matches_seed_sequence_spawn(self):
+        """Stream ids follow the SeedSequence.spawn numbering."""
+        child = np.random.SeedSequence(99).spawn(3)[2]
+        expected = int(child.generate_state(1, dtype=np.uint64)[0])
+        assert stream_key(99, 2) == expected
+        assert stream_key(99, 0) != stream_key(99, 1)
+
+    def test_negative_seeds_are_accepted(self):
+        """Negative seeds (e.g. from hash()) map to valid streams."""
+        assert stream_key(-5) == stream_key(-5)
+
+    def test_uniform_is_random_access(self):
+        """Any range of counters gives the same values as one long draw."""
+        key = stream_key(7)
+        full = uniform(key, np.arange(100, dtype=np.uint64))
+        part = uniform(key, np.arange(40, 60, dtype=np.uint64))
+        assert np.array_equal(full[40:60], part)
+        assert ((full >= 0.0) & (full < 1.0)).all()
+
+    def test_random_stream_sequence(self):
+        """RandomStream hands out the stream values in order across blocks."""
+        stream = RandomStream(3)
+        stream.BLOCK_SIZE = 16
+        values = [stream.random() for _ in range(40)]
+        assert stream.position == 40
+        assert np.allclose(values, uniform(stream.key, np.arange(40, dtype=np.uint64)))
+
+        resumed = RandomStream(key=stream.key, position=stream.position)
+        assert resumed.random() == stream.random()
+
+    def test_unseeded_stream_follows_global_random(self):
+        """Without a seed the stream is drawn from the global random module."""
+        random.seed(11)
+        first = RandomStream().random()
+        random.seed(11)
+        assert RandomStream().random() == first
+
+
+class TestDeterministicGeneration:
+    @pytest.mark.parametrize("maze_class", [BinaryTreeMaze, SidewinderMaze])
+    def test_row_bands_match_serial(self, maze_class):
+        """Rows computed in threaded bands stack up to the serial draws."""
+        serial = maze_class.draws(5, 20, 8)
+        bands = [(start, start + 5) for start in range(0, 20, 5)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parts = list(pool.map(lambda band: maze_class.draws(5, 20, 8, *band), bands))
+
+        if maze_class is SidewinderMaze:
+            assert np.array_equal(np.concatenate([p[0] for p in parts]), serial[0])
+            assert np.array_equal(np.concatenate([p[1] for p in parts]), serial[1])
+        else:
+            assert np.array_equal(np.concatenate(parts), serial)
+
+    @pytest.mark.parametrize("name", ["binary", "sidewinder", "aldous-broder"])
+    def test_serial_threaded_and_process_output_match(self, name, is_perfect_links):
+        """The same seed gives bit-identical mazes in any execution context."""
+        tasks = [(name, seed) for seed in (1, 2, 3)]
+        serial = [_generate(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            threaded = list(pool.map(_generate, tasks))
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            processes = list(pool.map(_generate, tasks))
+
+        for a, b, c in zip(serial, threaded, processes):
+            assert np.array_equal(a, b)
+            assert np.array_equal(a, c)
+            assert is_perfect_links(a)
+        assert not np.array_equal(serial[0], serial[1])
+
+    def test_seeded_generation_ignores_global_state(self):
+        """Seeded generation does not read or disturb the global random module."""
+        random.seed(1)
+        first = _generate(('aldous-broder', 8))
+        after = random.random()
+        random.seed(1)
+        random.random()
+        second = _generate(('aldous-broder', 8))
+
+        assert np.array_equal(first, second)
+        random.seed(1)
+        assert random.random() == after
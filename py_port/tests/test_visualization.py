@@ -6,6 +6,7 @@ This module contains tests for the visualization layer, including renderers and
 
 import sys
 import os
+import time
 import unittest
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for testing
@@ -23,7 +24,7 @@ from visualization.themes import ThemeManager, MazeTheme
 
 
 try:
-    from visualization.asciimatics_renderer import AsciimaticsRenderer
+    from visualization.asciimatics_renderer import MAX_SHIFTS_PER_FRAME, AsciimaticsRenderer
     HAS_ASCIIMATICS = True
 except ImportError:
     HAS_ASCIIMATICS = False
@@ -226,6 +227,28 @@ if HAS_ASCIIMATICS:
             self.assertNotEqual(retro_colors["wall"], wizardry_colors["wall"])
             self.assertNotEqual(wizardry_colors["wall"], default_colors["wall"])
 
+        def test_shift_interval_must_be_positive(self):
+            """A zero or negative shift interval is rejected."""
+            for interval in (0, -0.5):
+                with self.assertRaises(ValueError):
+                    self.renderer.render_maze(self.grid, interactive=False, shift_interval=interval)
+
+        def test_slow_frame_caps_catch_up_shifts(self):
+            """A frame that is far behind applies a bounded number of shifts and skips the rest."""
+            class CountingShifter:
+                steps = 0
+
+                def step(self):
+                    self.steps += 1
+                    return []
+
+            self.renderer.shifter = CountingShifter()
+            self.renderer.shift_interval = 0.01
+            self.renderer._next_shift = time.time() - 100
+            self.renderer._shift(None, self.grid, None)
+            self.assertEqual(self.renderer.shifter.steps, MAX_SHIFTS_PER_FRAME)
+            self.assertGreater(self.renderer._next_shift, time.time())
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
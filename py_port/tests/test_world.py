@@ -0,0 +1,84 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algorithms.world import MazeWorld, zigzag
+from cell import Cell
+
+
+def links_agree(links):
+    """Check that every link in an array is recorded on both of its cells."""
+    east = (links[:, :-1] & Cell.EAST) != 0
+    west = (links[:, 1:] & Cell.WEST) != 0
+    south = (links[:-1] & Cell.SOUTH) != 0
+    north = (links[1:] & Cell.NORTH) != 0
+    return np.array_equal(east, west) and np.array_equal(south, north)
+
+
+def reachable(links, start):
+    """Count the cells of a link array reachable from start without leaving it."""
+    rows, cols = links.shape
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        r, c = frontier.pop()
+        for direction, (dr, dc) in ((Cell.NORTH, (-1, 0)), (Cell.SOUTH, (1, 0)),
+                                    (Cell.EAST, (0, 1)), (Cell.WEST, (0, -1))):
+            nr, nc = r + dr, c + dc
+            if links[r, c] & direction and 0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in seen:
+                seen.add((nr, nc))
+                frontier.append((nr, nc))
+    return len(seen)
+
+
+class TestMazeWorld:
+    def test_zigzag(self):
+        """Integers map one-to-one onto non-negative integers."""
+        assert [zigzag(value) for value in (0, -1, 1, -2, 2)] == [0, 1, 2, 3, 4]
+
+    def test_chunks_join_consistently(self):
+        """Links across chunk seams are recorded on both sides."""
+        world = MazeWorld(42, chunk_size=6)
+        links = world.window(-15, -20, 30, 40)
+        assert links_agree(links)
+
+    def test_world_is_connected(self):
+        """Doors join the chunks into one connected maze."""
+        world = MazeWorld(7, chunk_size=5)
+        links = world.window(-10, -10, 20, 20)
+        # Clip to the window: chunks fully inside it connect through their doors
+        assert reachable(links, (0, 0)) == 20 * 20
+
+    def test_deterministic_under_eviction(self):
+        """A tiny cache regenerates evicted chunks identically."""
+        expected = MazeWorld(3, chunk_size=4).window(-8, -8, 24, 24)
+        small = MazeWorld(3, chunk_size=4, max_chunks=2)
+        assert np.array_equal(small.window(-8, -8, 24, 24), expected)
+        assert len(small) == 2
+        assert small.links_at(-8, -8) == expected[0, 0]
+
+    def test_seed_and_algorithm_change_world(self):
+        """Different seeds and chunk generators give different worlds."""
+        base = MazeWorld(1, chunk_size=8).window(0, 0, 16, 16)
+        assert not np.array_equal(MazeWorld(2, chunk_size=8).window(0, 0, 16, 16), base)
+        assert not np.array_equal(MazeWorld(1, chunk_size=8, algorithm='binary').window(0, 0, 16, 16), base)
+
+    def test_prefetch(self):
+        """Prefetching fills the cache in the background."""
+        world = MazeWorld(5, chunk_size=4)
+        world.prefetch(0, 0, radius=1)
+        world.wait()
+        assert len(world) == 9
+        assert world.generated == 9
+
+        # Cached chunks are not generated again
+        world.window(-4, -4, 12, 12)
+        assert world.generated == 9
+        world.close()
+
+    def test_chunk_size_validated(self):
+        with pytest.raises(ValueError):
+            MazeWorld(1, chunk_size=0)
@@ -15,6 +15,9 @@ from asciimatics.event import KeyboardEvent
 from .renderer_base import MazeRendererBase
 from .themes import ThemeManager
 
+# Most origin shifts applied in one frame when the event loop falls behind
+MAX_SHIFTS_PER_FRAME = 8
+
 # ANSI color codes by index
 # 0: Black, 1: Red, 2: Green, 3: Yellow, 4: Blue, 5: Magenta, 6: Cyan, 7: White
 # Add 8 for bright/bold versions
@@ -46,6 +49,9 @@ class AsciimaticsRenderer(MazeRendererBase):
         self.path = None
         self.screen = None
         self.paused = False
+        self.shifter = None
+        self.shift_interval = 0.2
+        self._maze_origin = (0, 0)
         self.help_text = [
             "Movement: Arrow Keys",
             "Toggle Solution: 's'",
@@ -130,6 +136,7 @@ class AsciimaticsRenderer(MazeRendererBase):
         maze_width = grid.cols * 4 + 1
         start_y = max(3, (screen.height - maze_height) // 2)
         start_x = max(0, (screen.width - maze_width) // 2)
+        self._maze_origin = (start_x, start_y)
         
         # Draw top border
         for x in range(grid.cols):
@@ -291,6 +298,64 @@ class AsciimaticsRenderer(MazeRendererBase):
                     bg=colors["help_text"][2]
                 )
     
+    def _draw_walls(self, screen, grid, deltas):
+        """
+        Redraw only the walls named by a list of link changes.
+
+        Args:
+            screen: The asciimatics screen the maze was drawn on
+            grid: The maze grid (already updated)
+            deltas: Iterable of (row, col, direction, linked) changes
+        """
+        colors = self._theme_to_screen_colors()
+        start_x, start_y = self._maze_origin
+        for row, col, direction, linked in deltas:
+            # Every wall is drawn as the east or south wall of some cell
+            if direction == 1:  # 1 is NORTH
+                row, direction = row - 1, 2
+            elif direction == 8:  # 8 is WEST
+                col, direction = col - 1, 4
+
+            if direction == 4:  # 4 is EAST
+                text, x, y = (" " if linked else "|"), start_x + col * 4 + 4, start_y + row * 2 + 1
+            else:
+                text, x, y = ("   " if linked else "---"), start_x + col * 4 + 1, start_y + row * 2 + 2
+            screen.print_at(
+                text, x, y,
+                colour=colors["wall"][0],
+                attr=colors["wall"][1],
+                bg=colors["wall"][2]
+            )
+
+    def _shift(self, screen, grid, path):
+        """
+        Advance the shifting maze by the steps that are due and update the screen.
+
+        Returns:
+            The solution path, or None once the maze has changed under it
+        """
+        deltas = []
+        now = time.time()
+        for _ in range(MAX_SHIFTS_PER_FRAME):
+            if now < self._next_shift:
+                break
+            deltas.extend(self.shifter.step())
+            self._next_shift += self.shift_interval
+        else:
+            # A slow frame fell too far behind: skip the missed shifts
+            self._next_shift = max(self._next_shift, now + self.shift_interval)
+        if not deltas:
+            return path
+
+        self.apply_deltas(grid, deltas)
+        if path:
+            # The old solution may now cross walls, so drop it and redraw once
+            self.path = None
+            self._draw_maze(screen, grid, None)
+        else:
+            self._draw_walls(screen, grid, deltas)
+        return None
+
     def _process_input(self, event, grid):
         """
         Process keyboard input for interactive maze navigation.
@@ -359,9 +424,16 @@ class AsciimaticsRenderer(MazeRendererBase):
         # Save the screen for later reference
         self.screen = screen
         
-        # Event loop
+        # Event loop; the maze is drawn in full only when input changed it,
+        # and a shifting maze only redraws the walls that moved
+        dirty = True
+        self._next_shift = time.time() + self.shift_interval
         while True:
-            self._draw_maze(screen, grid, path)
+            if dirty:
+                self._draw_maze(screen, grid, path)
+                dirty = False
+            if self.shifter is not None:
+                path = self._shift(screen, grid, path)
             screen.refresh()
             
             # Get input
@@ -370,10 +442,126 @@ class AsciimaticsRenderer(MazeRendererBase):
                 # Process input
                 if not self._process_input(event, grid):
                     raise StopApplication("User quit")
+                dirty = True
             
             # Short sleep to prevent high CPU usage
             time.sleep(0.05)
     
+    @staticmethod
+    def _world_lines(links):
+        """Turn a clipped link array into the text lines of the maze's walls."""
+        lines = ['+' + '---+' * links.shape[1]]
+        for row in links.tolist():
+            lines.append('|' + ''.join('   ' + (' ' if value & 4 else '|') for value in row))  # 4 is EAST
+            lines.append('+' + ''.join(('   ' if value & 2 else '---') + '+' for value in row))  # 2 is SOUTH
+        return lines
+
+    def _draw_world(self, screen, world):
+        """
+        Draw the part of an unbounded world around the player.
+
+        Args:
+            screen: The asciimatics screen to draw on
+            world: The MazeWorld being explored
+        """
+        colors = self._theme_to_screen_colors()
+        rows = max(1, (screen.height - 6) // 2)
+        cols = max(1, (screen.width - 1) // 4)
+        row, col = self.current_position
+        top, left = row - rows // 2, col - cols // 2
+
+        links = world.window(top, left, rows, cols)
+        links[0, :] &= ~1 & 0xFF    # Clip links leaving the view (1 is NORTH)
+        links[-1, :] &= ~2 & 0xFF   # 2 is SOUTH
+        links[:, -1] &= ~4 & 0xFF   # 4 is EAST
+        links[:, 0] &= ~8 & 0xFF    # 8 is WEST
+
+        start_x, start_y = max(0, (screen.width - cols * 4 - 1) // 2), 2
+        for y, line in enumerate(self._world_lines(links)):
+            screen.print_at(
+                line, start_x, start_y + y,
+                colour=colors["wall"][0],
+                attr=colors["wall"][1],
+                bg=colors["wall"][2]
+            )
+        screen.print_at(
+            " @ ",
+            start_x + (col - left) * 4 + 1,
+            start_y + (row - top) * 2 + 1,
+            colour=colors["player"][0],
+            attr=colors["player"][1],
+            bg=colors["player"][2]
+        )
+
+        status = f"Position: {row},{col} | Chunks in memory: {len(world)} | 'q' to quit"
+        screen.print_at(
+            status.ljust(screen.width - 1),
+            0,
+            start_y + rows * 2 + 2,
+            colour=colors["help_text"][0],
+            attr=colors["help_text"][1],
+            bg=colors["help_text"][2]
+        )
+
+    def _explore_world(self, screen, world):
+        """
+        Run the world explorer: walk an unbounded maze with the arrow keys.
+
+        Chunks around the player are prefetched in the background after every
+        move, so the view rarely waits for generation, and the world's chunk
+        cache keeps memory bounded however far the player walks.
+        """
+        screen.clear()
+        self.screen = screen
+        offsets = {
+            self.KEY_UP: (1, -1, 0),     # 1 is NORTH
+            self.KEY_DOWN: (2, 1, 0),    # 2 is SOUTH
+            self.KEY_RIGHT: (4, 0, 1),   # 4 is EAST
+            self.KEY_LEFT: (8, 0, -1),   # 8 is WEST
+        }
+        radius = max(screen.width // 4, screen.height // 2) // world.chunk_size + 1
+        world.prefetch(*self.current_position, radius=radius)
+
+        dirty = True
+        while True:
+            if dirty:
+                self._draw_world(screen, world)
+                screen.refresh()
+                dirty = False
+
+            event = screen.get_event()
+            if isinstance(event, KeyboardEvent):
+                if event.key_code == self.KEY_QUIT:
+                    raise StopApplication("User quit")
+                if event.key_code in offsets:
+                    direction, row_offset, col_offset = offsets[event.key_code]
+                    row, col = self.current_position
+                    if world.links_at(row, col) & direction:
+                        self.current_position = (row + row_offset, col + col_offset)
+                        world.prefetch(*self.current_position, radius=radius)
+                        dirty = True
+
+            # Short sleep to prevent high CPU usage
+            time.sleep(0.02)
+
+    def explore_world(self, world, start=(0, 0)):
+        """
+        Explore an unbounded MazeWorld interactively.
+
+        Args:
+            world: The MazeWorld to explore
+            start: World (row, col) where the player starts
+        """
+        self.current_position = start
+        try:
+            Screen.wrapper(lambda screen: self._explore_world(screen, world))
+        except StopApplication:
+            pass
+        except ResizeScreenError:
+            self.explore_world(world, self.current_position)
+        finally:
+            world.close()
+
     def render_maze(self, grid, solution_path=None, interactive=True, **kwargs):
         """
         Render a maze using asciimatics.
@@ -385,10 +573,19 @@ class AsciimaticsRenderer(MazeRendererBase):
             **kwargs: Additional keyword arguments:
                 show_solution: Start with solution visible
                 current_position: Initial player position as (row, col)
+                shifter: Optional OriginShiftMaze engine for this grid (see
+                         OriginShiftMaze.from_grid); the maze then keeps
+                         changing while it is explored, and the solution is
+                         hidden after the first change
+                shift_interval: Seconds between origin shifts (default 0.2)
+                endpoints: Optional (entrance, exit) Cells to use instead of the corners
             
         Returns:
             If interactive is True, runs the interactive app.
             If interactive is False, returns a function that can be passed to asciimatics.
+
+        Raises:
+            ValueError: If shift_interval is not positive
         """
         # Save path for later
         self.path = solution_path
@@ -399,6 +596,16 @@ class AsciimaticsRenderer(MazeRendererBase):
         
         if 'current_position' in kwargs:
             self.current_position = kwargs['current_position']
+
+        if 'shifter' in kwargs:
+            self.shifter = kwargs['shifter']
+
+        if 'shift_interval' in kwargs:
+            if kwargs['shift_interval'] <= 0:
+                raise ValueError(f"shift_interval must be positive, not {kwargs['shift_interval']}")
+            self.shift_interval = kwargs['shift_interval']
+
+        self.endpoints = kwargs.get('endpoints')
         
         # If running interactively, start the screen and run the app
         if interactive:
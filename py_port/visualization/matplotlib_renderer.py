@@ -37,10 +37,13 @@ class MatplotlibRenderer(MazeRendererBase):
             **kwargs: Additional keyword arguments:
                 figsize: Override the figure size
                 dpi: Set the figure DPI
+                endpoints: Optional (entrance, exit) Cells to mark instead of the corners
                 
         Returns:
             A matplotlib figure containing the rendered maze
         """
+        self.endpoints = kwargs.get('endpoints')
+
         # Get figure size from kwargs or use default
         figsize = kwargs.get('figsize', self.figsize)
         
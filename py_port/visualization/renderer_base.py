@@ -7,6 +7,9 @@ should follow, allowing for consistent visualization across different output for
 
 class MazeRendererBase:
     """Base class that defines the common interface for all maze renderers."""
+
+    # Optional (entrance, exit) cells replacing the corner convention
+    endpoints = None
     
     def __init__(self, theme_name=None):
         """
@@ -38,7 +41,8 @@ class MazeRendererBase:
         """
         Get the standard entrance and exit cells for the maze.
         
-        By convention, the entrance is at the bottom left and the exit is at the top right.
+        By convention, the entrance is at the bottom left and the exit is at the top right,
+        unless the renderer was given other endpoints (the endpoints keyword of render_maze).
         
         Args:
             grid: The maze grid
@@ -46,6 +50,8 @@ class MazeRendererBase:
         Returns:
             A tuple of (entrance_cell, exit_cell)
         """
+        if self.endpoints is not None:
+            return self.endpoints
         entrance = grid.at(grid.rows - 1, 0)  # Bottom left
         exit = grid.at(0, grid.cols - 1)      # Top right
         return entrance, exit
@@ -70,6 +76,29 @@ class MazeRendererBase:
                 return True
         return False
     
+    def apply_deltas(self, grid, deltas):
+        """
+        Apply link changes (such as those reported by OriginShiftMaze.step) to a grid.
+
+        Args:
+            grid: The maze grid to update
+            deltas: Iterable of (row, col, direction, linked) changes
+
+        Returns:
+            The set of (row, col) positions whose walls changed, for renderers
+            that redraw only what is affected
+        """
+        touched = set()
+        for row, col, direction, linked in deltas:
+            if linked:
+                grid.link_cells(row, col, direction)
+            else:
+                grid.unlink_cells(row, col, direction)
+            row_offset, col_offset = grid.DIRECTION_OFFSETS[direction]
+            touched.add((row, col))
+            touched.add((row + row_offset, col + col_offset))
+        return touched
+
     def set_theme(self, theme_name):
         """
         Set the theme to use for rendering.
@@ -42,10 +42,14 @@ class TextRenderer(MazeRendererBase):
             show_distances: Whether to show distances in cells
             distances: Optional distances object for showing distance values
             step_data: Optional AlgorithmStep object for step-by-step visualization
+            **kwargs: Additional keyword arguments:
+                endpoints: Optional (entrance, exit) Cells to mark instead of the corners
             
         Returns:
             A string containing the rendered maze
         """
+        self.endpoints = kwargs.get('endpoints')
+
         # Get entrance and exit cells
         entrance, exit = self.get_entrance_exit(grid)
         
@@ -172,6 +176,47 @@ class TextRenderer(MazeRendererBase):
         
         return '\n'.join(output)
     
+    def wall_canvas(self, grid):
+        """
+        Get the maze's walls as a mutable canvas: a list of lists of characters.
+
+        The layout is the plain (uncolored) one of render_maze, so the canvas can
+        be kept between frames and updated with patch_canvas as the maze changes.
+        """
+        return [list(line) for line in grid.display().split('\n')]
+
+    def patch_canvas(self, canvas, deltas):
+        """
+        Update a wall canvas in place for a list of link changes.
+
+        Each change rewrites only the characters of one wall, so a continuously
+        changing maze costs O(changes) per frame instead of a full render.
+
+        Args:
+            canvas: A canvas from wall_canvas
+            deltas: Iterable of (row, col, direction, linked) changes
+
+        Returns:
+            The canvas
+        """
+        for row, col, direction, linked in deltas:
+            # Every wall is stored as the east or south wall of some cell
+            if direction == 1:  # 1 is NORTH
+                row, direction = row - 1, 2
+            elif direction == 8:  # 8 is WEST
+                col, direction = col - 1, 4
+
+            if direction == 4:  # 4 is EAST
+                canvas[2 * row + 1][4 * col + 4] = ' ' if linked else '|'
+            else:
+                canvas[2 * row + 2][4 * col + 1:4 * col + 4] = '   ' if linked else '---'
+        return canvas
+
+    @staticmethod
+    def canvas_text(canvas):
+        """Join a wall canvas into a string."""
+        return '\n'.join(''.join(line) for line in canvas)
+
     def render_step_info(self, step_data):
         """
         Render information about the current step.